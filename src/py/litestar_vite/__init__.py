@@ -31,9 +31,14 @@ For more advanced configuration:
 
 from litestar_vite import inertia
 from litestar_vite.config import (
+    BuildCacheConfig,
     DeployConfig,
     ExternalDevServer,
+    FrameworkProxyConfig,
     InertiaConfig,
+    InertiaPropCacheConfig,
+    InertiaSSRCacheConfig,
+    InertiaSSRCircuitBreakerConfig,
     InertiaSSRConfig,
     PathConfig,
     RuntimeConfig,
@@ -44,9 +49,14 @@ from litestar_vite.loader import ViteAssetLoader
 from litestar_vite.plugin import StaticPlacement, StaticServerConfig, StaticServerMount, VitePlugin
 
 __all__ = (
+    "BuildCacheConfig",
     "DeployConfig",
     "ExternalDevServer",
+    "FrameworkProxyConfig",
     "InertiaConfig",
+    "InertiaPropCacheConfig",
+    "InertiaSSRCacheConfig",
+    "InertiaSSRCircuitBreakerConfig",
     "InertiaSSRConfig",
     "PathConfig",
     "RuntimeConfig",
@@ -0,0 +1,244 @@
+"""Content-addressed cache for production build output.
+
+``litestar assets build`` hashes everything that feeds the frontend build and, on a hit,
+restores the stored ``bundle_dir`` instead of running Vite. BuildCacheConfig is defined in
+litestar_vite.config and passed into BuildCache.
+"""
+
+# pyright: reportUnknownVariableType=false, reportUnknownMemberType=false
+
+import hashlib
+import io
+import os
+import shutil
+import tarfile
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from litestar_vite.__metadata__ import __version__
+from litestar_vite.codegen._export import FINGERPRINT_FILENAME  # pyright: ignore[reportPrivateUsage]
+from litestar_vite.deploy import _import_fsspec  # pyright: ignore[reportPrivateUsage]
+
+if TYPE_CHECKING:
+    from litestar_vite.config import BuildCacheConfig, ViteConfig
+
+__all__ = ("BuildCache",)
+
+ARCHIVE_SUFFIX = ".tar.gz"
+
+_ROOT_INPUT_PATTERNS = (
+    "package.json",
+    "package-lock.json",
+    "npm-shrinkwrap.json",
+    "pnpm-lock.yaml",
+    "pnpm-workspace.yaml",
+    "yarn.lock",
+    "bun.lock",
+    "bun.lockb",
+    "deno.json",
+    "deno.lock",
+    ".litestar.json",
+    ".env",
+    ".env.*",
+    "tsconfig*.json",
+    "vite.config.*",
+    "astro.config.*",
+    "nuxt.config.*",
+    "svelte.config.*",
+    "postcss.config.*",
+    "tailwind.config.*",
+    "angular.json",
+)
+_SKIPPED_DIRS = frozenset({"node_modules", ".git", "__pycache__"})
+# The type export fingerprint tracks Python source mtimes, which change on every checkout.
+_SKIPPED_FILES = frozenset({FINGERPRINT_FILENAME})
+
+
+def _resolve(path: Path, root_dir: Path) -> Path:
+    return path if path.is_absolute() else root_dir / path
+
+
+class BuildCache:
+    """Store and restore build output keyed by a hash of the build inputs."""
+
+    __slots__ = ("_cache_config", "_fs", "_hot_file", "_location", "_outputs", "_root_dir", "_sources")
+
+    def __init__(self, config: "ViteConfig", cache_config: "BuildCacheConfig", root_dir: Path) -> None:
+        self._cache_config = cache_config
+        self._root_dir = root_dir
+        self._hot_file = config.hot_file
+        self._outputs: dict[str, Path] = {"bundle": _resolve(config.bundle_dir, root_dir)}
+        if config.ssr_output_dir is not None:
+            self._outputs["ssr"] = _resolve(config.ssr_output_dir, root_dir)
+
+        sources = [config.resource_dir, config.static_dir]
+        if config.types is not None and not isinstance(config.types, bool):
+            sources.append(config.types.output)
+        sources.extend(Path(path) for path in cache_config.include)
+        self._sources = [_resolve(path, root_dir) for path in sources]
+
+        self._fs: Any = None
+        if cache_config.storage_backend:
+            _, url_to_fs = _import_fsspec(cache_config.storage_backend)
+            self._fs, self._location = url_to_fs(cache_config.storage_backend, **cache_config.storage_options)
+            self._location = str(self._location).rstrip("/")
+        else:
+            self._location = str(_resolve(Path(cache_config.directory), root_dir))
+
+    def key(self, build_command: "list[str]", encodings: "tuple[str, ...] | list[str]" = ()) -> str:
+        """Hash the build inputs.
+
+        Args:
+            build_command: The command that produces the build output.
+            encodings: Precompressed encodings written after the build.
+
+        Returns:
+            Hex digest identifying the build output.
+        """
+        digest = hashlib.sha256()
+        for part in (__version__, "\0".join(build_command), ",".join(encodings)):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        prefixes = tuple(self._cache_config.env_prefixes)
+        for name in sorted(name for name in os.environ if name.startswith(prefixes)):
+            digest.update(f"{name}={os.environ[name]}\0".encode())
+        for path in self._input_files():
+            try:
+                relative = path.relative_to(self._root_dir).as_posix()
+            except ValueError:
+                relative = path.as_posix()
+            digest.update(relative.encode())
+            digest.update(b"\0")
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+        return digest.hexdigest()
+
+    def restore(self, key: str) -> bool:
+        """Extract the build output stored under ``key``, replacing the current output directories.
+
+        Args:
+            key: Cache key from :meth:`key`.
+
+        Returns:
+            True when the output was restored, False on a miss.
+        """
+        target = self._archive_path(key)
+        if self._fs is None:
+            archive = Path(target)
+            if not archive.is_file():
+                return False
+            archive.touch()
+            data = archive.read_bytes()
+        else:
+            if not self._fs.exists(target):
+                return False
+            data = self._fs.cat_file(target)
+
+        with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as tar:
+            members = tar.getmembers()
+            for name, directory in self._outputs.items():
+                prefix = f"{name}/"
+                selected = [member for member in members if member.name.startswith(prefix)]
+                for member in selected:
+                    member.name = member.name[len(prefix) :]
+                # Extract next to the output and swap it in, so files from an older build do not linger.
+                target = directory.resolve()
+                staging = target.with_name(f".{target.name}.{os.getpid()}.restore")
+                shutil.rmtree(staging, ignore_errors=True)
+                staging.mkdir(parents=True)
+                try:
+                    if hasattr(tarfile, "data_filter"):
+                        tar.extractall(staging, members=selected, filter="data")
+                    else:  # pragma: no cover - Python < 3.10.12
+                        tar.extractall(staging, members=[m for m in selected if _is_safe_member(m)])  # noqa: S202
+                    _replace_directory(target, staging)
+                finally:
+                    shutil.rmtree(staging, ignore_errors=True)
+        return True
+
+    def store(self, key: str) -> bool:
+        """Archive the build output under ``key``.
+
+        Args:
+            key: Cache key from :meth:`key`.
+
+        Returns:
+            True when an archive was written, False when there was no output to store.
+        """
+        if not any(directory.is_dir() for directory in self._outputs.values()):
+            return False
+
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+            for name, directory in self._outputs.items():
+                if directory.is_dir():
+                    for path in sorted(directory.rglob("*")):
+                        if path.is_file() and path.name != self._hot_file:
+                            tar.add(path, arcname=f"{name}/{path.relative_to(directory).as_posix()}")
+        data = buffer.getvalue()
+
+        target = self._archive_path(key)
+        if self._fs is not None:
+            self._fs.pipe_file(target, data)
+            return True
+
+        cache_dir = Path(self._location)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        Path(tmp_name).replace(target)
+        self._prune(cache_dir)
+        return True
+
+    def _archive_path(self, key: str) -> str:
+        if self._fs is None:
+            return str(Path(self._location) / f"{key}{ARCHIVE_SUFFIX}")
+        return f"{self._location}/{key}{ARCHIVE_SUFFIX}"
+
+    def _prune(self, cache_dir: Path) -> None:
+        archives = sorted(cache_dir.glob(f"*{ARCHIVE_SUFFIX}"), key=lambda path: path.stat().st_mtime, reverse=True)
+        for stale in archives[self._cache_config.max_entries :]:
+            stale.unlink(missing_ok=True)
+
+    def _input_files(self) -> list[Path]:
+        excluded = {path.resolve() for path in self._outputs.values()}
+        if self._fs is None:
+            excluded.add(Path(self._location).resolve())
+
+        files: set[Path] = set()
+        for pattern in _ROOT_INPUT_PATTERNS:
+            files.update(path for path in self._root_dir.glob(pattern) if path.is_file())
+        for source in self._sources:
+            if source.is_file():
+                files.add(source)
+            elif source.is_dir() and source.resolve() not in excluded:
+                files.update(_walk(source, excluded))
+        return sorted(files)
+
+
+def _walk(directory: Path, excluded: "set[Path]") -> Iterator[Path]:
+    for current, dirnames, filenames in os.walk(directory):
+        current_path = Path(current)
+        dirnames[:] = [
+            name for name in dirnames if name not in _SKIPPED_DIRS and (current_path / name).resolve() not in excluded
+        ]
+        for filename in filenames:
+            if filename not in _SKIPPED_FILES:
+                yield current_path / filename
+
+
+def _replace_directory(target: Path, staging: Path) -> None:
+    if target.is_dir():
+        stale = staging.with_name(f"{staging.name}.old")
+        target.rename(stale)
+        staging.rename(target)
+        shutil.rmtree(stale, ignore_errors=True)
+    else:
+        target.unlink(missing_ok=True)
+        staging.rename(target)
+
+
+def _is_safe_member(member: tarfile.TarInfo) -> bool:
+    return member.isfile() and not member.name.startswith("/") and ".." not in Path(member.name).parts
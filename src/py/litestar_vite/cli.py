@@ -2,6 +2,9 @@ import contextlib
 import os
 import subprocess
 import sys
+import tarfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any
@@ -18,17 +21,27 @@ from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 
 from litestar_vite.codegen import encode_deterministic_json, generate_routes_json, generate_routes_ts, write_if_changed
-from litestar_vite.config import DeployConfig, ExternalDevServer, LoggingConfig, TypeGenConfig, ViteConfig
+from litestar_vite.config import (
+    BuildCacheConfig,
+    DeployConfig,
+    ExternalDevServer,
+    LoggingConfig,
+    TypeGenConfig,
+    ViteConfig,
+)
 from litestar_vite.deploy import ViteDeployer, format_bytes
 from litestar_vite.doctor import ViteDoctor
-from litestar_vite.exceptions import ViteExecutionError
+from litestar_vite.exceptions import MissingDependencyError, ViteExecutionError
 from litestar_vite.plugin import VitePlugin, set_environment
 from litestar_vite.scaffolding import TemplateContext, generate_project, get_available_templates
 from litestar_vite.scaffolding.templates import get_template
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+
     from litestar import Litestar
 
+    from litestar_vite.build_cache import BuildCache
     from litestar_vite.scaffolding.templates import FrameworkTemplate
 
 
@@ -50,6 +63,23 @@ FRAMEWORK_CHOICES = [
 ]
 
 
+@contextlib.contextmanager
+def _timed(timings: dict[str, float], stage: str) -> "Generator[None, None, None]":
+    """Record the wall-clock duration of a build stage in ``timings``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = time.perf_counter() - start
+
+
+def _print_stage_timings(console: Any, timings: dict[str, float]) -> None:
+    """Print how long each build stage took."""
+    if timings:
+        report = ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in timings.items())
+        console.print(f"[dim]Stage timings: {report}[/]")
+
+
 @contextlib.contextmanager
 def _temporary_env_var(name: str, value: str) -> "Any":
     """Temporarily set an environment variable."""
@@ -216,38 +246,114 @@ def _build_deploy_config(
     return deploy_config
 
 
-def _prepare_and_build(config: ViteConfig, root_dir: Path, console: Any, app: "Litestar | None", verbose: bool) -> None:
-    """Export metadata, run typegen, and execute the configured frontend build."""
+def _prepare_and_build(
+    config: ViteConfig, root_dir: Path, console: Any, app: "Litestar | None", verbose: bool, *, use_cache: bool = True
+) -> None:
+    """Export metadata, run typegen, and execute the configured frontend build.
+
+    When ``ViteConfig.build_cache`` is enabled, a cached build for the same inputs is restored
+    instead of running the build and precompression stages.
+    """
     if config.set_environment:
         set_environment(config=config, app=app)
 
-    generated_assets = _generate_schema_and_routes(app, config, console) if app is not None else False
+    timings: dict[str, float] = {}
+    generated_assets = False
+    if app is not None:
+        with _timed(timings, "export"):
+            generated_assets = _generate_schema_and_routes(app, config, console)
 
     if not (root_dir / "node_modules").exists():
         console.print("[dim]Installing frontend dependencies (node_modules missing)...[/]")
-        config.executor.install(root_dir)
+        with _timed(timings, "install"):
+            config.executor.install(root_dir)
 
     if generated_assets and isinstance(config.types, TypeGenConfig):
-        extra_commands_ok = _run_extra_commands(config, verbose)
-        _invoke_typegen_cli(config, verbose)
+        extra_commands_ok = _run_codegen_commands(config, verbose, timings)
         if not extra_commands_ok:
+            _print_stage_timings(console, timings)
             raise SystemExit(1)
 
     os.environ.setdefault("VITE_BASE_URL", config.base_url or "/")
 
+    ext = config.runtime.external_dev_server
+    external_cmd = (
+        (ext.build_command or config.executor.build_command)
+        if isinstance(ext, ExternalDevServer) and ext.enabled
+        else None
+    )
+    build_cmd = external_cmd or config.build_command
+
+    cache_config = config.build_cache_config if use_cache else None
+    build_cache, cache_key = None, ""
+    if cache_config is not None:
+        with _timed(timings, "cache restore"):
+            build_cache, cache_key, restored = _restore_build_cache(config, cache_config, root_dir, console, build_cmd)
+        if restored:
+            _print_stage_timings(console, timings)
+            return
+
     env_manager = (
         _temporary_env_var("LITESTAR_VITE_SKIP_BUILD_TYPEGEN", "1")
         if generated_assets and isinstance(config.types, TypeGenConfig)
         else contextlib.nullcontext()
     )
-    with env_manager:
-        ext = config.runtime.external_dev_server
-        if isinstance(ext, ExternalDevServer) and ext.enabled:
-            build_cmd = ext.build_command or config.executor.build_command
+    with env_manager, _timed(timings, "build"):
+        if external_cmd is not None:
             console.print(f"[dim]Running external build: {' '.join(build_cmd)}[/]")
-            config.executor.execute(build_cmd, cwd=root_dir)
-        else:
-            config.executor.execute(config.build_command, cwd=root_dir)
+        config.executor.execute(build_cmd, cwd=root_dir)
+
+    with _timed(timings, "precompress"):
+        _precompress_bundle(config, root_dir, console)
+
+    if build_cache is not None:
+        with _timed(timings, "cache store"):
+            try:
+                build_cache.store(cache_key)
+            except (OSError, tarfile.TarError) as exc:
+                console.print(f"[yellow]Could not store build output in the cache: {exc!s}[/]")
+    _print_stage_timings(console, timings)
+
+
+def _restore_build_cache(
+    config: ViteConfig, cache_config: BuildCacheConfig, root_dir: Path, console: Any, build_cmd: "list[str]"
+) -> "tuple[BuildCache | None, str, bool]":
+    """Look up the build output for the current inputs and restore it on a hit.
+
+    Returns:
+        The cache (None when it is unavailable), the key for the current inputs, and whether
+        the output was restored.
+    """
+    from litestar_vite.build_cache import BuildCache
+
+    try:
+        build_cache = BuildCache(config, cache_config, root_dir)
+        cache_key = build_cache.key(build_cmd, config.runtime.precompressed_encodings)
+        restored = build_cache.restore(cache_key)
+    except (MissingDependencyError, OSError, tarfile.TarError) as exc:
+        console.print(f"[yellow]Build cache unavailable, building from scratch: {exc!s}[/]")
+        return None, "", False
+    if restored:
+        console.print(f"[dim]Restored build output from cache ({cache_key[:12]}), skipping the build.[/]")
+    else:
+        console.print(f"[dim]No cached build for {cache_key[:12]}, building.[/]")
+    return build_cache, cache_key, restored
+
+
+def _precompress_bundle(config: ViteConfig, root_dir: Path, console: Any) -> None:
+    """Write precompressed variants of the build output for the static router."""
+    from litestar_vite.plugin._static_files import available_encoders, precompress_assets
+
+    encodings = config.runtime.precompressed_encodings
+    if not encodings:
+        return
+    missing = [encoding for encoding in encodings if encoding not in available_encoders(encodings)]
+    if missing:
+        console.print(f"[dim]Skipping {', '.join(missing)} precompression (compressor not installed).[/]")
+    bundle_dir = config.bundle_dir if config.bundle_dir.is_absolute() else root_dir / config.bundle_dir
+    written = precompress_assets(bundle_dir, encodings)
+    if written:
+        console.print(f"[dim]Precompressed {len(written)} asset variant(s).[/]")
 
 
 def _run_vite_build(
@@ -787,7 +893,10 @@ def vite_update(app: "Litestar", latest: "bool", verbose: "bool", quiet: "bool")
 @vite_group.command(name="build", help="Building frontend assets with Vite.")
 @option("--verbose", type=bool, help="Enable verbose output.", default=False, is_flag=True)
 @option("--quiet", type=bool, help="Suppress non-essential output.", default=False, is_flag=True)
-def vite_build(app: "Litestar", verbose: "bool", quiet: "bool") -> None:
+@option(
+    "--no-cache", type=bool, help="Build even when ViteConfig.build_cache has a match.", default=False, is_flag=True
+)
+def vite_build(app: "Litestar", verbose: "bool", quiet: "bool", no_cache: "bool" = False) -> None:
     """Run vite build.
 
     Raises:
@@ -804,7 +913,7 @@ def vite_build(app: "Litestar", verbose: "bool", quiet: "bool") -> None:
         console.rule("Starting [blue]Vite[/] build process", align="left")
     try:
         root_dir = plugin.config.root_dir or Path.cwd()
-        _prepare_and_build(plugin.config, Path(root_dir), console, app, verbose)
+        _prepare_and_build(plugin.config, Path(root_dir), console, app, verbose, use_cache=not no_cache)
         console.print("[bold green]✓ Assets built[/]")
     except ViteExecutionError as e:
         console.print(f"[red]Vite build failed: {e!s}[/]")
@@ -1236,6 +1345,47 @@ def _run_extra_commands(config: ViteConfig, verbose: bool) -> bool:
     return all_ok
 
 
+def _run_codegen_commands(config: ViteConfig, verbose: bool, timings: dict[str, float]) -> bool:
+    """Run the ``extra_commands`` and the typegen CLI after the metadata export.
+
+    Both only read the exported files. With ``TypeGenConfig.parallel_commands`` the
+    extra commands (still one after another, in order) run on a worker thread while
+    the typegen CLI runs; otherwise the extra commands finish first.
+
+    Args:
+        config: The ViteConfig instance (with .types resolved).
+        verbose: Whether to show verbose output.
+        timings: Stage durations, updated with the ``extra commands`` and ``typegen`` stages.
+
+    Returns:
+        True if all extra commands succeeded, False if any failed.
+    """
+    types_config = config.types
+    has_extra_commands = isinstance(types_config, TypeGenConfig) and bool(types_config.extra_commands)
+    parallel = has_extra_commands and isinstance(types_config, TypeGenConfig) and types_config.parallel_commands
+
+    def run_extra_commands() -> bool:
+        with _timed(timings, "extra commands") if has_extra_commands else contextlib.nullcontext():
+            return _run_extra_commands(config, verbose)
+
+    def invoke_typegen() -> None:
+        with _timed(timings, "typegen"):
+            _invoke_typegen_cli(config, verbose)
+
+    if not parallel:
+        extra_commands_ok = run_extra_commands()
+        invoke_typegen()
+        return extra_commands_ok
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="litestar-vite-codegen") as pool:
+        extra_commands = pool.submit(run_extra_commands)
+        try:
+            invoke_typegen()
+        finally:
+            extra_commands_ok = extra_commands.result()
+    return extra_commands_ok
+
+
 def _invoke_typegen_cli(config: ViteConfig, verbose: bool) -> None:
     """Invoke the unified TypeScript type generation CLI.
 
@@ -1321,20 +1471,20 @@ def generate_types(app: "Litestar", verbose: "bool") -> None:
         console.print(f"[dim]✓ {config_display} (unchanged)[/]")
 
     # Export all integration assets using the shared function
+    timings: dict[str, float] = {}
     try:
-        exported = _export_and_report(app, config, console)
+        with _timed(timings, "export"):
+            exported = _export_and_report(app, config, console)
     except (OSError, TypeError, ValueError) as exc:
         console.print(f"[red]✗ Failed to export type metadata: {exc}[/]")
         raise SystemExit(1) from exc
     if not exported:
         raise SystemExit(1)
 
-    # Run any extra code-generation commands (e.g., tsr generate for TanStack Router)
-    extra_commands_ok = _run_extra_commands(config, verbose)
-
-    # Invoke the unified TypeScript type generation CLI
-    # This handles both @hey-api/openapi-ts and page-props.ts generation
-    _invoke_typegen_cli(config, verbose)
+    # Run any extra code-generation commands (e.g., tsr generate for TanStack Router) and
+    # the unified TypeScript CLI, which handles @hey-api/openapi-ts and page-props.ts
+    extra_commands_ok = _run_codegen_commands(config, verbose, timings)
+    _print_stage_timings(console, timings)
     if not extra_commands_ok:
         raise SystemExit(1)
 
@@ -2,7 +2,7 @@
 
 This package provides code generation utilities for:
 
-- Unified asset export (``export_integration_assets``)
+- Unified asset export (``export_integration_assets``, ``BackgroundExport``)
 - Route metadata export (``routes.json`` + Ziggy-compatible TS)
 - Inertia page props metadata export
 
@@ -10,7 +10,12 @@ Internal implementation details (OpenAPI integration, TypeScript conversion)
 are kept in private submodules to keep the public API clean.
 """
 
-from litestar_vite.codegen._export import ExportResult, export_integration_assets, typegen_outputs_requested
+from litestar_vite.codegen._export import (
+    BackgroundExport,
+    ExportResult,
+    export_integration_assets,
+    typegen_outputs_requested,
+)
 from litestar_vite.codegen._inertia import InertiaPageMetadata, extract_inertia_pages, generate_inertia_pages_json
 from litestar_vite.codegen._routes import (
     RouteMetadata,
@@ -21,6 +26,7 @@ from litestar_vite.codegen._routes import (
 from litestar_vite.codegen._utils import encode_deterministic_json, strip_timestamp_for_comparison, write_if_changed
 
 __all__ = (
+    "BackgroundExport",
     "ExportResult",
     "InertiaPageMetadata",
     "RouteMetadata",
@@ -7,8 +7,17 @@ This module provides a single entry point for exporting all integration artifact
 - inertia-pages.json (Inertia page props metadata)
 
 Both CLI and Plugin should call this function to guarantee byte-identical output.
+
+Every export records a fingerprint of its inputs next to the outputs, so application
+startup can skip the export entirely while the route table and sources are unchanged.
 """
 
+import hashlib
+import inspect
+import os
+import re
+import sys
+import threading
 from dataclasses import dataclass, field
 from functools import partial
 from importlib.metadata import PackageNotFoundError, version
@@ -22,6 +31,12 @@ if TYPE_CHECKING:
 
     from litestar_vite.config import TypeGenConfig, ViteConfig
 
+FINGERPRINT_FILENAME = ".litestar-types.fingerprint"
+"""File in ``TypeGenConfig.output`` holding the fingerprint of the last export."""
+
+_MEMORY_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+_THIRD_PARTY_DIRS = frozenset({"site-packages", "dist-packages", "node_modules"})
+
 
 @dataclass
 class ExportResult:
@@ -36,6 +51,9 @@ class ExportResult:
     openapi_schema: "dict[str, Any] | None" = None
     """The OpenAPI schema dict (for downstream use)."""
 
+    skipped: bool = False
+    """Whether the export was skipped because its fingerprint matched the last export."""
+
 
 def fmt_path(path: Path) -> str:
     """Format path for display, using relative path when possible.
@@ -60,8 +78,109 @@ def typegen_outputs_requested(types_config: "TypeGenConfig") -> bool:
     ))
 
 
+def _stable_repr(value: Any) -> str:
+    """Return ``repr(value)`` without memory addresses, so it is equal across processes."""
+    return _MEMORY_ADDRESS.sub("", repr(value))
+
+
+def _package_version(name: str) -> str:
+    """Return the installed version of ``name``, or ``"unknown"``."""
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _project_source_stats(root_dir: Path) -> list[str]:
+    """Return the modification time and size of every imported module under ``root_dir``.
+
+    Catches changes to models and other types the handler signatures only name.
+    Installed packages are covered by their version instead.
+
+    Returns:
+        One ``path:mtime:size`` entry per project module, sorted by path.
+    """
+    root = str(root_dir.resolve()).rstrip(os.sep) + os.sep
+    stats: list[str] = []
+    for module in list(sys.modules.values()):
+        filename = getattr(module, "__file__", None)
+        if not isinstance(filename, str) or not filename.startswith(root):
+            continue
+        path = Path(filename)
+        if _THIRD_PARTY_DIRS.intersection(path.parts):
+            continue
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        stats.append(f"{filename}:{stat.st_mtime_ns}:{stat.st_size}")
+    return sorted(stats)
+
+
+def _expected_outputs(config: "ViteConfig", types_config: "TypeGenConfig") -> "list[Path]":
+    """Return the files a full export writes for ``config``."""
+    from litestar_vite.config import InertiaConfig
+
+    outputs = [
+        types_config.openapi_path or types_config.output / "openapi.json",
+        types_config.routes_path or types_config.output / "routes.json",
+    ]
+    if types_config.generate_routes:
+        outputs.append(types_config.routes_ts_path or types_config.output / "routes.ts")
+    if isinstance(config.inertia, InertiaConfig) and types_config.generate_page_props and types_config.page_props_path:
+        outputs.append(types_config.page_props_path)
+    return outputs
+
+
+def compute_export_fingerprint(app: "Litestar", config: "ViteConfig") -> str:
+    """Hash everything the exported artifacts are generated from.
+
+    Covers the HTTP route table (paths, methods, handler names, ``opt`` and signatures),
+    the type generation, Inertia and OpenAPI settings, the Litestar and litestar-vite
+    versions, and the modification time of every imported module under the project root.
+    Computing it costs a walk over the routes and a ``stat`` per project module, far less
+    than building the OpenAPI schema.
+
+    Args:
+        app: The Litestar application instance.
+        config: The ViteConfig instance.
+
+    Returns:
+        A hex SHA-256 digest.
+    """
+    from litestar_vite.codegen._routes import iter_route_handlers
+
+    digest = hashlib.sha256()
+    parts = [
+        _package_version("litestar"),
+        _package_version("litestar-vite"),
+        _stable_repr(config.types),
+        _stable_repr(config.inertia),
+        _stable_repr(app.openapi_config),
+    ]
+    for route, handler in iter_route_handlers(app):
+        fn = handler.fn
+        try:
+            signature = str(inspect.signature(fn))
+        except (TypeError, ValueError):
+            signature = ""
+        parts.append(
+            f"{route.path}|{sorted(handler.http_methods)}|{handler.name}|{handler.handler_name}|"
+            f"{getattr(fn, '__module__', '')}.{getattr(fn, '__qualname__', '')}{signature}|{_stable_repr(handler.opt)}"
+        )
+    parts.extend(_project_source_stats(config.root_dir))
+    for part in parts:
+        digest.update(part.encode("utf-8", "surrogateescape"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
 def export_integration_assets(
-    app: "Litestar", config: "ViteConfig", *, serializer: "Callable[[Any], bytes] | None" = None
+    app: "Litestar",
+    config: "ViteConfig",
+    *,
+    serializer: "Callable[[Any], bytes] | None" = None,
+    skip_if_unchanged: bool = False,
 ) -> ExportResult:
     """Export all integration artifacts with deterministic output.
 
@@ -75,10 +194,15 @@ def export_integration_assets(
     4. Export routes.ts (if enabled)
     5. Export inertia-pages.json (if enabled)
 
+    Afterwards the fingerprint of the inputs (see :func:`compute_export_fingerprint`) is
+    stored as :data:`FINGERPRINT_FILENAME` in ``TypeGenConfig.output``.
+
     Args:
         app: The Litestar application instance.
         config: The ViteConfig instance.
         serializer: Optional custom serializer for OpenAPI schema encoding.
+        skip_if_unchanged: Return without exporting when the stored fingerprint matches
+            and every output exists. Used on application startup.
 
     Returns:
         ExportResult with lists of exported and unchanged files.
@@ -88,6 +212,7 @@ def export_integration_assets(
 
     from litestar_vite.codegen._inertia import generate_inertia_pages_json
     from litestar_vite.codegen._routes import extract_route_metadata
+    from litestar_vite.codegen._utils import write_if_changed
     from litestar_vite.config import InertiaConfig, InertiaTypeGenConfig, TypeGenConfig
 
     result = ExportResult()
@@ -106,6 +231,14 @@ def export_integration_assets(
     if not has_openapi:
         return result
 
+    fingerprint = compute_export_fingerprint(app, config)
+    fingerprint_path = types_config.output / FINGERPRINT_FILENAME
+    if skip_if_unchanged and _fingerprint_matches(
+        fingerprint_path, fingerprint, _expected_outputs(config, types_config)
+    ):
+        result.skipped = True
+        return result
+
     # Get serializer for OpenAPI encoding
     if serializer is None:
         encoders: Any
@@ -163,9 +296,102 @@ def export_integration_assets(
     ):
         export_inertia_pages(pages_data=inertia_pages_data, types_config=types_config, result=result)
 
+    write_if_changed(fingerprint_path, fingerprint)
     return result
 
 
+def _fingerprint_matches(fingerprint_path: Path, fingerprint: str, outputs: "list[Path]") -> bool:
+    """Return whether the last export had ``fingerprint`` and all its outputs still exist."""
+    try:
+        stored = fingerprint_path.read_text(encoding="utf-8").strip()
+    except OSError:
+        return False
+    return stored == fingerprint and all(path.is_file() for path in outputs)
+
+
+class BackgroundExport:
+    """Run :func:`export_integration_assets` on a worker thread, debounced.
+
+    :meth:`schedule` (re)starts a ``delay`` second timer; the export runs once the
+    requests stop. Exports never overlap: a request made while one runs is exported
+    after it finishes. Each run skips unchanged inputs and writes the fingerprint file
+    last, so it marks the outputs as complete.
+    """
+
+    __slots__ = ("_app", "_config", "_delay", "_idle", "_lock", "_on_error", "_running", "_timer")
+
+    def __init__(
+        self,
+        app: "Litestar",
+        config: "ViteConfig",
+        *,
+        delay: float = 0.5,
+        on_error: "Callable[[Exception], None] | None" = None,
+    ) -> None:
+        """Initialize the background export.
+
+        Args:
+            app: The Litestar application instance.
+            config: The ViteConfig instance.
+            delay: Seconds to wait after the last :meth:`schedule` call.
+            on_error: Called with the exception when an export fails.
+        """
+        self._app = app
+        self._config = config
+        self._delay = delay
+        self._on_error = on_error
+        self._lock = threading.Lock()
+        self._running = threading.Lock()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._timer: threading.Timer | None = None
+
+    def schedule(self) -> None:
+        """Request an export, restarting the debounce timer."""
+        timer = threading.Timer(self._delay, self._run)
+        timer.daemon = True
+        timer.name = "litestar-vite-type-export"
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._idle.clear()
+            self._timer = timer
+        timer.start()
+
+    def wait(self, timeout: "float | None" = None) -> bool:
+        """Block until no export is pending or running.
+
+        Returns:
+            False if ``timeout`` expired first.
+        """
+        return self._idle.wait(timeout)
+
+    def close(self) -> None:
+        """Drop a pending export and wait for a running one to finish writing."""
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        with self._running:
+            self._idle.set()
+
+    def _run(self) -> None:
+        current = threading.current_thread()
+        with self._running:
+            with self._lock:
+                if self._timer is not current:
+                    return
+            try:
+                export_integration_assets(self._app, self._config, skip_if_unchanged=True)
+            except Exception as exc:  # noqa: BLE001
+                if self._on_error is not None:
+                    self._on_error(exc)
+        with self._lock:
+            if self._timer is current:
+                self._timer = None
+                self._idle.set()
+
+
 def export_openapi(
     *,
     schema_dict: "dict[str, Any]",
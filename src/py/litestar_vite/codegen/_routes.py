@@ -14,6 +14,7 @@ from litestar._openapi.parameters import (  # pyright: ignore[reportPrivateUsage
 from litestar.handlers import HTTPRouteHandler
 from litestar.routes import HTTPRoute
 
+from litestar_vite.codegen._openapi import openapi_components_schemas
 from litestar_vite.codegen._refs import extract_schema_ref_name, resolve_component_schema_name
 from litestar_vite.codegen._ts import normalize_path, ts_type_from_openapi
 
@@ -217,41 +218,45 @@ def extract_params_from_litestar(
     return path_params, query_params
 
 
-def _update_params_from_openapi(
-    params: dict[str, str],
-    query_params: dict[str, str],
-    openapi_schema: dict[str, Any],
-    path: str,
-    methods: list[str],
-    components_schemas: dict[str, Any] | None = None,
-) -> None:
+def _openapi_operation(openapi_schema: dict[str, Any], path: str, methods: list[str]) -> dict[str, Any] | None:
+    """Return the OpenAPI operation for the first of ``methods`` documented at ``path``."""
     path_item = openapi_schema.get("paths", {}).get(path)
     if not path_item:
-        return
+        return None
     for method in methods:
-        m = method.lower()
-        if m in path_item:
-            op = path_item[m]
-            if "parameters" in op:
-                params.clear()
-                query_params.clear()
-                for param in op["parameters"]:
-                    schema_dict = param.get("schema", {})
-                    ts_type = (
-                        _route_param_type_from_schema(schema_dict, components_schemas)
-                        if param.get("in") == "path"
-                        else ts_type_from_openapi(schema_dict, components_schemas=components_schemas)
-                    )
-                    ts_type = ts_type.replace(" | null", "").replace("null | ", "")
-
-                    if not param.get("required") and ts_type != "any" and "undefined" not in ts_type:
-                        ts_type = f"{ts_type} | undefined"
-
-                    if param.get("in") == "path":
-                        params[param["name"]] = ts_type.replace(" | undefined", "")
-                    elif param.get("in") == "query":
-                        query_params[param["name"]] = ts_type
-            break
+        operation = path_item.get(method.lower())
+        if operation is not None:
+            return cast("dict[str, Any]", operation)
+    return None
+
+
+def _params_from_openapi(
+    parameters: list[dict[str, Any]], components_schemas: dict[str, Any] | None = None
+) -> tuple[dict[str, str], dict[str, str]]:
+    """Map the ``parameters`` of an OpenAPI operation to path and query parameter types.
+
+    Returns:
+        A tuple of (path_params, query_params) maps.
+    """
+    params: dict[str, str] = {}
+    query_params: dict[str, str] = {}
+    for param in parameters:
+        schema_dict = param.get("schema", {})
+        ts_type = (
+            _route_param_type_from_schema(schema_dict, components_schemas)
+            if param.get("in") == "path"
+            else ts_type_from_openapi(schema_dict, components_schemas=components_schemas)
+        )
+        ts_type = ts_type.replace(" | null", "").replace("null | ", "")
+
+        if not param.get("required") and ts_type != "any" and "undefined" not in ts_type:
+            ts_type = f"{ts_type} | undefined"
+
+        if param.get("in") == "path":
+            params[param["name"]] = ts_type.replace(" | undefined", "")
+        elif param.get("in") == "query":
+            query_params[param["name"]] = ts_type
+    return params, query_params
 
 
 def make_unique_name(base_name: str, used_names: set[str], path: str, methods: list[str]) -> str:
@@ -303,14 +308,7 @@ def extract_route_metadata(
         with contextlib.suppress(Exception):
             openapi_schema = app.openapi_schema.to_schema()
 
-    components_schemas: dict[str, Any] = {}
-    if isinstance(openapi_schema, dict):
-        components = openapi_schema.get("components")
-        if isinstance(components, dict):
-            components_t = cast("dict[str, Any]", components)
-            schemas = components_t.get("schemas")
-            if isinstance(schemas, dict):
-                components_schemas = cast("dict[str, Any]", schemas)
+    components_schemas = openapi_components_schemas(openapi_schema)
 
     openapi_context: OpenAPIContext | None = None
     if app.openapi_config is not None:
@@ -346,19 +344,19 @@ def extract_route_metadata(
         if exclude and any(pattern in route_name or pattern in full_path for pattern in exclude):
             continue
 
-        params, query_params = extract_params_from_litestar(
-            route_handler, http_route, openapi_context, components_schemas=components_schemas
-        )
-
-        if not params:
-            params = extract_path_params(full_path)
-
         normalized_path = normalize_path(full_path)
 
-        if openapi_schema:
-            _update_params_from_openapi(
-                params, query_params, openapi_schema, normalized_path, methods, components_schemas=components_schemas
+        # The schema already holds the parameters Litestar generated for this handler;
+        # only handlers missing from it need their parameters generated again.
+        operation = _openapi_operation(openapi_schema, normalized_path, methods) if openapi_schema else None
+        if operation is not None and "parameters" in operation:
+            params, query_params = _params_from_openapi(operation["parameters"], components_schemas)
+        else:
+            params, query_params = extract_params_from_litestar(
+                route_handler, http_route, openapi_context, components_schemas=components_schemas
             )
+            if not params:
+                params = extract_path_params(full_path)
 
         opt: dict[str, Any] = route_handler.opt or {}
         component = opt.get("component")
@@ -28,14 +28,21 @@ from litestar_vite.config._constants import (  # pyright: ignore[reportPrivateUs
     JINJA_INSTALLED,
     TRUE_VALUES,
 )
-from litestar_vite.config._deploy import DeployConfig  # pyright: ignore[reportPrivateUsage]
+from litestar_vite.config._deploy import BuildCacheConfig, DeployConfig  # pyright: ignore[reportPrivateUsage]
 from litestar_vite.config._inertia import (  # pyright: ignore[reportPrivateUsage]
     InertiaConfig,
+    InertiaPropCacheConfig,
+    InertiaSSRCacheConfig,
+    InertiaSSRCircuitBreakerConfig,
     InertiaSSRConfig,
     InertiaTypeGenConfig,
 )
 from litestar_vite.config._paths import PathConfig  # pyright: ignore[reportPrivateUsage]
-from litestar_vite.config._runtime import ExternalDevServer, RuntimeConfig  # pyright: ignore[reportPrivateUsage]
+from litestar_vite.config._runtime import (  # pyright: ignore[reportPrivateUsage]
+    ExternalDevServer,
+    FrameworkProxyConfig,
+    RuntimeConfig,
+)
 from litestar_vite.config._spa import LoggingConfig, SPAConfig  # pyright: ignore[reportPrivateUsage]
 from litestar_vite.config._types import TypeGenConfig  # pyright: ignore[reportPrivateUsage]
 from litestar_vite.config._vite import PaginationContainer, ViteConfig  # pyright: ignore[reportPrivateUsage]
@@ -44,9 +51,14 @@ __all__ = (
     "FSSPEC_INSTALLED",
     "JINJA_INSTALLED",
     "TRUE_VALUES",
+    "BuildCacheConfig",
     "DeployConfig",
     "ExternalDevServer",
+    "FrameworkProxyConfig",
     "InertiaConfig",
+    "InertiaPropCacheConfig",
+    "InertiaSSRCacheConfig",
+    "InertiaSSRCircuitBreakerConfig",
     "InertiaSSRConfig",
     "InertiaTypeGenConfig",
     "LoggingConfig",
@@ -1,12 +1,13 @@
-"""CDN deployment configuration."""
+"""CDN deployment and build cache configuration."""
 
 import os
 from dataclasses import dataclass, field, replace
+from pathlib import Path
 from typing import Any
 
 from litestar_vite.config._constants import TRUE_VALUES, default_content_types, default_storage_options
 
-__all__ = ("DeployConfig",)
+__all__ = ("BuildCacheConfig", "DeployConfig")
 
 
 @dataclass
@@ -68,3 +69,45 @@ class DeployConfig:
             asset_url=asset_url or self.asset_url,
             delete_orphaned=self.delete_orphaned if delete_orphaned is None else delete_orphaned,
         )
+
+
+@dataclass
+class BuildCacheConfig:
+    """Content-addressed cache for ``litestar assets build`` output.
+
+    The build inputs (resource and static directories, package and lock files, bundler
+    configs, ``.env`` files, generated types, the build command and matching environment
+    variables) are hashed into a key. On a hit the stored ``bundle_dir`` (and
+    ``ssr_output_dir``) is restored instead of running the frontend build.
+
+    Attributes:
+        enabled: Enable the build cache.
+        directory: Local cache directory, relative to the project root unless absolute.
+        storage_backend: fsspec URL to keep cache archives in instead of ``directory``
+            (e.g., ``s3://bucket/build-cache``), so CI runners can share them.
+        storage_options: Provider options forwarded to ``fsspec`` (credentials, region, etc.).
+        include: Extra files or directories, relative to the project root, that are part of the key.
+        env_prefixes: Environment variables whose names start with one of these prefixes are part of the key.
+        max_entries: Archives kept in ``directory``; the least recently used are removed. Remote
+            storage is not pruned.
+    """
+
+    enabled: bool = True
+    directory: "str | Path" = field(default_factory=lambda: Path("node_modules/.cache/litestar-vite"))
+    storage_backend: "str | None" = field(default_factory=lambda: os.getenv("VITE_BUILD_CACHE_STORAGE"))
+    storage_options: dict[str, Any] = field(default_factory=default_storage_options)
+    include: "list[str | Path]" = field(default_factory=list)  # pyright: ignore[reportUnknownVariableType]
+    env_prefixes: tuple[str, ...] = ("VITE_", "NODE_ENV")
+    max_entries: int = 5
+
+    def __post_init__(self) -> None:
+        """Normalize paths and validate limits.
+
+        Raises:
+            ValueError: If ``max_entries`` is less than 1.
+        """
+        if isinstance(self.directory, str):
+            self.directory = Path(self.directory)
+        if self.max_entries < 1:
+            msg = "BuildCacheConfig.max_entries must be at least 1."
+            raise ValueError(msg)
@@ -2,13 +2,75 @@
 
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit, urlunsplit
 
 from litestar_vite.config._constants import empty_dict_factory, empty_set_factory
 
 if TYPE_CHECKING:
     from pathlib import Path
 
-__all__ = ("InertiaConfig", "InertiaSSRConfig", "InertiaTypeGenConfig")
+    from litestar.stores.base import Store
+
+__all__ = (
+    "InertiaConfig",
+    "InertiaPropCacheConfig",
+    "InertiaSSRCacheConfig",
+    "InertiaSSRCircuitBreakerConfig",
+    "InertiaSSRConfig",
+    "InertiaTypeGenConfig",
+)
+
+
+@dataclass
+class InertiaSSRCacheConfig:
+    """Cache settings for Inertia SSR results.
+
+    Results are keyed by component and a hash of the encoded page object (props, URL
+    and asset version), so a page whose props differ per user or per session simply
+    misses the cache. Public pages with identical props skip the SSR server round trip.
+
+    Routes can opt out with ``ssr_cache=False`` in the route handler options, e.g.
+    ``@get("/", component="Home", ssr_cache=False)``.
+    """
+
+    store: "str | Store | None" = None
+    """Where rendered results live.
+
+    - ``None``: a per-process in-memory LRU store bounded by ``max_entries``.
+    - ``str``: the name of a store registered on the Litestar app (``Litestar(stores=...)``).
+    - A :class:`~litestar.stores.base.Store` instance.
+    """
+    ttl: "int | None" = 60
+    """Seconds a rendered result stays valid. ``None`` never expires."""
+    max_entries: int = 256
+    """Maximum number of results kept by the default in-memory store before the least recently used is evicted."""
+    key_prefix: str = "litestar-vite:ssr"
+    """Prefix of every cache key, to namespace the results inside a shared store."""
+
+
+@dataclass
+class InertiaSSRCircuitBreakerConfig:
+    """Circuit breaker settings for the Inertia SSR server.
+
+    The breaker watches the last ``window_size`` renders. When at least ``minimum_calls``
+    have been seen and the share of failed or slow ones reaches ``failure_rate_threshold``,
+    it opens: renders are refused without contacting the SSR server for ``open_seconds``.
+    Then ``half_open_probes`` renders are let through; if all succeed the circuit closes,
+    otherwise it opens again.
+    """
+
+    failure_rate_threshold: float = 0.5
+    """Share of failed renders in the window (0-1] that opens the circuit."""
+    slow_call_seconds: "float | None" = None
+    """Renders taking longer than this many seconds count as failures. ``None`` disables the latency check."""
+    window_size: int = 20
+    """Number of most recent renders the failure rate is computed over."""
+    minimum_calls: int = 10
+    """Renders that must be in the window before the circuit can open."""
+    open_seconds: float = 30.0
+    """Seconds the circuit stays open before probe renders are allowed."""
+    half_open_probes: int = 1
+    """Probe renders allowed, and required to succeed, while half-open."""
 
 
 @dataclass
@@ -31,6 +93,12 @@ class InertiaSSRConfig:
 
     enabled: bool = True
     url: str = "http://127.0.0.1:13714/render"
+    """Render endpoint of the SSR server.
+
+    Accepts a Unix domain socket address as ``unix:<socket path>``, optionally followed by
+    ``:<request path>`` (default ``/render``), e.g. ``unix:/run/myapp/ssr.sock``. It is split
+    into ``unix_socket`` and an HTTP URL for the request path.
+    """
     timeout: float = 2.0
     target_selector: str = "#app"
     """CSS selector for the element whose outer HTML is replaced by the SSR-rendered body.
@@ -75,6 +143,190 @@ class InertiaSSRConfig:
     and continues — startup is not aborted.
     """
 
+    unix_socket: "str | Path | None" = None
+    """Unix domain socket the SSR server listens on, instead of the TCP address in ``url``.
+
+    Set automatically when ``url`` is a ``unix:`` address.
+
+    Renders are still posted to ``url``, whose path (``/render``) is used as-is, but the
+    connection goes over the socket, skipping the loopback TCP handshake. Managed processes
+    receive the path as ``INERTIA_SSR_SOCKET``; the SSR entry must listen on it. With several
+    ``workers``, worker ``i`` uses ``<unix_socket>.<i>``.
+    """
+
+    workers: int = 1
+    """Number of SSR server processes to run and balance renders across.
+
+    Node renders on a single thread, so extra processes let SSR use more cores. Worker ``i``
+    listens on the port of ``url`` plus ``i`` and, when started from ``command``, receives that
+    port as ``INERTIA_SSR_PORT``. Requests go to the worker with the fewest renders in flight.
+    """
+
+    worker_eject_after: int = 3
+    """Consecutive connection failures after which a worker stops receiving renders.
+
+    Only consulted when ``workers`` is greater than 1.
+    """
+
+    worker_eject_seconds: float = 10.0
+    """Seconds an ejected worker is skipped before it is tried again."""
+
+    fallback_to_csr: bool = False
+    """Render the client-side bootstrap page when SSR fails instead of raising.
+
+    When True, an unreachable or failing SSR server, an open circuit or an exceeded
+    ``latency_budget`` serves the regular page with the page object embedded, and the
+    browser renders it as it would without SSR. When False, those failures raise
+    :class:`~litestar.exceptions.ImproperlyConfiguredException`.
+    """
+
+    latency_budget: "float | None" = None
+    """Seconds to wait for an SSR render before falling back to client-side rendering.
+
+    Only consulted when ``fallback_to_csr`` is True. Unlike ``timeout``, which applies to each
+    phase of the HTTP request, this bounds the whole render. ``None`` waits up to ``timeout``.
+    """
+
+    circuit_breaker: "InertiaSSRCircuitBreakerConfig | bool | None" = None
+    """Stop calling the SSR server while it keeps failing or responding slowly.
+
+    Supports:
+        - True: enable with defaults -> ``InertiaSSRCircuitBreakerConfig()``
+        - False/None: disabled
+        - InertiaSSRCircuitBreakerConfig: use as-is
+    """
+
+    coalesce_requests: bool = False
+    """Share one in-flight SSR render between concurrent requests for an identical page.
+
+    When enabled, requests whose encoded page object matches a render already in progress
+    await that render instead of posting the same payload to the SSR server again. A failed
+    render fails every waiting request with a copy of its error.
+    """
+
+    streaming: bool = False
+    """Stream the SSR server's HTML into the response as it renders.
+
+    The rendered page is sent up to the ``target_selector`` element as soon as the SSR server
+    answers, and the app markup follows chunk by chunk, so time to first byte no longer waits
+    for the whole render. The server must answer requests accepting ``text/html`` with the
+    app's outer HTML (what it would otherwise return as ``body``), e.g. from React's
+    ``renderToPipeableStream``. SSR ``head`` tags are not supported in this mode, and
+    streamed renders bypass ``cache`` and ``coalesce_requests``. A server that answers with
+    the regular JSON payload is rendered as usual.
+    """
+
+    cache: "InertiaSSRCacheConfig | bool | None" = None
+    """Cache SSR results so repeated renders of identical pages skip the SSR server.
+
+    Supports:
+        - True: enable with defaults -> ``InertiaSSRCacheConfig()``
+        - False/None: disabled (every first load calls the SSR server)
+        - InertiaSSRCacheConfig: use as-is
+    """
+
+    def __post_init__(self) -> None:
+        """Normalize optional sub-configs and ``unix:`` URLs.
+
+        Raises:
+            ValueError: If a ``unix:`` URL has no socket path or names a different socket than ``unix_socket``.
+        """
+        if self.url.startswith("unix:"):
+            socket_path, _, request_path = self.url.removeprefix("unix:").partition(":")
+            if not socket_path:
+                msg = (
+                    f"InertiaSSRConfig.url {self.url!r} is missing the socket path (expected 'unix:/path/to/ssr.sock')."
+                )
+                raise ValueError(msg)
+            if self.unix_socket is not None and str(self.unix_socket) != socket_path:
+                msg = "InertiaSSRConfig.url and unix_socket name different sockets."
+                raise ValueError(msg)
+            self.unix_socket = socket_path
+            self.url = f"http://localhost{request_path or '/render'}"
+        if self.cache is True:
+            self.cache = InertiaSSRCacheConfig()
+        elif self.cache is False:
+            self.cache = None
+        if self.circuit_breaker is True:
+            self.circuit_breaker = InertiaSSRCircuitBreakerConfig()
+        elif self.circuit_breaker is False:
+            self.circuit_breaker = None
+
+    @property
+    def worker_urls(self) -> "list[str]":
+        """Return the render URL of every SSR worker.
+
+        Returns:
+            ``url`` for a single worker, otherwise one URL per worker on consecutive ports.
+        """
+        if self.workers <= 1:
+            return [self.url]
+        parsed = urlsplit(self.url)
+        host = parsed.hostname or ""
+        if ":" in host:
+            host = f"[{host}]"
+        base_port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        return [urlunsplit(parsed._replace(netloc=f"{host}:{base_port + index}")) for index in range(self.workers)]
+
+    @property
+    def worker_sockets(self) -> "list[str]":
+        """Return the Unix socket path of every SSR worker, aligned with :attr:`worker_urls`.
+
+        Returns:
+            An empty list when ``unix_socket`` is not set.
+        """
+        if self.unix_socket is None:
+            return []
+        if self.workers <= 1:
+            return [str(self.unix_socket)]
+        return [f"{self.unix_socket}.{index}" for index in range(self.workers)]
+
+    @property
+    def circuit_breaker_config(self) -> "InertiaSSRCircuitBreakerConfig | None":
+        """Return the circuit breaker config when enabled, otherwise None.
+
+        Returns:
+            The resolved circuit breaker config, or None when the breaker is disabled.
+        """
+        return self.circuit_breaker if isinstance(self.circuit_breaker, InertiaSSRCircuitBreakerConfig) else None
+
+    @property
+    def cache_config(self) -> "InertiaSSRCacheConfig | None":
+        """Return the SSR cache config when enabled, otherwise None.
+
+        Returns:
+            The resolved SSR cache config, or None when caching is disabled.
+        """
+        return self.cache if isinstance(self.cache, InertiaSSRCacheConfig) else None
+
+
+@dataclass
+class InertiaPropCacheConfig:
+    """Server-side cache settings for ``once()`` and ``defer()`` prop values.
+
+    ``once()`` props are only cached by the Inertia client, so the server still evaluates
+    them for every first visit, new tab and user. Props created with ``cache=`` are looked
+    up in this store before their callback runs, and stored afterwards, so an expensive
+    value (feature flags, configuration, ...) is computed once per TTL across requests.
+
+    Values are stored JSON-encoded, so cached props must be JSON serializable.
+    """
+
+    store: "str | Store | None" = None
+    """Where cached values live.
+
+    - ``None``: a per-process in-memory LRU store bounded by ``max_entries``.
+    - ``str``: the name of a store registered on the Litestar app (``Litestar(stores=...)``),
+      e.g. a ``RedisStore`` or ``FileStore`` shared between workers.
+    - A :class:`~litestar.stores.base.Store` instance.
+    """
+    default_ttl: "int | None" = 300
+    """Seconds a cached value stays valid when the prop does not set ``ttl``. ``None`` never expires."""
+    max_entries: int = 1024
+    """Maximum number of values kept by the default in-memory store before the least recently used is evicted."""
+    key_prefix: str = "litestar-vite:props"
+    """Prefix of every cache key, to namespace the values inside a shared store."""
+
 
 @dataclass
 class InertiaConfig:
@@ -246,12 +498,58 @@ class InertiaConfig:
     See: https://laravel.com/docs/precognition
     """
 
+    concurrent_async_props: bool = False
+    """Resolve async prop callbacks concurrently instead of one after another.
+
+    When True, the async ``defer()``/``optional()``/``once()`` callbacks selected for a
+    response (after partial-reload filtering) run in a single task group, so a page with
+    several independent async props waits for the slowest one instead of their sum.
+
+    Only enable this when the callbacks are independent of each other. Callbacks sharing
+    a resource that does not allow concurrent use (e.g. one database session) must keep
+    the default sequential resolution, or be bounded with ``async_props_concurrency_limit=1``.
+    """
+    async_props_concurrency_limit: "int | None" = None
+    """Maximum number of async prop callbacks awaited at once in concurrent mode.
+
+    ``None`` (the default) runs every selected callback at the same time.
+    """
+    sync_props_to_thread: bool = False
+    """Evaluate sync ``defer()``/``optional()``/``once()``/``lazy()`` callbacks in worker threads.
+
+    By default sync callbacks run inline on the event loop while the response is built,
+    so a blocking call (e.g. a synchronous ORM query) stalls every other request on the
+    worker. When True, they run via ``anyio.to_thread.run_sync`` during the async
+    pre-pass instead. Individual props can opt in or out with ``sync_to_thread=``.
+
+    Callback durations are recorded per request; see
+    :func:`~litestar_vite.inertia.helpers.get_prop_timings`.
+    """
+    sync_props_thread_limit: "int | None" = None
+    """Maximum number of worker threads used at once for sync prop callbacks, per worker process.
+
+    ``None`` (the default) shares AnyIO's default thread limiter.
+    """
+
+    prop_cache: "InertiaPropCacheConfig | bool | None" = True
+    """Server-side cache for props created with ``once(..., cache=...)`` / ``defer(..., cache=...)``.
+
+    Supports:
+        - True (default): enable with defaults -> ``InertiaPropCacheConfig()``
+        - False/None: disable; props that request caching are evaluated on every request
+        - InertiaPropCacheConfig: use as-is
+    """
+
     def __post_init__(self) -> None:
         """Normalize optional sub-configs."""
         if self.ssr is True:
             self.ssr = InertiaSSRConfig()
         elif self.ssr is False:
             self.ssr = None
+        if self.prop_cache is True:
+            self.prop_cache = InertiaPropCacheConfig()
+        elif self.prop_cache is False:
+            self.prop_cache = None
 
     @property
     def ssr_config(self) -> "InertiaSSRConfig | None":
@@ -264,6 +562,17 @@ class InertiaConfig:
             return self.ssr
         return None
 
+    @property
+    def prop_cache_config(self) -> "InertiaPropCacheConfig | None":
+        """Return the prop cache config when enabled, otherwise None.
+
+        Returns:
+            The resolved prop cache config when enabled, otherwise None.
+        """
+        if isinstance(self.prop_cache, InertiaPropCacheConfig):
+            return self.prop_cache
+        return None
+
 
 @dataclass
 class InertiaTypeGenConfig:
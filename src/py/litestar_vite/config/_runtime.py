@@ -8,7 +8,7 @@ from typing import Literal
 
 from litestar_vite.config._constants import TRUE_VALUES
 
-__all__ = ("ExternalDevServer", "RuntimeConfig", "resolve_trusted_proxies")
+__all__ = ("ExternalDevServer", "FrameworkProxyConfig", "RuntimeConfig", "resolve_trusted_proxies")
 
 _EXECUTOR_COMMANDS: dict[str, dict[str, tuple[str, ...]]] = {
     "node": {
@@ -169,6 +169,53 @@ class ExternalDevServer:
     enabled: bool = True
 
 
+@dataclass
+class FrameworkProxyConfig:
+    """Production proxy from framework mode to one or more SSR servers.
+
+    Without it, a production framework-mode app serves the built client bundle. With it,
+    every request that no Litestar route claims is forwarded to the SSR servers started
+    with the framework's node adapter (Nuxt, SvelteKit, Astro), so Litestar can front
+    several of them without a separate load balancer.
+
+    A server that refuses ``eject_after`` connections in a row is skipped for
+    ``eject_seconds``. GET, HEAD and OPTIONS requests that cannot connect are retried on
+    another server up to ``retries`` times.
+
+    Attributes:
+        targets: Base URLs of the SSR servers (e.g. ``"http://127.0.0.1:3000"``).
+        balance: ``"least_connections"`` sends each request to the server with the fewest
+            requests in flight; ``"round_robin"`` takes the servers in turn.
+        retries: Extra attempts for idempotent requests after a connection error.
+        eject_after: Consecutive failures after which a server stops receiving requests.
+        eject_seconds: Seconds an ejected server is skipped before it is tried again.
+    """
+
+    targets: "tuple[str, ...] | list[str] | str" = ()
+    balance: Literal["least_connections", "round_robin"] = "least_connections"
+    retries: int = 1
+    eject_after: int = 3
+    eject_seconds: float = 10.0
+
+    def __post_init__(self) -> None:
+        """Normalize the targets and validate the settings.
+
+        Raises:
+            ValueError: If no target is given or a setting is out of range.
+        """
+        targets = (self.targets,) if isinstance(self.targets, str) else tuple(self.targets)
+        self.targets = tuple(target.rstrip("/") for target in targets)
+        if not self.targets:
+            msg = "FrameworkProxyConfig requires at least one target URL."
+            raise ValueError(msg)
+        if self.balance not in {"least_connections", "round_robin"}:
+            msg = f"balance must be 'least_connections' or 'round_robin', got {self.balance!r}."
+            raise ValueError(msg)
+        if self.retries < 0 or self.eject_after < 1 or self.eject_seconds < 0:
+            msg = "retries and eject_seconds must be non-negative and eject_after at least 1."
+            raise ValueError(msg)
+
+
 @dataclass
 class RuntimeConfig:
     """Runtime execution settings.
@@ -195,6 +242,9 @@ class RuntimeConfig:
         set_environment: Set Vite environment variables from config.
         set_static_folders: Automatically configure static file serving.
         csp_nonce: Content Security Policy nonce for inline scripts.
+        modulepreload: Emit ``<link rel="modulepreload">`` for the imported chunks of
+            an entry instead of module scripts, so the browser fetches the whole
+            import graph in parallel.
         spa_handler: Auto-register catch-all SPA route when mode="spa".
         http2: Enable HTTP/2 for proxy HTTP requests (better multiplexing).
             WebSocket traffic (HMR) uses a separate connection and is unaffected.
@@ -221,6 +271,7 @@ class RuntimeConfig:
     set_environment: bool = True
     set_static_folders: bool = True
     csp_nonce: "str | None" = None
+    modulepreload: bool = False
     spa_handler: bool = True
     http2: bool = True
     start_dev_server: bool = True
@@ -257,6 +308,58 @@ class RuntimeConfig:
     Use this to deliberately reserve custom backend paths such as ``"/admin"`` or
     to re-add ``"/docs"`` when your app serves documentation there.
     """
+    preload_headers: bool = False
+    """Send ``Link`` preload headers for manifest entry assets on HTML responses.
+
+    Applies to the production SPA handler and Inertia first-load (HTML) responses.
+    Stylesheets are announced as ``rel=preload; as=style``, the entry module and its
+    static imports as ``rel=modulepreload`` and referenced fonts as ``as=font``, so a
+    CDN or browser can start fetching them before the body arrives.
+    """
+    early_hints: bool = False
+    """Send the preload links as a ``103 Early Hints`` response before the handler runs.
+
+    Only used when the ASGI server advertises the ``http.response.early_hint``
+    extension (e.g. Hypercorn); ignored otherwise. Sent for production SPA requests
+    and for Inertia page routes before their props are resolved.
+    """
+    preload_entries: tuple[str, ...] = ()
+    """Manifest entries whose assets are preloaded.
+
+    Defaults to every manifest chunk flagged ``isEntry``.
+    """
+    precompressed_encodings: tuple[str, ...] = ("br", "zstd", "gzip")
+    """Content encodings of precompressed asset variants, in order of preference.
+
+    In production the static router answers a request for ``app.js`` with ``app.js.br``,
+    ``app.js.zst`` or ``app.js.gz`` when the client's ``Accept-Encoding`` allows it and the
+    file exists, and ``litestar assets build`` writes those files after the Vite build.
+    ``br`` needs the ``brotli`` package and ``zstd`` the ``zstandard`` package (or Python
+    3.14) at build time. Set to ``()`` to serve files as-is.
+    """
+    asset_cache_size: int = 0
+    """Bytes of content-hashed build output to hold in memory per worker (``0`` disables).
+
+    In production the files listed in the manifest, and their precompressed variants, are
+    read into an LRU cache at startup and served with pre-built headers, so small JS and CSS
+    chunks are answered without filesystem access. Files over 1 MiB are never cached.
+    """
+    proxy_connect_timeout: float = 5.0
+    """Seconds to wait for a connection to the dev or framework server the proxy forwards to."""
+    proxy_read_timeout: float = 30.0
+    """Seconds to wait for each chunk of the upstream response (and to send the request body)."""
+    proxy_pool_timeout: float = 10.0
+    """Seconds a proxied request waits for a free pooled connection before failing."""
+    proxy_max_connections: int = 100
+    """Upper bound of concurrent upstream connections held by the proxy."""
+    proxy_max_keepalive_connections: int = 20
+    """Idle upstream connections kept open for reuse by later proxied requests."""
+    framework_proxy: "FrameworkProxyConfig | tuple[str, ...] | list[str] | str | None" = None
+    """SSR servers a production framework-mode app forwards unclaimed requests to.
+
+    Accepts a :class:`FrameworkProxyConfig`, or one or more target URLs for the defaults.
+    Has no effect in development, where the framework dev server is proxied.
+    """
 
     def __post_init__(self) -> None:
         """Normalize runtime settings and apply derived defaults."""
@@ -265,6 +368,32 @@ class RuntimeConfig:
         else:
             self.extra_route_prefixes = tuple(self.extra_route_prefixes)
 
+        if isinstance(self.preload_entries, str):
+            self.preload_entries = (self.preload_entries,)
+        else:
+            self.preload_entries = tuple(self.preload_entries)
+
+        if isinstance(self.precompressed_encodings, str):
+            self.precompressed_encodings = (self.precompressed_encodings,)
+        else:
+            self.precompressed_encodings = tuple(self.precompressed_encodings)
+        unknown = sorted(set(self.precompressed_encodings) - {"br", "zstd", "gzip"})
+        if unknown:
+            msg = f"Unsupported precompressed_encodings {unknown}; expected 'br', 'zstd' or 'gzip'."
+            raise ValueError(msg)
+        if min(self.proxy_connect_timeout, self.proxy_read_timeout, self.proxy_pool_timeout) <= 0:
+            msg = "proxy_connect_timeout, proxy_read_timeout and proxy_pool_timeout must be positive."
+            raise ValueError(msg)
+        if self.proxy_max_connections < 1 or self.proxy_max_keepalive_connections < 0:
+            msg = "proxy_max_connections must be at least 1 and proxy_max_keepalive_connections non-negative."
+            raise ValueError(msg)
+        if self.asset_cache_size < 0:
+            msg = f"asset_cache_size must be non-negative, got {self.asset_cache_size}."
+            raise ValueError(msg)
+
+        if self.framework_proxy is not None and not isinstance(self.framework_proxy, FrameworkProxyConfig):
+            self.framework_proxy = FrameworkProxyConfig(targets=self.framework_proxy)
+
         if isinstance(self.external_dev_server, str):
             self.external_dev_server = ExternalDevServer(target=self.external_dev_server)
 
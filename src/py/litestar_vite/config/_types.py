@@ -42,6 +42,10 @@ class TypeGenConfig:
             Controls whether untyped dict/list become `unknown` (default) or `any`.
         type_import_paths: Map schema/type names to TypeScript import paths for props types
             that are not present in OpenAPI (e.g., internal/excluded schemas).
+        parallel_commands: Run ``extra_commands`` concurrently with the typegen CLI.
+        background_export: Export type metadata on a background thread after startup
+            instead of before the server starts.
+        background_export_delay: Seconds the background export waits before it runs.
     """
 
     output: Path = field(default_factory=lambda: Path("src/generated"))
@@ -129,8 +133,36 @@ class TypeGenConfig:
         )
     """
 
+    parallel_commands: bool = False
+    """Run ``extra_commands`` concurrently with the typegen CLI.
+
+    By default ``litestar assets generate-types`` and ``litestar assets build`` run the
+    extra commands first and ``litestar-vite-typegen`` afterwards. Both only read the
+    exported metadata, so when no extra command touches the TypeScript files typegen
+    writes, enabling this overlaps them. The extra commands still run one after another
+    in the configured order, and their output may interleave with typegen's.
+    """
+    background_export: bool = False
+    """Export type metadata on a background thread instead of blocking startup.
+
+    By default ``openapi.json``, ``routes.json``, ``routes.ts`` and ``inertia-pages.json``
+    are exported before the Vite dev server starts and before the app accepts requests.
+    With ``background_export=True`` startup continues immediately and the export runs
+    ``background_export_delay`` seconds later on a worker thread. The Vite plugin picks
+    up the new files through its watcher; the fingerprint file is written last.
+    """
+    background_export_delay: float = 0.5
+    """Seconds the background export waits before it runs.
+
+    A reload within this window cancels the export, so a burst of file saves exports once.
+    """
+
     def __post_init__(self) -> None:
-        """Normalize path types and compute defaults based on output directory."""
+        """Normalize path types and compute defaults based on output directory.
+
+        Raises:
+            ValueError: If ``background_export_delay`` is negative.
+        """
         if isinstance(self.output, str):
             self.output = Path(self.output)
         if self.openapi_path is None:
@@ -153,3 +185,6 @@ class TypeGenConfig:
             self.schemas_ts_path = self.output / "schemas.ts"
         elif isinstance(self.schemas_ts_path, str):
             self.schemas_ts_path = Path(self.schemas_ts_path)
+        if self.background_export_delay < 0:
+            msg = "background_export_delay must be non-negative."
+            raise ValueError(msg)
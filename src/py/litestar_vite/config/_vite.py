@@ -16,9 +16,12 @@ from litestar_vite.config._constants import (  # pyright: ignore[reportPrivateUs
     TRUE_VALUES,
     empty_dict_factory,
 )
-from litestar_vite.config._deploy import DeployConfig  # pyright: ignore[reportPrivateUsage]
+from litestar_vite.config._deploy import BuildCacheConfig, DeployConfig  # pyright: ignore[reportPrivateUsage]
 from litestar_vite.config._inertia import (  # pyright: ignore[reportPrivateUsage]
     InertiaConfig,
+    InertiaPropCacheConfig,
+    InertiaSSRCacheConfig,
+    InertiaSSRCircuitBreakerConfig,
     InertiaSSRConfig,
     InertiaTypeGenConfig,
 )
@@ -39,9 +42,13 @@ if TYPE_CHECKING:
 __all__ = (
     "FSSPEC_INSTALLED",
     "JINJA_INSTALLED",
+    "BuildCacheConfig",
     "DeployConfig",
     "ExternalDevServer",
     "InertiaConfig",
+    "InertiaPropCacheConfig",
+    "InertiaSSRCacheConfig",
+    "InertiaSSRCircuitBreakerConfig",
     "InertiaSSRConfig",
     "InertiaTypeGenConfig",
     "LoggingConfig",
@@ -170,6 +177,7 @@ class ViteConfig:
         dev_mode: Convenience shortcut for runtime.dev_mode.
         base_url: Base URL for the app entry point.
         deploy: Deployment configuration for CDN publishing.
+        build_cache: Build output cache for ``litestar assets build`` (True/BuildCacheConfig enables).
         enabled: Whether VitePlugin actively wires serving routes and lifespans.
     """
 
@@ -183,6 +191,7 @@ class ViteConfig:
     dev_mode: bool = False
     base_url: "str | None" = field(default_factory=lambda: os.getenv("VITE_BASE_URL"))
     deploy: "DeployConfig | bool" = False
+    build_cache: "BuildCacheConfig | bool" = False
     enabled: "bool | None" = None
     """Whether the plugin actively serves assets/routes.
 
@@ -472,6 +481,10 @@ class ViteConfig:
             self.deploy = DeployConfig(enabled=True)
         elif self.deploy is False:
             self.deploy = DeployConfig(enabled=False)
+        if self.build_cache is True:
+            self.build_cache = BuildCacheConfig()
+        elif self.build_cache is False:
+            self.build_cache = BuildCacheConfig(enabled=False)
 
     def _resolve_type_paths(self, types: TypeGenConfig) -> None:
         """Resolve type generation paths relative to the configured root.
@@ -581,9 +594,16 @@ class ViteConfig:
 
         # Validate SSR config when Inertia is enabled
         if isinstance(self.inertia, InertiaConfig):
-            ssr_config = self.inertia.ssr_config
-            if ssr_config is not None and ssr_config.timeout <= 0:
-                msg = f"InertiaSSRConfig.timeout must be positive, got {ssr_config.timeout}."
+            if self.inertia.ssr_config is not None:
+                _validate_ssr_config(self.inertia.ssr_config)
+            for name in ("async_props_concurrency_limit", "sync_props_thread_limit"):
+                limit = getattr(self.inertia, name)
+                if limit is not None and limit < 1:
+                    msg = f"InertiaConfig.{name} must be at least 1, got {limit}."
+                    raise ValueError(msg)
+            prop_cache = self.inertia.prop_cache_config
+            if prop_cache is not None and prop_cache.max_entries < 1:
+                msg = f"InertiaPropCacheConfig.max_entries must be at least 1, got {prop_cache.max_entries}."
                 raise ValueError(msg)
 
         # Validate type generation requires inertia for page props
@@ -1093,6 +1113,15 @@ class ViteConfig:
         """
         return self.runtime.csp_nonce
 
+    @property
+    def modulepreload(self) -> bool:
+        """Return whether imported chunks are emitted as ``modulepreload`` links.
+
+        Returns:
+            True if modulepreload links are enabled, otherwise False.
+        """
+        return self.runtime.modulepreload
+
     @property
     def trusted_proxies(self) -> "list[str] | str | None":
         """Get trusted proxies configuration.
@@ -1142,6 +1171,17 @@ class ViteConfig:
             return self.deploy
         return None
 
+    @property
+    def build_cache_config(self) -> "BuildCacheConfig | None":
+        """Get build cache configuration if enabled.
+
+        Returns:
+            BuildCacheConfig instance when the build cache is enabled, None otherwise.
+        """
+        if isinstance(self.build_cache, BuildCacheConfig) and self.build_cache.enabled:
+            return self.build_cache
+        return None
+
     @property
     def logging_config(self) -> LoggingConfig:
         """Get logging configuration.
@@ -1152,3 +1192,45 @@ class ViteConfig:
         if isinstance(self.logging, LoggingConfig):
             return self.logging
         return LoggingConfig()
+
+
+def _validate_ssr_config(ssr_config: "InertiaSSRConfig") -> None:
+    """Validate numeric settings of an Inertia SSR config.
+
+    Raises:
+        ValueError: If a setting is out of range.
+    """
+    if ssr_config.timeout <= 0:
+        msg = f"InertiaSSRConfig.timeout must be positive, got {ssr_config.timeout}."
+        raise ValueError(msg)
+    for name in ("workers", "worker_eject_after"):
+        value = getattr(ssr_config, name)
+        if value < 1:
+            msg = f"InertiaSSRConfig.{name} must be at least 1, got {value}."
+            raise ValueError(msg)
+    if ssr_config.latency_budget is not None and ssr_config.latency_budget <= 0:
+        msg = f"InertiaSSRConfig.latency_budget must be positive, got {ssr_config.latency_budget}."
+        raise ValueError(msg)
+    breaker = ssr_config.circuit_breaker_config
+    if breaker is not None:
+        for name in ("window_size", "minimum_calls", "half_open_probes"):
+            value = getattr(breaker, name)
+            if value < 1:
+                msg = f"InertiaSSRCircuitBreakerConfig.{name} must be at least 1, got {value}."
+                raise ValueError(msg)
+        if breaker.minimum_calls > breaker.window_size:
+            msg = (
+                "InertiaSSRCircuitBreakerConfig.minimum_calls must not exceed window_size, "
+                f"got minimum_calls={breaker.minimum_calls} and window_size={breaker.window_size}."
+            )
+            raise ValueError(msg)
+        if not 0 < breaker.failure_rate_threshold <= 1:
+            msg = (
+                "InertiaSSRCircuitBreakerConfig.failure_rate_threshold must be in (0, 1], "
+                f"got {breaker.failure_rate_threshold}."
+            )
+            raise ValueError(msg)
+    cache = ssr_config.cache_config
+    if cache is not None and cache.max_entries < 1:
+        msg = f"InertiaSSRCacheConfig.max_entries must be at least 1, got {cache.max_entries}."
+        raise ValueError(msg)
@@ -12,12 +12,15 @@ import sys
 from abc import ABC, abstractmethod
 from importlib.util import find_spec
 from pathlib import Path
-from typing import Any, ClassVar, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, ClassVar, Protocol, runtime_checkable
 
 from litestar.cli._utils import console
 
 from litestar_vite.exceptions import ViteExecutableNotFoundError, ViteExecutionError
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 
 def _windows_create_new_process_group_flag() -> int:
     """Return the Windows-only process creation flag for new process groups.
@@ -38,15 +41,19 @@ def _windows_create_new_process_group_flag() -> int:
 _create_new_process_group = _windows_create_new_process_group_flag()
 
 
-def _popen_server_kwargs(cwd: Path) -> dict[str, Any]:
+def _popen_server_kwargs(cwd: Path, env: "Mapping[str, str] | None" = None) -> dict[str, Any]:
     """Return Popen kwargs that keep server processes alive and grouped.
 
+    Args:
+        cwd: The working directory.
+        env: Extra environment variables layered over the current environment.
+
     Returns:
         Keyword arguments for ``subprocess.Popen`` suitable for long-lived dev servers.
     """
     kwargs: dict[str, Any] = {
         "cwd": cwd,
-        "env": {**os.environ, "LITESTAR_VITE_MANAGED": "1"},
+        "env": {**os.environ, **(env or {}), "LITESTAR_VITE_MANAGED": "1"},
         "stdin": subprocess.PIPE,
         "stdout": None,
         "stderr": subprocess.PIPE,
@@ -108,9 +115,14 @@ class JSExecutor(ABC):
         """
 
     @abstractmethod
-    def run(self, args: list[str], cwd: Path) -> "subprocess.Popen[Any]":
+    def run(self, args: list[str], cwd: Path, env: "Mapping[str, str] | None" = None) -> "subprocess.Popen[Any]":
         """Run a command.
 
+        Args:
+            args: The command arguments.
+            cwd: The working directory.
+            env: Extra environment variables for the process.
+
         Returns:
             The result.
         """
@@ -205,11 +217,11 @@ class CommandExecutor(JSExecutor):
         if process.returncode != 0:
             raise ViteExecutionError(command, process.returncode, "package update failed")
 
-    def run(self, args: list[str], cwd: Path) -> "subprocess.Popen[Any]":
+    def run(self, args: list[str], cwd: Path, env: "Mapping[str, str] | None" = None) -> "subprocess.Popen[Any]":
         executable = self._resolve_executable()
         args = self._apply_silent_flag(args)
         command = _normalize_command(executable, args, binary_name=self.bin_name)
-        return subprocess.Popen(command, **_popen_server_kwargs(cwd))
+        return subprocess.Popen(command, **_popen_server_kwargs(cwd, env))
 
     def execute(self, args: list[str], cwd: Path) -> None:
         executable = self._resolve_executable()
@@ -332,11 +344,11 @@ class NodeenvExecutor(JSExecutor):
         if process.returncode != 0:
             raise ViteExecutionError(command, process.returncode, "package update failed")
 
-    def run(self, args: list[str], cwd: Path) -> "subprocess.Popen[Any]":
+    def run(self, args: list[str], cwd: Path, env: "Mapping[str, str] | None" = None) -> "subprocess.Popen[Any]":
         npm_path = self._find_npm_in_venv()
         args = self._apply_silent_flag(args)
         command = _normalize_command(npm_path, args, binary_name="npm")
-        return subprocess.Popen(command, **_popen_server_kwargs(cwd))
+        return subprocess.Popen(command, **_popen_server_kwargs(cwd, env))
 
     def execute(self, args: list[str], cwd: Path) -> None:
         npm_path = self._find_npm_in_venv()
@@ -21,13 +21,7 @@ from litestar.serialization import decode_json, encode_json
 
 from litestar_vite.config import InertiaConfig
 from litestar_vite.handler._routing import spa_handler_dev, spa_handler_prod
-from litestar_vite.html_transform import (
-    inject_head_script,
-    inject_page_script,
-    inject_vite_dev_scripts,
-    set_data_attribute,
-    transform_asset_urls,
-)
+from litestar_vite.html_transform import HtmlTemplate, inject_vite_dev_scripts, transform_asset_urls
 from litestar_vite.plugin._utils import check_h2_available
 from litestar_vite.utils import get_static_resource_path, read_hotfile_url
 
@@ -84,6 +78,7 @@ class AppHandler:
         "_config",
         "_csrf_cookie_name",
         "_csrf_header_name",
+        "_html_template",
         "_http_client",
         "_http_client_sync",
         "_initialized",
@@ -106,6 +101,7 @@ class AppHandler:
         self._cached_html: "str | None" = None
         self._cached_bytes: "bytes | None" = None
         self._cached_transformed_html: "str | None" = None
+        self._html_template: "HtmlTemplate | None" = None
         self._initialized = False
         self._http_client: "httpx.AsyncClient | None" = None
         self._http_client_sync: "httpx.Client | None" = None
@@ -199,37 +195,86 @@ class AppHandler:
         Returns:
             The transformed HTML.
         """
+        return self._render_template(HtmlTemplate(html, self._app_selector), page_data, csrf_token)
+
+    def _render_template(
+        self,
+        template: "HtmlTemplate",
+        page_data: "dict[str, Any] | None" = None,
+        csrf_token: "str | None" = None,
+        *,
+        ssr_body: "str | None" = None,
+        ssr_head: str = "",
+    ) -> str:
+        """Render a compiled index template with the CSRF token, page data and SSR output.
+
+        Returns:
+            The rendered HTML.
+        """
+        json_data = encode_json(page_data).decode("utf-8") if page_data is not None else None
+        return template.render(
+            page_data=json_data, ssr_body=ssr_body, ssr_head=ssr_head, **self._render_options(csrf_token)
+        )
+
+    def _render_options(self, csrf_token: "str | None") -> "dict[str, Any]":
+        """Build the template render options shared by every request.
+
+        Args:
+            csrf_token: The request's CSRF token, if any.
+
+        Returns:
+            Keyword arguments for :meth:`HtmlTemplate.render` / :meth:`HtmlTemplate.render_bytes`.
+        """
         if self._spa_config is None:
-            if page_data is not None:
-                json_data = encode_json(page_data).decode("utf-8")
-                html = set_data_attribute(html, "#app", "data-page", json_data)
-            return html
+            return {}
 
+        head_script = ""
         if self._spa_config.inject_csrf and csrf_token:
             script_lines = [f'window.{self._spa_config.csrf_var_name} = "{csrf_token}";']
             if self._csrf_header_name:
                 script_lines.append(f'window.__LITESTAR_CSRF_HEADER_NAME__ = "{self._csrf_header_name}";')
             if self._csrf_cookie_name:
                 script_lines.append(f'window.__LITESTAR_CSRF_COOKIE_NAME__ = "{self._csrf_cookie_name}";')
-            script = "\n".join(script_lines)
-            html = inject_head_script(html, script, escape=False, nonce=self._config.csp_nonce)
-
-        if page_data is not None:
-            json_data = encode_json(page_data).decode("utf-8")
-            # Check InertiaConfig for use_script_element (Inertia-specific setting)
-            inertia = self._config.inertia
-            use_script_element = isinstance(inertia, InertiaConfig) and inertia.use_script_element
-            if use_script_element:
-                # v2.3+ Inertia protocol: Use script element for better performance (~37% smaller)
-                app_id = "app"
-                if self._spa_config.app_selector.startswith("#") and len(self._spa_config.app_selector) > 1:
-                    app_id = self._spa_config.app_selector[1:]
-                html = inject_page_script(html, json_data, app_id=app_id, nonce=self._config.csp_nonce)
-            else:
-                # Legacy: Use data-page attribute
-                html = set_data_attribute(html, self._spa_config.app_selector, "data-page", json_data)
+            head_script = "\n".join(script_lines)
+
+        # Check InertiaConfig for use_script_element (Inertia-specific setting)
+        # v2.3+ Inertia protocol: Use script element for better performance (~37% smaller)
+        inertia = self._config.inertia
+        use_script_element = isinstance(inertia, InertiaConfig) and inertia.use_script_element
+        app_id = "app"
+        if self._spa_config.app_selector.startswith("#") and len(self._spa_config.app_selector) > 1:
+            app_id = self._spa_config.app_selector[1:]
+        return {
+            "head_script": head_script,
+            "escape": False,
+            "nonce": self._config.csp_nonce,
+            "use_script_element": use_script_element,
+            "app_id": app_id,
+        }
+
+    @property
+    def _app_selector(self) -> str:
+        """The selector of the app root element that receives page data.
+
+        Returns:
+            The configured app selector, or ``#app`` without an SPA config.
+        """
+        return self._spa_config.app_selector if self._spa_config is not None else "#app"
+
+    def _index_template(self) -> "HtmlTemplate":
+        """Return the compiled template for the cached index.html.
+
+        The template is built when index.html is loaded and rebuilt only if the cached HTML
+        has been replaced since.
 
-        return html
+        Returns:
+            The compiled template.
+        """
+        html = self._cached_html or ""
+        template = self._html_template
+        if template is None or template.html is not html:
+            template = self._html_template = HtmlTemplate(html, self._app_selector)
+        return template
 
     async def _load_index_html_async(self) -> None:
         """Load and cache index.html asynchronously."""
@@ -249,6 +294,7 @@ class AppHandler:
 
         self._cached_html = html
         self._cached_bytes = html.encode("utf-8")
+        self._html_template = HtmlTemplate(html, self._app_selector)
 
     def _load_index_html_sync(self) -> None:
         """Load and cache index.html synchronously."""
@@ -268,6 +314,7 @@ class AppHandler:
 
         self._cached_html = html
         self._cached_bytes = html.encode("utf-8")
+        self._html_template = HtmlTemplate(html, self._app_selector)
 
     def _raise_index_not_found(self) -> NoReturn:
         """Raise an exception when index.html is not found.
@@ -468,28 +515,35 @@ class AppHandler:
         if self._cached_html is None:
             await self._load_index_html_async()
 
-        base_html = self._cached_html or ""
-
         if not needs_transform:
-            return base_html
+            return self._cached_html or ""
 
         if page_data is not None or csrf_token is not None:
-            return self._transform_html(base_html, page_data, csrf_token)
+            return self._render_template(self._index_template(), page_data, csrf_token)
 
         if self._spa_config is not None and self._spa_config.cache_transformed_html:
             if self._cached_transformed_html is not None:
                 return self._cached_transformed_html
-            self._cached_transformed_html = self._transform_html(base_html, None, None)
+            self._cached_transformed_html = self._render_template(self._index_template())
             return self._cached_transformed_html
 
-        return self._transform_html(base_html, None, None)
+        return self._render_template(self._index_template())
 
-    def get_html_sync(self, *, page_data: "dict[str, Any] | None" = None, csrf_token: "str | None" = None) -> str:
+    def get_html_sync(
+        self,
+        *,
+        page_data: "dict[str, Any] | None" = None,
+        csrf_token: "str | None" = None,
+        ssr_body: "str | None" = None,
+        ssr_head: str = "",
+    ) -> str:
         """Get the HTML for the SPA synchronously.
 
         Args:
             page_data: Optional page data to inject (e.g., Inertia page props).
             csrf_token: Optional CSRF token to inject.
+            ssr_body: Optional server-rendered HTML replacing the app element.
+            ssr_head: Optional server-rendered HTML injected into ``<head>``.
 
         Returns:
             The rendered HTML.
@@ -501,7 +555,7 @@ class AppHandler:
             )
             self.initialize_sync()
 
-        needs_transform = self._spa_config is not None or page_data is not None
+        needs_transform = self._spa_config is not None or page_data is not None or ssr_body is not None or ssr_head
         if not needs_transform:
             if self._config.is_dev_mode and self._config.hot_reload:
                 return self._get_dev_html_sync()
@@ -513,11 +567,50 @@ class AppHandler:
                 url_value = page_data.get("url")
                 if isinstance(url_value, str) and url_value:
                     page_url = url_value
-            html = self._get_dev_html_sync(page_url)
-            return self._transform_html(html, page_data, csrf_token)
+            template = HtmlTemplate(self._get_dev_html_sync(page_url), self._app_selector)
+        else:
+            template = self._index_template()
+        return self._render_template(template, page_data, csrf_token, ssr_body=ssr_body, ssr_head=ssr_head)
+
+    def get_html_bytes_sync(
+        self,
+        *,
+        page_json: "bytes | None" = None,
+        page_url: "str | None" = None,
+        csrf_token: "str | None" = None,
+        ssr_body: "str | None" = None,
+        ssr_head: str = "",
+    ) -> bytes:
+        """Get the HTML for the SPA synchronously, as UTF-8 bytes.
+
+        Unlike :meth:`get_html_sync`, page data is passed pre-serialized and spliced into the
+        encoded template without being decoded, so large payloads are not copied between
+        ``str`` and ``bytes``.
+
+        Args:
+            page_json: Optional UTF-8 encoded page data JSON (e.g., Inertia page props).
+            page_url: Optional page URL, used to render the dev server HTML for that page.
+            csrf_token: Optional CSRF token to inject.
+            ssr_body: Optional server-rendered HTML replacing the app element.
+            ssr_head: Optional server-rendered HTML injected into ``<head>``.
+
+        Returns:
+            The rendered HTML bytes.
+        """
+        if not self._initialized:
+            logger.warning(
+                "AppHandler lazy init triggered - lifespan may not have run. "
+                "Consider calling initialize_sync() explicitly during app startup."
+            )
+            self.initialize_sync()
 
-        base_html = self._cached_html or ""
-        return self._transform_html(base_html, page_data, csrf_token)
+        if self._config.is_dev_mode and self._config.hot_reload:
+            template = HtmlTemplate(self._get_dev_html_sync(page_url), self._app_selector)
+        else:
+            template = self._index_template()
+        return template.render_bytes(
+            page_data=page_json, ssr_body=ssr_body, ssr_head=ssr_head, **self._render_options(csrf_token)
+        )
 
     async def get_bytes(self) -> bytes:
         """Get cached index.html bytes (production).
@@ -6,7 +6,8 @@ from typing import TYPE_CHECKING, Any, cast
 from litestar import Response
 from litestar.exceptions import ImproperlyConfiguredException, NotFoundException
 
-from litestar_vite.plugin import is_litestar_route
+from litestar_vite.plugin import VitePlugin, is_litestar_route
+from litestar_vite.plugin._utils import send_early_hints
 
 if TYPE_CHECKING:
     from litestar.connection import Request
@@ -127,5 +128,27 @@ async def spa_handler_prod(request: "Request[Any, Any, Any]") -> Response[bytes]
         HTML bytes response from the cached SPA handler.
     """
     spa_handler = _resolve_spa_route(request)
+    headers = await _preload_headers(request)
     body = await spa_handler.get_bytes()
-    return Response(content=body, status_code=200, media_type=_HTML_MEDIA_TYPE)
+    return Response(content=body, status_code=200, media_type=_HTML_MEDIA_TYPE, headers=headers)
+
+
+async def _preload_headers(request: "Request[Any, Any, Any]") -> "dict[str, str] | None":
+    """Send early hints and build the ``Link`` preload header for an SPA response.
+
+    Returns:
+        A headers mapping carrying the ``Link`` header, or None when preloading is disabled.
+    """
+    try:
+        vite_plugin = request.app.plugins.get(VitePlugin)
+    except KeyError:
+        return None
+    runtime = vite_plugin.config.runtime
+    if not (runtime.preload_headers or runtime.early_hints):
+        return None
+    links = vite_plugin.asset_loader.preload_links()
+    if runtime.early_hints:
+        await send_early_hints(request.scope, request.send, links)
+    if runtime.preload_headers and links:
+        return {"Link": ", ".join(links)}
+    return None
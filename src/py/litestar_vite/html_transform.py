@@ -5,9 +5,11 @@ Regex patterns are compiled once at import time for performance.
 
 import re
 from functools import lru_cache, partial
+from itertools import pairwise
 from typing import Any
 
 __all__ = (
+    "HtmlTemplate",
     "inject_head_html",
     "inject_head_script",
     "inject_page_script",
@@ -138,6 +140,57 @@ def _replace_outer_html_replacer(match: re.Match[str], *, content: str) -> str:
     return content
 
 
+def _head_script_tag(script: str, *, escape: bool = True, nonce: str | None = None) -> str:
+    """Build the ``<script>`` tag inserted by :func:`inject_head_script`.
+
+    Returns:
+        The script tag, terminated by a newline.
+    """
+    if escape:
+        script = _escape_script(script)
+
+    nonce_attr = f' nonce="{_escape_attr(nonce)}"' if nonce else ""
+    return f"<script{nonce_attr}>{script}</script>\n"
+
+
+def _page_script_open(app_id: str, nonce: str | None, script_id: str) -> str:
+    """Build the opening tag of the JSON page-data ``<script>`` element.
+
+    Returns:
+        The opening ``<script type="application/json">`` tag.
+    """
+    nonce_attr = f' nonce="{_escape_attr(nonce)}"' if nonce else ""
+    return f'<script type="application/json" id="{script_id}" data-page="{_escape_attr(app_id)}"{nonce_attr}>'
+
+
+def _page_script_tag(json_data: str, *, app_id: str, nonce: str | None, script_id: str) -> str:
+    """Build the JSON page-data ``<script>`` element inserted by :func:`inject_page_script`.
+
+    Returns:
+        The script element, terminated by a newline.
+    """
+    # Escape sequences that could break out of script element
+    # Replace </ with <\/ to prevent premature tag closure (XSS prevention)
+    escaped_json = json_data.replace("</", r"<\/")
+    return f"{_page_script_open(app_id, nonce, script_id)}{escaped_json}</script>\n"
+
+
+def _escape_attr_bytes(value: bytes) -> bytes:
+    """Escape an encoded attribute value, mirroring :func:`_escape_attr`.
+
+    Returns:
+        The escaped value safe for use in HTML attribute values.
+    """
+    return (
+        value
+        .replace(b"&", b"&amp;")
+        .replace(b'"', b"&quot;")
+        .replace(b"'", b"&#39;")
+        .replace(b"<", b"&lt;")
+        .replace(b">", b"&gt;")
+    )
+
+
 def inject_head_script(html: str, script: str, *, escape: bool = True, nonce: str | None = None) -> str:
     """Inject a script tag before the closing </head> tag.
 
@@ -159,11 +212,7 @@ def inject_head_script(html: str, script: str, *, escape: bool = True, nonce: st
     if not script:
         return html
 
-    if escape:
-        script = _escape_script(script)
-
-    nonce_attr = f' nonce="{_escape_attr(nonce)}"' if nonce else ""
-    script_tag = f"<script{nonce_attr}>{script}</script>\n"
+    script_tag = _head_script_tag(script, escape=escape, nonce=nonce)
 
     head_end_match = _HEAD_END_PATTERN.search(html)
     if head_end_match:
@@ -308,15 +357,7 @@ def inject_page_script(
     if not json_data:
         return html
 
-    # Escape sequences that could break out of script element
-    # Replace </ with <\/ to prevent premature tag closure (XSS prevention)
-    escaped_json = json_data.replace("</", r"<\/")
-
-    nonce_attr = f' nonce="{_escape_attr(nonce)}"' if nonce else ""
-    script_tag = (
-        f'<script type="application/json" id="{script_id}" data-page="{_escape_attr(app_id)}"{nonce_attr}>'
-        f"{escaped_json}</script>\n"
-    )
+    script_tag = _page_script_tag(json_data, app_id=app_id, nonce=nonce, script_id=script_id)
 
     body_end_match = _BODY_END_PATTERN.search(html)
     if body_end_match:
@@ -512,3 +553,258 @@ def transform_asset_urls(
     html = _SCRIPT_SRC_PATTERN.sub(replace_script_src, html)
 
     return _LINK_HREF_PATTERN.sub(replace_link_href, html)
+
+
+class HtmlTemplate:
+    """An HTML document pre-split at its SPA injection points.
+
+    The regex searches done by :func:`inject_head_script`, :func:`set_data_attribute`,
+    :func:`inject_page_script`, :func:`replace_element_outer_html` and :func:`inject_head_html`
+    run once, when the template is built. Rendering only joins the static slices of the
+    document with the per-request fragments, and produces the same HTML as chaining those
+    functions over the document. :meth:`render_bytes` does the same on a UTF-8 encoded copy
+    of the document, so pre-serialized JSON can be spliced in without decoding it.
+
+    Args:
+        html: The HTML document.
+        selector: The app element selector (``#id`` or an element name).
+        attr: The attribute that carries page data when no script element is used.
+
+    Raises:
+        ValueError: If ``selector`` or ``attr`` is invalid.
+    """
+
+    __slots__ = (
+        "_attr_spans",
+        "_body_end",
+        "_byte_offsets",
+        "_element_span",
+        "_head_end",
+        "attr",
+        "html",
+        "html_bytes",
+        "selector",
+    )
+
+    def __init__(self, html: str, selector: str = "#app", attr: str = "data-page") -> None:
+        if not _VALID_SELECTOR_RE.match(selector):
+            msg = f"Invalid selector: {selector!r}. Must be an alphanumeric ID (#id) or element name."
+            raise ValueError(msg)
+        if not _VALID_ATTR_RE.match(attr):
+            msg = f"Invalid attribute name: {attr!r}. Must be an alphanumeric attribute name."
+            raise ValueError(msg)
+
+        self.html = html
+        self.html_bytes = html.encode("utf-8")
+        self.selector = selector
+        self.attr = attr
+
+        head_end_match = _HEAD_END_PATTERN.search(html) or _HTML_END_PATTERN.search(html)
+        self._head_end = head_end_match.start() if head_end_match else None
+        body_end_match = _BODY_END_PATTERN.search(html)
+        self._body_end = body_end_match.start() if body_end_match else None
+
+        self._attr_spans: tuple[tuple[int, int, str], ...] = ()
+        if selector.startswith("#"):
+            opening_match = _get_id_selector_pattern(selector[1:]).search(html)
+        else:
+            opening_match = _get_element_selector_pattern(selector.lower()).search(html)
+        if opening_match is not None:
+            offset = opening_match.start(1)
+            opening = opening_match.group(1)
+            existing = [(offset + m.start(), offset + m.end(), "") for m in _get_attr_pattern(attr).finditer(opening)]
+            self._attr_spans = tuple(existing) or ((offset + len(opening.rstrip()), opening_match.end(1), " "),)
+
+        self._element_span: tuple[int, int] | None = None
+        if selector.startswith("#"):
+            element_match = _get_id_element_with_content_pattern(selector[1:]).search(html)
+            if element_match is not None:
+                self._element_span = element_match.span()
+
+        positions = {len(html), *(pos for span in self._attr_spans for pos in span[:2])}
+        positions.update(pos for pos in (self._head_end, self._body_end) if pos is not None)
+        positions.update(self._element_span or ())
+        self._byte_offsets = {pos: len(html[:pos].encode("utf-8")) for pos in positions}
+
+    def render(
+        self,
+        *,
+        head_script: str = "",
+        escape: bool = True,
+        nonce: str | None = None,
+        page_data: str | None = None,
+        use_script_element: bool = False,
+        app_id: str = "app",
+        ssr_body: str | None = None,
+        ssr_head: str = "",
+    ) -> str:
+        """Render the document with the given per-request fragments.
+
+        Args:
+            head_script: JavaScript injected before ``</head>`` (see :func:`inject_head_script`).
+            escape: Whether to escape ``head_script``.
+            nonce: Optional CSP nonce for injected ``<script>`` tags.
+            page_data: Pre-serialized page JSON, set as the ``attr`` attribute of the app element,
+                or injected as a script element when ``use_script_element`` is set.
+            use_script_element: Inject ``page_data`` with :func:`inject_page_script` semantics.
+            app_id: The app element ID referenced by the page-data script element.
+            ssr_body: HTML replacing the app element (see :func:`replace_element_outer_html`).
+            ssr_head: Raw HTML injected into ``<head>`` after ``head_script``.
+
+        Returns:
+            The rendered HTML.
+        """
+        if self._needs_sequential_ssr(ssr_body, ssr_head):
+            html = self.render(
+                head_script=head_script,
+                escape=escape,
+                nonce=nonce,
+                page_data=page_data,
+                use_script_element=use_script_element,
+                app_id=app_id,
+                ssr_body=ssr_body,
+            )
+            return inject_head_html(html, ssr_head)
+
+        edits = self._edits(head_script, escape, nonce, page_data, use_script_element, app_id, ssr_body, ssr_head)
+        parts: list[str] = []
+        position = 0
+        for start, end, pieces in edits:
+            parts.append(self.html[position:start])
+            parts.extend(piece if isinstance(piece, str) else piece.decode("utf-8") for piece in pieces)
+            position = end
+        parts.append(self.html[position:])
+        return "".join(parts)
+
+    def render_bytes(
+        self,
+        *,
+        head_script: str = "",
+        escape: bool = True,
+        nonce: str | None = None,
+        page_data: bytes | None = None,
+        use_script_element: bool = False,
+        app_id: str = "app",
+        ssr_body: str | None = None,
+        ssr_head: str = "",
+    ) -> bytes:
+        """Render the document as UTF-8 bytes.
+
+        Takes the same arguments as :meth:`render`, except that ``page_data`` is UTF-8 encoded
+        JSON (e.g. the output of ``encode_json``). It is escaped and spliced in as bytes.
+
+        Returns:
+            The rendered HTML, encoded as UTF-8.
+        """
+        if self._needs_sequential_ssr(ssr_body, ssr_head):
+            html = self.render(
+                head_script=head_script,
+                escape=escape,
+                nonce=nonce,
+                page_data=page_data.decode("utf-8") if page_data is not None else None,
+                use_script_element=use_script_element,
+                app_id=app_id,
+                ssr_body=ssr_body,
+            )
+            return inject_head_html(html, ssr_head).encode("utf-8")
+
+        edits = self._edits(head_script, escape, nonce, page_data, use_script_element, app_id, ssr_body, ssr_head)
+        parts: list[bytes] = []
+        position = 0
+        for start, end, pieces in edits:
+            parts.append(self.html_bytes[position : self._byte_offsets[start]])
+            parts.extend(piece.encode("utf-8") if isinstance(piece, str) else piece for piece in pieces)
+            position = self._byte_offsets[end]
+        parts.append(self.html_bytes[position:])
+        return b"".join(parts)
+
+    def _needs_sequential_ssr(self, ssr_body: str | None, ssr_head: str) -> bool:
+        """Whether SSR head HTML must be located after the SSR body has been swapped in.
+
+        The head insertion point can only be precomputed when it sits before the app element;
+        otherwise the SSR body itself may contain the closing tag that is searched for.
+
+        Returns:
+            True when the SSR head has to be injected with :func:`inject_head_html`.
+        """
+        return (
+            ssr_body is not None
+            and bool(ssr_head)
+            and self._element_span is not None
+            and (self._head_end is None or self._head_end >= self._element_span[0])
+        )
+
+    def _edits(
+        self,
+        head_script: str,
+        escape: bool,
+        nonce: str | None,
+        page_data: str | bytes | None,
+        use_script_element: bool,
+        app_id: str,
+        ssr_body: str | None,
+        ssr_head: str,
+    ) -> list[tuple[int, int, tuple[str | bytes, ...]]]:
+        """Collect the ``(start, end, pieces)`` replacements for a render, ordered by position.
+
+        When ``ssr_body`` replaces the app element, attribute-mode ``page_data`` is set on the
+        replacement's app element instead of the template's.
+
+        Returns:
+            The replacements, in document (character) positions.
+
+        Raises:
+            ValueError: If two replacements overlap.
+        """
+        end_of_document = len(self.html)
+        edits: list[tuple[int, int, tuple[str | bytes, ...]]] = []
+
+        script_tag = _head_script_tag(head_script, escape=escape, nonce=nonce) if head_script else ""
+        if script_tag or ssr_head:
+            if self._head_end is not None:
+                edits.append((self._head_end, self._head_end, (script_tag, ssr_head + "\n" if ssr_head else "")))
+            else:
+                edits.append((
+                    end_of_document,
+                    end_of_document,
+                    ("\n" + script_tag if script_tag else "", "\n" + ssr_head if ssr_head else ""),
+                ))
+
+        if page_data and use_script_element:
+            # Replace </ with <\/ to prevent premature tag closure (XSS prevention)
+            if isinstance(page_data, bytes):
+                escaped_json: str | bytes = page_data.replace(b"</", rb"<\/")
+            else:
+                escaped_json = page_data.replace("</", r"<\/")
+            pieces = (_page_script_open(app_id, nonce, "app_page"), escaped_json, "</script>\n")
+            if self._body_end is not None:
+                edits.append((self._body_end, self._body_end, pieces))
+            else:
+                edits.append((end_of_document, end_of_document, ("\n", *pieces)))
+        elif page_data is not None and ssr_body is not None and self._replaces_attr_spans():
+            value = page_data.decode("utf-8") if isinstance(page_data, bytes) else page_data
+            ssr_body = set_data_attribute(ssr_body, self.selector, self.attr, value)
+        elif page_data is not None and not use_script_element:
+            escaped = _escape_attr_bytes(page_data) if isinstance(page_data, bytes) else _escape_attr(page_data)
+            edits.extend((start, end, (f'{lead}{self.attr}="', escaped, '"')) for start, end, lead in self._attr_spans)
+
+        if ssr_body is not None and self._element_span is not None:
+            edits.append((*self._element_span, (ssr_body,)))
+
+        edits.sort(key=lambda edit: edit[0])
+        for previous, current in pairwise(edits):
+            if current[0] < previous[1]:
+                msg = f"Overlapping HTML edits at positions {previous[0]}-{previous[1]} and {current[0]}-{current[1]}."
+                raise ValueError(msg)
+        return edits
+
+    def _replaces_attr_spans(self) -> bool:
+        """Whether the app element replaced by an SSR body contains the page-data attribute spans.
+
+        Returns:
+            True when the attribute edits fall inside the replaced element.
+        """
+        if self._element_span is None or not self._attr_spans:
+            return False
+        start, end = self._element_span
+        return all(start <= span_start and span_end <= end for span_start, span_end, _ in self._attr_spans)
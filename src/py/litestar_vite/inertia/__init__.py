@@ -5,6 +5,7 @@ from litestar_vite.inertia.helpers import (
     AlwaysProp,
     OnceProp,
     OptionalProp,
+    PropCache,
     PropFilter,
     always,
     clear_history,
@@ -15,6 +16,7 @@ from litestar_vite.inertia.helpers import (
     extract_merge_props,
     extract_once_props,
     flash,
+    get_prop_timings,
     get_shared_props,
     lazy,
     merge,
@@ -50,6 +52,7 @@ __all__ = (
     "OnceProp",
     "OptionalProp",
     "PrecognitionResponse",
+    "PropCache",
     "PropFilter",
     "always",
     "clear_history",
@@ -63,6 +66,7 @@ __all__ = (
     "extract_merge_props",
     "extract_once_props",
     "flash",
+    "get_prop_timings",
     "get_shared_props",
     "helpers",
     "lazy",
@@ -1,10 +1,14 @@
 import inspect
+import logging
+import time
 import warnings
 from collections import defaultdict
 from collections.abc import Callable, Coroutine, Iterable, Iterator, Mapping
 from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING, Any, Generic, Literal, TypeGuard, TypeVar, cast, overload
 
+import anyio
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.utils.empty import value_or_default
 from litestar.utils.scope.state import ScopeState
@@ -24,6 +28,8 @@ from litestar_vite.inertia.state import (
 from litestar_vite.inertia.types import ScrollPropsConfig
 
 if TYPE_CHECKING:
+    from anyio import CapacityLimiter
+    from anyio.abc import TaskGroup
     from litestar.connection import ASGIConnection
 
     from litestar_vite.inertia.plugin import InertiaPlugin
@@ -40,22 +46,33 @@ StaticT = TypeVar("StaticT", bound=object)
 
 DEFAULT_DEFERRED_GROUP = "default"
 
+logger = logging.getLogger("litestar_vite")
+
+_PROP_TIMINGS_SCOPE_KEY = "_litestar_vite_prop_timings"
+
 
 @overload
-def lazy(key: str, value_or_callable: "None" = None) -> "StaticProp[str, None]": ...  # pyright: ignore[reportOverlappingOverload]
+def lazy(  # pyright: ignore[reportOverlappingOverload]
+    key: str, value_or_callable: "None" = None, *, sync_to_thread: "bool | None" = None
+) -> "StaticProp[str, None]": ...
 
 
 @overload
-def lazy(key: str, value_or_callable: "T") -> "StaticProp[str, T]": ...
+def lazy(key: str, value_or_callable: "T", *, sync_to_thread: "bool | None" = None) -> "StaticProp[str, T]": ...
 
 
 @overload
-def lazy(key: str, value_or_callable: "Callable[..., None]" = ...) -> "DeferredProp[str, None]": ...
+def lazy(
+    key: str, value_or_callable: "Callable[..., None]" = ..., *, sync_to_thread: "bool | None" = None
+) -> "DeferredProp[str, None]": ...
 
 
 @overload
 def lazy(
-    key: str, value_or_callable: "Callable[..., Coroutine[Any, Any, None]]" = ...
+    key: str,
+    value_or_callable: "Callable[..., Coroutine[Any, Any, None]]" = ...,
+    *,
+    sync_to_thread: "bool | None" = None,
 ) -> "DeferredProp[str, None]": ...
 
 
@@ -63,12 +80,16 @@ def lazy(
 def lazy(
     key: str,
     value_or_callable: "Callable[..., T | Coroutine[Any, Any, T]]" = ...,  # pyright: ignore[reportInvalidTypeVarUse]
+    *,
+    sync_to_thread: "bool | None" = None,
 ) -> "DeferredProp[str, T]": ...
 
 
 def lazy(
     key: str,
     value_or_callable: "T | Callable[..., Coroutine[Any, Any, None]] | Callable[..., T] | Callable[..., T | Coroutine[Any, Any, T]] | None" = None,
+    *,
+    sync_to_thread: "bool | None" = None,
 ) -> "StaticProp[str, None] | StaticProp[str, T] | DeferredProp[str, T] | DeferredProp[str, None]":
     """Create a lazy prop only included during partial reloads.
 
@@ -109,6 +130,8 @@ def lazy(
         value_or_callable: Either a static value (computed eagerly, sent lazily)
             or a callable (computed and sent lazily). If None, creates a lazy
             prop with None value.
+        sync_to_thread: Run a sync callable in a worker thread during the async
+            pre-pass. ``None`` follows ``InertiaConfig.sync_props_to_thread``.
 
     Returns:
         StaticProp if value_or_callable is not callable, DeferredProp otherwise.
@@ -137,11 +160,20 @@ def lazy(
     if not callable(value_or_callable):
         return StaticProp[str, T](key=key, value=value_or_callable)
 
-    return DeferredProp[str, T](key=key, value=cast("Callable[..., T | Coroutine[Any, Any, T]]", value_or_callable))
+    return DeferredProp[str, T](
+        key=key,
+        value=cast("Callable[..., T | Coroutine[Any, Any, T]]", value_or_callable),
+        sync_to_thread=sync_to_thread,
+    )
 
 
 def defer(
-    key: str, callback: "Callable[..., T | Coroutine[Any, Any, T]]", group: str = DEFAULT_DEFERRED_GROUP
+    key: str,
+    callback: "Callable[..., T | Coroutine[Any, Any, T]]",
+    group: str = DEFAULT_DEFERRED_GROUP,
+    *,
+    sync_to_thread: "bool | None" = None,
+    cache: "PropCache | bool | None" = None,
 ) -> "DeferredProp[str, T]":
     """Create a deferred prop with optional grouping (v2 feature).
 
@@ -152,6 +184,10 @@ def defer(
         key: The key to store the value under.
         callback: A callable (sync or async) that returns the value.
         group: The group name for batched loading. Defaults to "default".
+        sync_to_thread: Run a sync callback in a worker thread during the async
+            pre-pass. ``None`` follows ``InertiaConfig.sync_props_to_thread``.
+        cache: Cache the resolved value server-side (see :class:`PropCache`).
+            ``True`` uses the defaults of ``InertiaConfig.prop_cache``.
 
     Returns:
         A DeferredProp instance.
@@ -165,11 +201,20 @@ def defer(
 
         # Chain with .once() for lazy + cached behavior
         defer("stats", lambda: compute_expensive_stats()).once()
+
+        # Compute once per user every 10 minutes, across requests
+        defer("stats", compute_stats, cache=PropCache(ttl=600, key=lambda r: str(r.user.id)))
     """
-    return DeferredProp[str, T](key=key, value=callback, group=group)
+    return DeferredProp[str, T](key=key, value=callback, group=group, sync_to_thread=sync_to_thread, cache=cache)
 
 
-def once(key: str, value_or_callable: "T | Callable[..., T | Coroutine[Any, Any, T]]") -> "OnceProp[str, T]":
+def once(
+    key: str,
+    value_or_callable: "T | Callable[..., T | Coroutine[Any, Any, T]]",
+    *,
+    sync_to_thread: "bool | None" = None,
+    cache: "PropCache | bool | None" = None,
+) -> "OnceProp[str, T]":
     """Create a prop that resolves once and is cached client-side (v2.2.20+ feature).
 
     Once props are included in the initial page load and resolved immediately.
@@ -188,6 +233,11 @@ def once(key: str, value_or_callable: "T | Callable[..., T | Coroutine[Any, Any,
     Args:
         key: The key to store the value under.
         value_or_callable: Either a static value or a callable that returns the value.
+        sync_to_thread: Run a sync callable in a worker thread during the async
+            pre-pass. ``None`` follows ``InertiaConfig.sync_props_to_thread``.
+        cache: Also cache the resolved value server-side, so new visitors, tabs and
+            users don't re-run the callable (see :class:`PropCache`). ``True`` uses
+            the defaults of ``InertiaConfig.prop_cache``.
 
     Returns:
         An OnceProp instance.
@@ -202,16 +252,19 @@ def once(key: str, value_or_callable: "T | Callable[..., T | Coroutine[Any, Any,
                 "user": current_user,
                 "settings": once("settings", lambda: Settings.for_user(user_id)),
                 "feature_flags": once("feature_flags", get_feature_flags()),
+                "config": once("config", load_site_config, cache=True),
             })
 
     See Also:
         - :func:`defer`: For deferred props that support ``.once()`` chaining
         - Inertia.js once props: https://inertiajs.com/partial-reloads#once
     """
-    return OnceProp[str, T](key=key, value=value_or_callable)
+    return OnceProp[str, T](key=key, value=value_or_callable, sync_to_thread=sync_to_thread, cache=cache)
 
 
-def optional(key: str, callback: "Callable[..., T | Coroutine[Any, Any, T]]") -> "OptionalProp[str, T]":
+def optional(
+    key: str, callback: "Callable[..., T | Coroutine[Any, Any, T]]", *, sync_to_thread: "bool | None" = None
+) -> "OptionalProp[str, T]":
     """Create a prop only included when explicitly requested (v2 feature).
 
     Optional props are NEVER included in initial page loads or standard
@@ -228,6 +281,8 @@ def optional(key: str, callback: "Callable[..., T | Coroutine[Any, Any, T]]") ->
     Args:
         key: The key to store the value under.
         callback: A callable (sync or async) that returns the value.
+        sync_to_thread: Run a sync callback in a worker thread during the async
+            pre-pass. ``None`` follows ``InertiaConfig.sync_props_to_thread``.
 
     Returns:
         An OptionalProp instance.
@@ -259,7 +314,7 @@ def optional(key: str, callback: "Callable[..., T | Coroutine[Any, Any, T]]") ->
     See Also:
         - Inertia.js WhenVisible: https://inertiajs.com/load-when-visible
     """
-    return OptionalProp[str, T](key=key, callback=callback)
+    return OptionalProp[str, T](key=key, callback=callback, sync_to_thread=sync_to_thread)
 
 
 def always(key: str, value: "T") -> "AlwaysProp[str, T]":
@@ -302,6 +357,35 @@ def always(key: str, value: "T") -> "AlwaysProp[str, T]":
     return AlwaysProp[str, T](key=key, value=value)
 
 
+@dataclass
+class PropCache:
+    """Server-side caching options for a ``once()`` or ``defer()`` prop.
+
+    The resolved value is stored in the prop cache configured by
+    ``InertiaConfig.prop_cache`` and reused by later requests until it expires,
+    so the callback does not run again for every visitor.
+
+    Attributes:
+        ttl: Seconds the value stays cached. ``None`` uses ``InertiaPropCacheConfig.default_ttl``.
+        key: Callable returning a cache key suffix for the current request, e.g.
+            ``lambda request: str(request.user.id)`` for per-user values. ``None``
+            shares one value between **all users** of the route, so it must be set
+            for anything that depends on the user or session.
+
+    Values are always scoped to the route handler and the prop's callback, so props
+    with the same name on different pages never share an entry.
+    """
+
+    ttl: "int | None" = None
+    key: "Callable[[ASGIConnection[Any, Any, Any, Any]], str] | None" = None
+
+
+def _normalize_prop_cache(cache: "PropCache | bool | None") -> "PropCache | None":
+    if cache is False or cache is None:
+        return None
+    return PropCache() if cache is True else cache
+
+
 @dataclass
 class PropFilter:
     """Configuration for prop filtering during partial reloads.
@@ -634,11 +718,15 @@ class DeferredProp(Generic[PropKeyT, T]):
         value: "Callable[..., T | Coroutine[Any, Any, T] | None] | None" = None,
         group: str = DEFAULT_DEFERRED_GROUP,
         is_once: bool = False,
+        sync_to_thread: "bool | None" = None,
+        cache: "PropCache | bool | None" = None,
     ) -> None:
         self._key = key
         self._value = value
         self._group = group
         self._is_once = is_once
+        self._sync_to_thread = sync_to_thread
+        self._cache = _normalize_prop_cache(cache)
         self._evaluated = False
         self._result: "T | None" = None
 
@@ -664,6 +752,24 @@ class DeferredProp(Generic[PropKeyT, T]):
         """
         return self._is_once
 
+    @property
+    def sync_to_thread(self) -> "bool | None":
+        """Whether a sync callback runs in a worker thread (``None`` follows the config).
+
+        Returns:
+            The per-prop offload setting.
+        """
+        return self._sync_to_thread
+
+    @property
+    def cache(self) -> "PropCache | None":
+        """Server-side caching options, or ``None`` when the value is not cached.
+
+        Returns:
+            The per-prop cache options.
+        """
+        return self._cache
+
     def once(self) -> "DeferredProp[PropKeyT, T]":
         """Return a new DeferredProp with once behavior enabled.
 
@@ -679,7 +785,14 @@ class DeferredProp(Generic[PropKeyT, T]):
             # Combine defer with once for lazy + cached behavior
             defer("stats", lambda: compute_expensive_stats()).once()
         """
-        return DeferredProp[PropKeyT, T](key=self._key, value=self._value, group=self._group, is_once=True)
+        return DeferredProp[PropKeyT, T](
+            key=self._key,
+            value=self._value,
+            group=self._group,
+            is_once=True,
+            sync_to_thread=self._sync_to_thread,
+            cache=self._cache,
+        )
 
     def render(self) -> "T | None":
         if self._evaluated:
@@ -724,15 +837,25 @@ class OnceProp(Generic[PropKeyT, T]):
     request it again on future visits.
     """
 
-    def __init__(self, key: "PropKeyT", value: "T | Callable[..., T | Coroutine[Any, Any, T]]") -> None:
+    def __init__(
+        self,
+        key: "PropKeyT",
+        value: "T | Callable[..., T | Coroutine[Any, Any, T]]",
+        sync_to_thread: "bool | None" = None,
+        cache: "PropCache | bool | None" = None,
+    ) -> None:
         """Initialize a OnceProp.
 
         Args:
             key: The prop key.
             value: Either a static value or a callable that returns the value.
+            sync_to_thread: Run a sync callable in a worker thread during the async pre-pass.
+            cache: Server-side caching options for the resolved value.
         """
         self._key = key
         self._value = value
+        self._sync_to_thread = sync_to_thread
+        self._cache = _normalize_prop_cache(cache)
         self._evaluated = False
         self._result: "T | None" = None
 
@@ -740,6 +863,24 @@ class OnceProp(Generic[PropKeyT, T]):
     def key(self) -> "PropKeyT":
         return self._key
 
+    @property
+    def sync_to_thread(self) -> "bool | None":
+        """Whether a sync callback runs in a worker thread (``None`` follows the config).
+
+        Returns:
+            The per-prop offload setting.
+        """
+        return self._sync_to_thread
+
+    @property
+    def cache(self) -> "PropCache | None":
+        """Server-side caching options, or ``None`` when the value is not cached.
+
+        Returns:
+            The per-prop cache options.
+        """
+        return self._cache
+
     def render(self) -> "T | None":
         """Render the prop value, caching the result.
 
@@ -785,15 +926,22 @@ class OptionalProp(Generic[PropKeyT, T]):
     providing both bandwidth and CPU optimization.
     """
 
-    def __init__(self, key: "PropKeyT", callback: "Callable[..., T | Coroutine[Any, Any, T]]") -> None:
+    def __init__(
+        self,
+        key: "PropKeyT",
+        callback: "Callable[..., T | Coroutine[Any, Any, T]]",
+        sync_to_thread: "bool | None" = None,
+    ) -> None:
         """Initialize an OptionalProp.
 
         Args:
             key: The prop key.
             callback: A callable that returns the value when requested.
+            sync_to_thread: Run a sync callback in a worker thread during the async pre-pass.
         """
         self._key = key
         self._callback = callback
+        self._sync_to_thread = sync_to_thread
         self._evaluated = False
         self._result: "T | None" = None
 
@@ -801,6 +949,15 @@ class OptionalProp(Generic[PropKeyT, T]):
     def key(self) -> "PropKeyT":
         return self._key
 
+    @property
+    def sync_to_thread(self) -> "bool | None":
+        """Whether a sync callback runs in a worker thread (``None`` follows the config).
+
+        Returns:
+            The per-prop offload setting.
+        """
+        return self._sync_to_thread
+
     def render(self) -> "T | None":
         """Render the prop value, caching the result.
 
@@ -1220,7 +1377,7 @@ def lazy_render(  # noqa: PLR0911
     return cast("T", value)
 
 
-def has_unresolved_async_props(  # noqa: PLR0911
+def has_unresolved_async_props(
     value: "Any",
     *,
     partial_data: "set[str] | None" = None,
@@ -1259,6 +1416,11 @@ def has_unresolved_async_props(  # noqa: PLR0911
         )
     if not should_render(value, partial_data, partial_except, except_once_props, key=_key):
         return False
+    return _is_pending_async_prop(value)
+
+
+def _is_pending_async_prop(value: "Any") -> bool:
+    """Return ``True`` if ``value`` is a prop whose async callback hasn't been evaluated yet."""
     if is_optional_prop(value):
         return not value._evaluated and inspect.iscoroutinefunction(value._callback)  # pyright: ignore[reportPrivateUsage]
     if is_deferred_prop(value):
@@ -1323,6 +1485,214 @@ async def resolve_async_props(
     await _resolve_one(value, partial_data, partial_except, except_once_props, _key)
 
 
+async def resolve_async_props_concurrently(
+    *values: "Any",
+    partial_data: "set[str] | None" = None,
+    partial_except: "set[str] | None" = None,
+    except_once_props: "set[str] | None" = None,
+    limit: "int | None" = None,
+) -> None:
+    """Await the async prop callbacks found in ``values`` concurrently.
+
+    Selects exactly the props :func:`resolve_async_props` would evaluate (same
+    partial-reload filtering), then awaits their callbacks in one task group so the
+    total latency is that of the slowest callback rather than the sum.
+
+    If a callback raises, the remaining callbacks are cancelled and the first
+    exception (in prop order) is re-raised unchanged, so exception handlers see
+    the same error as with sequential resolution.
+
+    Args:
+        *values: The values to walk (typically shared props and the response content).
+        partial_data: ``X-Inertia-Partial-Data`` keys, when present.
+        partial_except: ``X-Inertia-Partial-Except`` keys (v2 protocol).
+        except_once_props: Once-prop keys cached client-side.
+        limit: Maximum number of callbacks awaited at once. ``None`` means unbounded.
+
+    Raises:
+        Exception: The first exception raised by a prop callback.
+    """
+    pending: "dict[int, Any]" = {}
+    for value in values:
+        _collect_props(value, partial_data, partial_except, except_once_props, None, pending, _is_pending_async_prop)
+    if not pending:
+        return
+    props = list(pending.values())
+    if len(props) == 1 or limit == 1:
+        for prop in props:
+            await prop.resolve_async()
+        return
+
+    limiter = anyio.CapacityLimiter(limit) if limit is not None else None
+    errors: "dict[int, Exception]" = {}
+
+    async def _resolve(index: int, prop: "Any", task_group: "TaskGroup") -> None:
+        try:
+            if limiter is None:
+                await prop.resolve_async()
+            else:
+                async with limiter:
+                    await prop.resolve_async()
+        except Exception as exc:  # noqa: BLE001
+            errors[index] = exc
+            task_group.cancel_scope.cancel()
+
+    async with anyio.create_task_group() as task_group:
+        for index, prop in enumerate(props):
+            task_group.start_soon(_resolve, index, prop, task_group)
+
+    if errors:
+        raise errors[min(errors)]
+
+
+async def resolve_sync_props_in_thread(
+    *values: "Any",
+    partial_data: "set[str] | None" = None,
+    partial_except: "set[str] | None" = None,
+    except_once_props: "set[str] | None" = None,
+    default: bool = False,
+    limiter: "CapacityLimiter | None" = None,
+) -> "dict[str, float]":
+    """Evaluate sync prop callbacks in worker threads instead of on the event loop.
+
+    Selects the props that will be rendered for this request (same partial-reload
+    filtering as :func:`resolve_async_props`) whose callback is synchronous and that
+    opt in to offloading, either per prop (``sync_to_thread=True``) or through
+    ``default``. Each callback runs via :func:`anyio.to_thread.run_sync`, one at a
+    time so callbacks sharing a non thread-safe resource stay serialized; the
+    cached result is then returned by the prop's ``render()``.
+
+    Args:
+        *values: The values to walk (typically shared props and the response content).
+        partial_data: ``X-Inertia-Partial-Data`` keys, when present.
+        partial_except: ``X-Inertia-Partial-Except`` keys (v2 protocol).
+        except_once_props: Once-prop keys cached client-side.
+        default: Offload sync callbacks of props that do not set ``sync_to_thread``.
+        limiter: Capacity limiter bounding the worker threads used. ``None`` uses
+            AnyIO's default thread limiter.
+
+    Returns:
+        Each offloaded prop's callback duration in seconds, keyed by prop key.
+    """
+    timings: "dict[str, float]" = {}
+    pending: "dict[int, Any]" = {}
+    predicate = partial(_is_pending_sync_prop, default=default)
+    for value in values:
+        _collect_props(value, partial_data, partial_except, except_once_props, None, pending, predicate)
+
+    for prop in pending.values():
+        started = time.perf_counter()
+        await anyio.to_thread.run_sync(prop.render, limiter=limiter)
+        elapsed = time.perf_counter() - started
+        timings[str(prop.key)] = elapsed
+        logger.debug("Resolved sync prop %r in a worker thread in %.2fms", prop.key, elapsed * 1000)
+    return timings
+
+
+def get_prop_timings(connection: "ASGIConnection[Any, Any, Any, Any]") -> "dict[str, float]":
+    """Return how long each offloaded sync prop callback took for this request.
+
+    Populated when sync callbacks run in worker threads (see
+    ``InertiaConfig.sync_props_to_thread``). Read it after the response has been
+    built, e.g. from an ``after_request`` hook, to export prop latency metrics.
+
+    Args:
+        connection: The current request.
+
+    Returns:
+        A mapping of prop key to callback duration in seconds.
+    """
+    scope = cast("dict[str, Any]", connection.scope)
+    return cast("dict[str, float]", scope.get(_PROP_TIMINGS_SCOPE_KEY, {}))
+
+
+def _is_pending_sync_prop(value: "Any", *, default: bool) -> bool:
+    """Return ``True`` if ``value`` is an unevaluated prop with a sync callback to offload."""
+    if is_optional_prop(value):
+        cb = value._callback  # pyright: ignore[reportPrivateUsage]
+    elif is_deferred_prop(value) or is_once_prop(value):
+        cb = value._value  # pyright: ignore[reportPrivateUsage]
+    else:
+        return False
+    if value._evaluated or not callable(cb) or inspect.iscoroutinefunction(cb):  # pyright: ignore[reportPrivateUsage]
+        return False
+    return default if value.sync_to_thread is None else value.sync_to_thread
+
+
+def _is_cacheable_prop(value: "Any") -> bool:
+    """Return ``True`` if ``value`` is an unevaluated prop with a callback and server-side caching enabled."""
+    if not (is_deferred_prop(value) or is_once_prop(value)) or value.cache is None:
+        return False
+    return not value._evaluated and callable(value._value)  # pyright: ignore[reportPrivateUsage]
+
+
+def collect_prop_opt_ins(
+    *values: "Any",
+    partial_data: "set[str] | None" = None,
+    partial_except: "set[str] | None" = None,
+    except_once_props: "set[str] | None" = None,
+) -> "tuple[bool, bool]":
+    """Report which per-prop opt-ins the props rendered for this request use.
+
+    One walk lets a response skip the cache and thread passes when none of its props
+    needs them.
+
+    Args:
+        *values: The values to walk (typically shared props and the response content).
+        partial_data: ``X-Inertia-Partial-Data`` keys, when present.
+        partial_except: ``X-Inertia-Partial-Except`` keys (v2 protocol).
+        except_once_props: Once-prop keys cached client-side.
+
+    Returns:
+        Whether any prop is cached server-side, and whether any sets ``sync_to_thread``.
+    """
+    opted_in: "dict[int, Any]" = {}
+    predicate = partial(_is_pending_sync_prop, default=False)
+    for value in values:
+        _collect_props(
+            value,
+            partial_data,
+            partial_except,
+            except_once_props,
+            None,
+            opted_in,
+            lambda prop: _is_cacheable_prop(prop) or predicate(prop),
+        )
+    props = opted_in.values()
+    return any(_is_cacheable_prop(prop) for prop in props), any(predicate(prop) for prop in props)
+
+
+def _collect_props(
+    value: "Any",
+    partial_data: "set[str] | None",
+    partial_except: "set[str] | None",
+    except_once_props: "set[str] | None",
+    key: "str | None",
+    into: "dict[int, Any]",
+    predicate: "Callable[[Any], bool]",
+) -> None:
+    """Collect the props selected by ``predicate`` that will be rendered, keyed by identity.
+
+    Walks ``value`` exactly like :func:`resolve_async_props`.
+    """
+    if isinstance(value, Mapping):
+        for k, v in cast("Mapping[str, Any]", value).items():
+            child_key = _join_prop_path((str(k),)) if key is None else f"{key}.{k}"
+            if not isinstance(v, Mapping) and not should_render(
+                v, partial_data, partial_except, except_once_props, key=child_key
+            ):
+                continue
+            _collect_props(v, partial_data, partial_except, except_once_props, child_key, into, predicate)
+        return
+    if isinstance(value, (list, tuple)):
+        for v in cast("Iterable[Any]", value):
+            if should_render(v, partial_data, partial_except, except_once_props):
+                _collect_props(v, partial_data, partial_except, except_once_props, None, into, predicate)
+        return
+    if predicate(value):
+        into.setdefault(id(value), value)
+
+
 def get_raw_shared_props(request: "ASGIConnection[Any, Any, Any, Any]") -> "Mapping[str, Any]":
     """Return the unrendered shared props stored on the request session.
 
@@ -1,12 +1,14 @@
 from contextvars import ContextVar
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 from litestar.middleware import AbstractMiddleware
 from litestar.types import Receive, Scope, Send
 
+from litestar_vite.inertia.plugin import InertiaPlugin, _handler_supports_inertia  # pyright: ignore[reportPrivateUsage]
 from litestar_vite.inertia.request import InertiaRequest
 from litestar_vite.inertia.response import InertiaExternalRedirect
 from litestar_vite.plugin import VitePlugin
+from litestar_vite.plugin._utils import send_early_hints
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -24,6 +26,7 @@ class InertiaMiddleware(AbstractMiddleware):
     1. Detects version mismatches between client and server assets
     2. Returns 409 Conflict with X-Inertia-Location header when versions differ
     3. Triggers client-side hard refresh to reload the updated assets
+    4. Sends ``103 Early Hints`` for first-load page requests when enabled
     """
 
     def __init__(self, app: "ASGIApp") -> None:
@@ -38,6 +41,7 @@ class InertiaMiddleware(AbstractMiddleware):
         token = _current_inertia_scope.set(scope)
         try:
             if not _is_inertia_request(scope["headers"]):
+                await _send_page_early_hints(scope, send)
                 await self.app(scope, receive, send)
                 return
 
@@ -58,6 +62,29 @@ def get_current_inertia_request() -> "InertiaRequest[Any, Any, Any] | None":
     return InertiaRequest(scope=scope) if scope is not None else None
 
 
+async def _send_page_early_hints(scope: "Scope", send: "Send") -> None:
+    """Announce the manifest preload links before an Inertia page handler resolves its props.
+
+    Only first-load ``GET`` requests to Inertia page routes qualify, and only when
+    ``RuntimeConfig.early_hints`` is enabled and the server supports the extension.
+    """
+    values = cast("dict[str, Any]", scope)
+    if values["method"] != "GET" or "http.response.early_hint" not in (values.get("extensions") or {}):
+        return
+    app = scope["litestar_app"]
+    route_handler = scope["route_handler"]
+    try:
+        vite_plugin = app.plugins.get(VitePlugin)
+        inertia_plugin = app.plugins.get(InertiaPlugin)
+    except KeyError:
+        return
+    if not vite_plugin.config.runtime.early_hints:
+        return
+    if not _handler_supports_inertia(route_handler, component_opt_keys=inertia_plugin.config.component_opt_keys):  # pyright: ignore[reportArgumentType]
+        return
+    await send_early_hints(scope, send, vite_plugin.asset_loader.preload_links())
+
+
 def _is_inertia_request(scope_headers: "Iterable[tuple[bytes, bytes]]") -> bool:
     """Return ``True`` when this request explicitly identifies as an Inertia request."""
     return any(key == b"x-inertia" and value == b"true" for key, value in scope_headers)
@@ -5,6 +5,7 @@ from contextlib import asynccontextmanager
 from dataclasses import fields, is_dataclass
 from typing import TYPE_CHECKING, Any, cast
 
+import anyio
 import httpx
 import msgspec
 from litestar.handlers.http_handlers.base import HTTPRouteHandler
@@ -16,8 +17,12 @@ if TYPE_CHECKING:
 
     from litestar import Litestar, Request
     from litestar.config.app import AppConfig
+    from litestar.stores.base import Store
 
-    from litestar_vite.config import InertiaConfig
+    from litestar_vite.config import InertiaConfig, InertiaSSRConfig
+    from litestar_vite.inertia.response import _SSRFlight  # pyright: ignore[reportPrivateUsage]
+    from litestar_vite.inertia.ssr_breaker import SSRCircuitBreaker
+    from litestar_vite.inertia.ssr_pool import SSRWorkerPool
 
 
 class InertiaPlugin(InitPlugin):
@@ -55,12 +60,27 @@ class InertiaPlugin(InitPlugin):
         )
     """
 
-    __slots__ = ("_ssr_client", "config")
+    __slots__ = (
+        "_prop_cache_store",
+        "_prop_thread_limiter",
+        "_ssr_breaker",
+        "_ssr_cache_store",
+        "_ssr_client",
+        "_ssr_pool",
+        "config",
+        "ssr_inflight",
+    )
 
     def __init__(self, config: "InertiaConfig") -> "None":
         """Initialize the plugin with Inertia configuration."""
         self.config = config
         self._ssr_client: "httpx.AsyncClient | None" = None
+        self._prop_thread_limiter: "anyio.CapacityLimiter | None" = None
+        self._prop_cache_store: "Store | None" = None
+        self._ssr_cache_store: "Store | None" = None
+        self._ssr_pool: "SSRWorkerPool | None" = None
+        self._ssr_breaker: "SSRCircuitBreaker | None" = None
+        self.ssr_inflight: "dict[str, _SSRFlight]" = {}
 
     @asynccontextmanager
     async def lifespan(self, app: "Litestar") -> "AsyncGenerator[None, None]":
@@ -81,6 +101,7 @@ class InertiaPlugin(InitPlugin):
         self._ssr_client = httpx.AsyncClient(
             limits=limits,
             timeout=httpx.Timeout(10.0),  # Default timeout, can be overridden per-request
+            mounts=self._ssr_socket_mounts(limits),
         )
         try:
             yield
@@ -88,6 +109,17 @@ class InertiaPlugin(InitPlugin):
             await self._ssr_client.aclose()
             self._ssr_client = None  # Reset to signal client is closed
 
+    def _ssr_socket_mounts(self, limits: "httpx.Limits") -> "dict[str, httpx.AsyncBaseTransport | None]":
+        """Route each SSR worker URL through its Unix socket when ``unix_socket`` is set.
+
+        Returns:
+            httpx mounts keyed by worker origin, empty when SSR uses TCP.
+        """
+        ssr_config = self.config.ssr_config
+        if ssr_config is None:
+            return {}
+        return ssr_socket_mounts(ssr_config, limits)
+
     @property
     def ssr_client(self) -> "httpx.AsyncClient | None":
         """Return the shared httpx.AsyncClient for SSR requests.
@@ -100,6 +132,104 @@ class InertiaPlugin(InitPlugin):
         """
         return self._ssr_client
 
+    @property
+    def ssr_pool(self) -> "SSRWorkerPool | None":
+        """Return the pool balancing renders across SSR workers.
+
+        Created on first use when ``InertiaSSRConfig.workers`` is greater than 1.
+
+        Returns:
+            The shared worker pool, or None when a single SSR server is configured.
+        """
+        ssr_config = self.config.ssr_config
+        if ssr_config is None or ssr_config.workers <= 1:
+            return None
+        if self._ssr_pool is None:
+            from litestar_vite.inertia.ssr_pool import SSRWorkerPool
+
+            self._ssr_pool = SSRWorkerPool(
+                ssr_config.worker_urls,
+                eject_after=ssr_config.worker_eject_after,
+                eject_seconds=ssr_config.worker_eject_seconds,
+            )
+        return self._ssr_pool
+
+    @property
+    def ssr_breaker(self) -> "SSRCircuitBreaker | None":
+        """Return the circuit breaker guarding SSR renders.
+
+        Created on first use from ``InertiaSSRConfig.circuit_breaker``.
+
+        Returns:
+            The shared circuit breaker, or None when it is disabled.
+        """
+        ssr_config = self.config.ssr_config
+        breaker_config = ssr_config.circuit_breaker_config if ssr_config is not None else None
+        if breaker_config is None:
+            return None
+        if self._ssr_breaker is None:
+            from litestar_vite.inertia.ssr_breaker import SSRCircuitBreaker
+
+            self._ssr_breaker = SSRCircuitBreaker(breaker_config)
+        return self._ssr_breaker
+
+    @property
+    def prop_thread_limiter(self) -> "anyio.CapacityLimiter | None":
+        """Return the limiter bounding worker threads used by sync prop callbacks.
+
+        Created on first use from ``InertiaConfig.sync_props_thread_limit`` and shared
+        by every request handled by this plugin.
+
+        Returns:
+            The shared limiter, or None to use AnyIO's default thread limiter.
+        """
+        limit = self.config.sync_props_thread_limit
+        if limit is None:
+            return None
+        if self._prop_thread_limiter is None:
+            self._prop_thread_limiter = anyio.CapacityLimiter(limit)
+        return self._prop_thread_limiter
+
+    def get_prop_cache_store(self, app: "Litestar") -> "Store | None":
+        """Return the store backing server-side cached props.
+
+        Resolved on first use from ``InertiaConfig.prop_cache``: a store registered on
+        ``app`` when ``store`` is a name, the given store instance, or an in-memory
+        LRU store bounded by ``max_entries``.
+
+        Args:
+            app: The :class:`Litestar <litestar.app.Litestar>` instance.
+
+        Returns:
+            The shared prop cache store, or None when the prop cache is disabled.
+        """
+        config = self.config.prop_cache_config
+        if config is None:
+            return None
+        if self._prop_cache_store is None:
+            self._prop_cache_store = _resolve_cache_store(app, config.store, config.max_entries)
+        return self._prop_cache_store
+
+    def get_ssr_cache_store(self, app: "Litestar") -> "Store | None":
+        """Return the store backing cached SSR results.
+
+        Resolved on first use from ``InertiaSSRConfig.cache``, like
+        :meth:`get_prop_cache_store`.
+
+        Args:
+            app: The :class:`Litestar <litestar.app.Litestar>` instance.
+
+        Returns:
+            The shared SSR cache store, or None when SSR caching is disabled.
+        """
+        ssr_config = self.config.ssr_config
+        cache_config = ssr_config.cache_config if ssr_config is not None else None
+        if cache_config is None:
+            return None
+        if self._ssr_cache_store is None:
+            self._ssr_cache_store = _resolve_cache_store(app, cache_config.store, cache_config.max_entries)
+        return self._ssr_cache_store
+
     def on_app_init(self, app_config: "AppConfig") -> "AppConfig":
         """Configure application for use with Vite.
 
@@ -175,6 +305,21 @@ class InertiaPlugin(InitPlugin):
         return app_config
 
 
+def _resolve_cache_store(app: "Litestar", store: "str | Store | None", max_entries: int) -> "Store":
+    """Return the store named or given by a cache config, or a bounded in-memory LRU store.
+
+    Returns:
+        The resolved store.
+    """
+    from litestar_vite.inertia.prop_cache import LRUMemoryStore
+
+    if isinstance(store, str):
+        return app.stores.get(store)
+    if store is None:
+        return LRUMemoryStore(max_entries=max_entries)
+    return store
+
+
 def _request_from_context(kwargs: "dict[str, Any]") -> "Request[Any, Any, Any] | None":
     from litestar_vite.inertia.middleware import get_current_inertia_request
 
@@ -294,3 +439,23 @@ def _wrap_app_handlers(app: "Litestar", *, component_opt_keys: "tuple[str, ...]"
                 handler, component_opt_keys=component_opt_keys
             ):
                 _wrap_handler_fn(handler)
+
+
+def ssr_socket_mounts(
+    ssr_config: "InertiaSSRConfig", limits: "httpx.Limits | None" = None
+) -> "dict[str, httpx.AsyncBaseTransport | None]":
+    """Build httpx mounts routing each SSR worker URL through its Unix socket.
+
+    Args:
+        ssr_config: The SSR configuration.
+        limits: Connection limits for the socket transports.
+
+    Returns:
+        httpx mounts keyed by worker origin, empty when SSR uses TCP.
+    """
+    transport_options: "dict[str, Any]" = {"limits": limits} if limits is not None else {}
+    # httpx drops a scheme's default port before matching mounts, so the keys must drop it too.
+    return {
+        f"all://{httpx.URL(url).netloc.decode('ascii')}": httpx.AsyncHTTPTransport(uds=socket_path, **transport_options)
+        for url, socket_path in zip(ssr_config.worker_urls, ssr_config.worker_sockets, strict=False)
+    }
@@ -0,0 +1,247 @@
+"""Server-side cache for ``once()`` and ``defer()`` prop values.
+
+Props created with ``cache=`` are looked up in a :class:`~litestar.stores.base.Store`
+during the async pre-pass of :class:`~litestar_vite.inertia.response.InertiaResponse`.
+Hits are loaded into the prop so its callback never runs; misses are written back
+once the callback has been resolved.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, cast
+
+import anyio
+from litestar.exceptions import SerializationException
+from litestar.serialization import decode_json, encode_json, get_serializer
+from litestar.stores.base import StorageObject, Store
+
+from litestar_vite.inertia.helpers import (
+    _collect_props,  # pyright: ignore[reportPrivateUsage]
+    _is_cacheable_prop,  # pyright: ignore[reportPrivateUsage]
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import timedelta
+
+    from litestar.connection import ASGIConnection
+    from litestar.types import TypeEncodersMap
+
+    from litestar_vite.config import InertiaPropCacheConfig
+
+__all__ = ("LRUMemoryStore", "load_cached_props", "prop_cache_key", "store_cached_props")
+
+logger = logging.getLogger("litestar_vite")
+
+
+class LRUMemoryStore(Store):
+    """In-memory store that evicts the least recently used entry beyond ``max_entries``."""
+
+    __slots__ = ("_entries", "_lock", "max_entries")
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """Initialize the store.
+
+        Args:
+            max_entries: Maximum number of entries kept in memory.
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, StorageObject]" = OrderedDict()
+        self._lock = anyio.Lock()
+
+    async def set(self, key: str, value: "str | bytes", expires_in: "int | timedelta | None" = None) -> None:
+        """Set a value, evicting the least recently used entries when full.
+
+        Args:
+            key: Key to associate the value with.
+            value: Value to store.
+            expires_in: Time in seconds before the key is considered expired.
+        """
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        async with self._lock:
+            self._entries[key] = StorageObject.new(data=value, expires_in=expires_in)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def get(self, key: str, renew_for: "int | timedelta | None" = None) -> "bytes | None":
+        """Get a value and mark it as recently used.
+
+        Args:
+            key: Key associated with the value.
+            renew_for: Renew the expiry time for this many seconds, if the value has one.
+
+        Returns:
+            The value associated with ``key`` if it exists and is not expired, else ``None``.
+        """
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expired:
+                del self._entries[key]
+                return None
+            if renew_for and entry.expires_at:
+                entry = self._entries[key] = StorageObject.new(data=entry.data, expires_in=renew_for)
+            self._entries.move_to_end(key)
+            return entry.data
+
+    async def delete(self, key: str) -> None:
+        """Delete a value. Missing keys are ignored.
+
+        Args:
+            key: Key of the value to delete.
+        """
+        async with self._lock:
+            self._entries.pop(key, None)
+
+    async def delete_all(self) -> None:
+        """Delete all stored values."""
+        async with self._lock:
+            self._entries.clear()
+
+    async def delete_expired(self) -> None:
+        """Delete expired values, which are otherwise only dropped when read."""
+        async with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry.expired]:
+                del self._entries[key]
+
+    async def exists(self, key: str) -> bool:
+        """Check whether ``key`` holds a value that has not expired.
+
+        Args:
+            key: Key to check.
+
+        Returns:
+            True if the key exists and is not expired.
+        """
+        entry = self._entries.get(key)
+        return entry is not None and not entry.expired
+
+    async def expires_in(self, key: str) -> "int | None":
+        """Get the seconds until ``key`` expires.
+
+        Args:
+            key: Key to check.
+
+        Returns:
+            The remaining seconds, or ``None`` if the key does not exist or never expires.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at is None:
+            return None
+        return entry.expires_in
+
+
+def prop_cache_key(
+    prop: "Any", connection: "ASGIConnection[Any, Any, Any, Any]", config: "InertiaPropCacheConfig"
+) -> str:
+    """Return the store key of a cached prop for the current request.
+
+    The key is scoped to the route handler and the prop's callback, so props that share a
+    name on different routes or components never read each other's values. Without a key
+    function the value is shared by every user of that route.
+
+    Args:
+        prop: A ``once()`` or ``defer()`` prop with caching enabled.
+        connection: The current request, passed to the prop's key function.
+        config: The prop cache configuration.
+
+    Returns:
+        ``"<key_prefix>:<route handler>:<callback>:<prop key>"``, followed by
+        ``":<key function result>"`` when set.
+    """
+    route_handler = cast("dict[str, Any]", connection.scope).get("route_handler")
+    handler_fn = getattr(route_handler, "fn", None)
+    key = f"{config.key_prefix}:{_qualified_name(handler_fn)}:{_qualified_name(prop._value)}:{prop.key}"  # pyright: ignore[reportPrivateUsage]
+    if prop.cache.key is not None:
+        key = f"{key}:{prop.cache.key(connection)}"
+    return key
+
+
+def _qualified_name(value: "Any") -> str:
+    """Return a process-independent name for a function, for use in cache keys.
+
+    Returns:
+        ``"<module>.<qualname>"``, or ``""`` when ``value`` is not a named callable.
+    """
+    value = getattr(value, "func", value)
+    qualname = getattr(value, "__qualname__", None)
+    if qualname is None:
+        return ""
+    return f"{getattr(value, '__module__', '')}.{qualname}"
+
+
+async def load_cached_props(
+    *values: "Any",
+    connection: "ASGIConnection[Any, Any, Any, Any]",
+    store: "Store",
+    config: "InertiaPropCacheConfig",
+    partial_data: "set[str] | None" = None,
+    partial_except: "set[str] | None" = None,
+    except_once_props: "set[str] | None" = None,
+) -> "list[tuple[str, Any]]":
+    """Load cached values into the props found in ``values``.
+
+    Only props that will be rendered for this request are considered (same
+    partial-reload filtering as :func:`~litestar_vite.inertia.helpers.resolve_async_props`).
+
+    Args:
+        *values: The values to walk (typically shared props and the response content).
+        connection: The current request.
+        store: The store holding cached values.
+        config: The prop cache configuration.
+        partial_data: ``X-Inertia-Partial-Data`` keys, when present.
+        partial_except: ``X-Inertia-Partial-Except`` keys (v2 protocol).
+        except_once_props: Once-prop keys cached client-side.
+
+    Returns:
+        The ``(store key, prop)`` pairs that were not cached, to pass to
+        :func:`store_cached_props` once they have been resolved.
+    """
+    pending: "dict[int, Any]" = {}
+    for value in values:
+        _collect_props(value, partial_data, partial_except, except_once_props, None, pending, _is_cacheable_prop)
+
+    misses: "list[tuple[str, Any]]" = []
+    for prop in pending.values():
+        key = prop_cache_key(prop, connection, config)
+        cached = await store.get(key)
+        if cached is None:
+            misses.append((key, prop))
+            continue
+        prop._result = decode_json(cached)  # pyright: ignore[reportPrivateUsage]
+        prop._evaluated = True  # pyright: ignore[reportPrivateUsage]
+    return misses
+
+
+async def store_cached_props(
+    misses: "Sequence[tuple[str, Any]]",
+    *,
+    store: "Store",
+    config: "InertiaPropCacheConfig",
+    type_encoders: "TypeEncodersMap | None" = None,
+) -> None:
+    """Resolve the props returned by :func:`load_cached_props` and store their values.
+
+    Async callbacks must already have been awaited; sync callbacks that were not
+    offloaded to a worker thread are rendered here. Values that cannot be JSON
+    encoded are logged and left uncached.
+
+    Args:
+        misses: The ``(store key, prop)`` pairs to store.
+        store: The store holding cached values.
+        config: The prop cache configuration.
+        type_encoders: The route's and app's type encoders, so models encode as they do in the response.
+    """
+    serializer = get_serializer(type_encoders)
+    for key, prop in misses:
+        value = prop.render()
+        try:
+            data = encode_json(value, serializer=serializer)
+        except SerializationException:
+            logger.warning("Prop %r is not JSON serializable and was not cached", prop.key)
+            continue
+        ttl = prop.cache.ttl if prop.cache.ttl is not None else config.default_ttl
+        await store.set(key, data, expires_in=ttl)
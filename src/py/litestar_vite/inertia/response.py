@@ -1,17 +1,24 @@
+import codecs
 import contextlib
+import hashlib
 import itertools
-from collections.abc import AsyncGenerator, Iterable, Mapping
+import logging
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable, Mapping
 from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 from urllib.parse import quote, urlparse
 
+import anyio
 import httpx
 from litestar import Litestar, MediaType, Request, Response
 from litestar.datastructures.cookie import Cookie
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.response import Redirect
 from litestar.response.base import ASGIResponse
-from litestar.serialization import encode_json, get_serializer
+from litestar.response.streaming import ASGIStreamingResponse
+from litestar.serialization import decode_json, encode_json, get_serializer
 from litestar.status_codes import HTTP_200_OK, HTTP_303_SEE_OTHER, HTTP_307_TEMPORARY_REDIRECT, HTTP_409_CONFLICT
 from litestar.utils.empty import value_or_default
 from litestar.utils.helpers import get_enum_string_value
@@ -20,9 +27,11 @@ from litestar.utils.scope.state import ScopeState
 from litestar_vite.html_transform import inject_head_html, replace_element_outer_html
 from litestar_vite.inertia._utils import InertiaHeaders, get_headers
 from litestar_vite.inertia.helpers import (
+    _PROP_TIMINGS_SCOPE_KEY,  # pyright: ignore[reportPrivateUsage]
     PropFilter,
     _extract_once_prop_entries,  # pyright: ignore[reportPrivateUsage]
     build_once_props_metadata,
+    collect_prop_opt_ins,
     extract_deferred_props,
     extract_merge_props,
     extract_pagination_scroll_props,
@@ -35,10 +44,13 @@ from litestar_vite.inertia.helpers import (
     lazy_render,
     pagination_to_dict,
     resolve_async_props,
+    resolve_async_props_concurrently,
+    resolve_sync_props_in_thread,
     should_render,
     unwrap_merge_props,
 )
-from litestar_vite.inertia.plugin import InertiaPlugin
+from litestar_vite.inertia.plugin import InertiaPlugin, ssr_socket_mounts
+from litestar_vite.inertia.prop_cache import load_cached_props, store_cached_props
 from litestar_vite.inertia.request import InertiaDetails, InertiaRequest
 from litestar_vite.inertia.state import consume_clear_history, persist_transient_state_for_redirect
 from litestar_vite.inertia.types import InertiaHeaderType, PageProps, ScrollPropsConfig
@@ -47,10 +59,19 @@ from litestar_vite.plugin import VitePlugin
 if TYPE_CHECKING:
     from litestar.background_tasks import BackgroundTask, BackgroundTasks
     from litestar.connection.base import AuthT, StateT, UserT
+    from litestar.stores.base import Store
     from litestar.types import ResponseCookies, ResponseHeaders, TypeEncodersMap
 
+    from litestar_vite.config import InertiaSSRCacheConfig
+    from litestar_vite.inertia.ssr_breaker import SSRCircuitBreaker
+    from litestar_vite.inertia.ssr_pool import SSRWorkerPool
+
 
 T = TypeVar("T")
+_SSRResultT = TypeVar("_SSRResultT")
+_MountsFactory = Callable[[], "dict[str, httpx.AsyncBaseTransport | None]"]
+
+logger = logging.getLogger("litestar_vite")
 
 
 class InertiaResponse(Response[T]):
@@ -137,10 +158,14 @@ class InertiaResponse(Response[T]):
         # Populated by :meth:`resolve_async_props` (called from the handler
         # frame so DI-scoped resources are still alive). ``_async_prepass_done``
         # short-circuits the deferral check in :meth:`to_asgi_response`;
-        # ``_cached_ssr_payload`` lets ``_render_spa`` skip the SSR fetch.
+        # ``_cached_ssr_payload`` lets ``_render_spa`` skip the SSR fetch;
+        # ``_ssr_stream`` holds a streaming render still being received;
+        # ``_defer_ssr_stream`` postpones opening it until the ASGI response runs.
         self._async_prepass_done: bool = False
         self._cached_page_props: "PageProps[T] | None" = None
         self._cached_ssr_payload: "_InertiaSSRResult | None" = None
+        self._ssr_stream: "_SSRStream | None" = None
+        self._defer_ssr_stream: bool = False
         self._defer_status_to_handler: bool = False
 
     def create_template_context(
@@ -386,30 +411,27 @@ class InertiaResponse(Response[T]):
             )
             raise ImproperlyConfiguredException(msg)
 
-        page_dict = page_props.to_dict()
-
-        if self._cached_ssr_payload is not None:
-            ssr_payload = self._cached_ssr_payload
-
-            csrf_token = self._get_csrf_token(request)
-            html = spa_handler.get_html_sync(csrf_token=csrf_token)
-
-            selector = "#app"
-            spa_config = spa_handler._spa_config  # pyright: ignore
-            if spa_config is not None:
-                selector = spa_config.app_selector
-
-            html = replace_element_outer_html(html, selector, ssr_payload.body)
-            if ssr_payload.head:
-                html = inject_head_html(html, "\n".join(ssr_payload.head))
-
-            return html.encode(self.encoding)
-
         csrf_token = self._get_csrf_token(request)
+        ssr_payload = self._cached_ssr_payload
 
-        html = spa_handler.get_html_sync(page_data=page_dict, csrf_token=csrf_token)
+        if codecs.lookup(self.encoding).name != "utf-8":
+            if ssr_payload is not None:
+                html = spa_handler.get_html_sync(
+                    csrf_token=csrf_token, ssr_body=ssr_payload.body, ssr_head="\n".join(ssr_payload.head)
+                )
+            else:
+                html = spa_handler.get_html_sync(page_data=page_props.to_dict(), csrf_token=csrf_token)
+            return html.encode(self.encoding)
 
-        return html.encode(self.encoding)
+        # UTF-8 responses splice the encoded props straight into the pre-encoded template,
+        # avoiding str round trips of a potentially large payload.
+        if ssr_payload is not None:
+            return spa_handler.get_html_bytes_sync(
+                csrf_token=csrf_token, ssr_body=ssr_payload.body, ssr_head="\n".join(ssr_payload.head)
+            )
+        return spa_handler.get_html_bytes_sync(
+            page_json=encode_json(page_props.to_dict()), page_url=page_props.url, csrf_token=csrf_token
+        )
 
     def _will_render_ssr(self, request: "Request[Any, Any, Any]", inertia_info: "_InertiaRequestInfo") -> bool:
         """Predict whether this response will hit the SSR HTTP server.
@@ -472,19 +494,88 @@ class InertiaResponse(Response[T]):
         partial_except = info.partial_except_keys if info.is_partial_render and info.partial_except_keys else None
         except_once_props = info.except_once_keys or None
 
-        await resolve_async_props(
+        try:
+            inertia_plugin: "InertiaPlugin | None" = request.app.plugins.get(InertiaPlugin)
+        except KeyError:
+            inertia_plugin = None
+        inertia_config = inertia_plugin.config if inertia_plugin is not None else None
+        uses_cache, uses_sync_to_thread = collect_prop_opt_ins(
             get_raw_shared_props(request),
+            self.content,
             partial_data=partial_data,
             partial_except=partial_except,
             except_once_props=except_once_props,
         )
-
-        await resolve_async_props(
-            self.content, partial_data=partial_data, partial_except=partial_except, except_once_props=except_once_props
+        prop_cache_config = inertia_config.prop_cache_config if inertia_config is not None else None
+        prop_cache_store = (
+            inertia_plugin.get_prop_cache_store(request.app)
+            if inertia_plugin is not None and prop_cache_config is not None and uses_cache
+            else None
         )
+        cache_misses: "list[tuple[str, Any]]" = []
+        if prop_cache_store is not None and prop_cache_config is not None:
+            cache_misses = await load_cached_props(
+                get_raw_shared_props(request),
+                self.content,
+                connection=request,
+                store=prop_cache_store,
+                config=prop_cache_config,
+                partial_data=partial_data,
+                partial_except=partial_except,
+                except_once_props=except_once_props,
+            )
+        if inertia_config is not None and inertia_config.concurrent_async_props:
+            await resolve_async_props_concurrently(
+                get_raw_shared_props(request),
+                self.content,
+                partial_data=partial_data,
+                partial_except=partial_except,
+                except_once_props=except_once_props,
+                limit=inertia_config.async_props_concurrency_limit,
+            )
+        else:
+            await resolve_async_props(
+                get_raw_shared_props(request),
+                partial_data=partial_data,
+                partial_except=partial_except,
+                except_once_props=except_once_props,
+            )
+
+            await resolve_async_props(
+                self.content,
+                partial_data=partial_data,
+                partial_except=partial_except,
+                except_once_props=except_once_props,
+            )
+
+        offload_sync_props = inertia_config is not None and inertia_config.sync_props_to_thread
+        if offload_sync_props or uses_sync_to_thread:
+            timings = await resolve_sync_props_in_thread(
+                get_raw_shared_props(request),
+                self.content,
+                partial_data=partial_data,
+                partial_except=partial_except,
+                except_once_props=except_once_props,
+                default=offload_sync_props,
+                limiter=inertia_plugin.prop_thread_limiter if inertia_plugin is not None else None,
+            )
+            if timings:
+                cast("dict[str, Any]", request.scope).setdefault(_PROP_TIMINGS_SCOPE_KEY, {}).update(timings)
+
+        if cache_misses and prop_cache_store is not None and prop_cache_config is not None:
+            await store_cached_props(
+                cache_misses,
+                store=prop_cache_store,
+                config=prop_cache_config,
+                type_encoders=self._resolve_type_encoders(request),
+            )
 
         if self._will_render_ssr(request, info):
-            await self._prefetch_ssr(request, info, partial_data, partial_except)
+            if self._streams_ssr(request):
+                # A stream opened here would leak if the response were discarded or replaced.
+                self._defer_ssr_stream = True
+            else:
+                await self._prefetch_ssr(request, info, partial_data, partial_except)
 
         self._async_prepass_done = True
 
@@ -513,13 +604,69 @@ class InertiaResponse(Response[T]):
         )
         self._cached_page_props = page_props
         type_encoders = self._resolve_type_encoders(request)
-        self._cached_ssr_payload = await _render_inertia_ssr(
-            page_props.to_dict(),
-            ssr_config.url,
-            ssr_config.timeout,
-            inertia_plugin.ssr_client,
-            type_encoders=type_encoders,
-        )
+        render: "Awaitable[_InertiaSSRResult | _SSRStream]"
+        # Without the lifespan-managed client, per-request clients still need the socket transports.
+        fallback_mounts = partial(ssr_socket_mounts, ssr_config) if ssr_config.unix_socket is not None else None
+        if self._streams_ssr(request):
+            render = _open_inertia_ssr_stream(
+                page_props.to_dict(),
+                ssr_config.url,
+                ssr_config.timeout,
+                inertia_plugin.ssr_client,
+                type_encoders=type_encoders,
+                pool=inertia_plugin.ssr_pool,
+                breaker=inertia_plugin.ssr_breaker,
+                fallback_mounts=fallback_mounts,
+            )
+        else:
+            cache_store = inertia_plugin.get_ssr_cache_store(request.app)
+            route_handler = cast("Any | None", request.scope.get("route_handler"))  # pyright: ignore[reportUnknownMemberType]
+            cache_kwargs: "dict[str, Any]" = {}
+            if cache_store is not None and (route_handler is None or route_handler.opt.get("ssr_cache", True)):
+                cache_kwargs = {"cache_store": cache_store, "cache_config": ssr_config.cache_config}
+            render = _render_inertia_ssr(
+                page_props.to_dict(),
+                ssr_config.url,
+                ssr_config.timeout,
+                inertia_plugin.ssr_client,
+                type_encoders=type_encoders,
+                inflight=inertia_plugin.ssr_inflight if ssr_config.coalesce_requests else None,
+                pool=inertia_plugin.ssr_pool,
+                breaker=inertia_plugin.ssr_breaker,
+                fallback_mounts=fallback_mounts,
+                **cache_kwargs,
+            )
+        if not ssr_config.fallback_to_csr:
+            self._store_ssr_render(await render)
+            return
+        # Leaving ``_cached_ssr_payload`` unset renders the client-side bootstrap page.
+        try:
+            with anyio.move_on_after(ssr_config.latency_budget) as scope:
+                self._store_ssr_render(await render)
+        except ImproperlyConfiguredException as exc:
+            logger.warning("Inertia SSR failed, falling back to client-side rendering: %s", exc)
+            return
+        if scope.cancelled_caught:
+            logger.warning(
+                "Inertia SSR exceeded its %ss latency budget, falling back to client-side rendering",
+                ssr_config.latency_budget,
+            )
+
+    def _streams_ssr(self, request: "Request[Any, Any, Any]") -> bool:
+        ssr_config = request.app.plugins.get(InertiaPlugin).config.ssr_config
+        # Streamed chunks are forwarded as-is, so only UTF-8 responses can stream.
+        return ssr_config is not None and ssr_config.streaming and codecs.lookup(self.encoding).name == "utf-8"
+
+    def _store_ssr_render(self, result: "_InertiaSSRResult | _SSRStream") -> None:
+        if isinstance(result, _SSRStream):
+            self._ssr_stream = result
+        else:
+            self._cached_ssr_payload = result
+
+    async def _close_ssr_stream(self) -> None:
+        if self._ssr_stream is not None:
+            stream, self._ssr_stream = self._ssr_stream, None
+            await stream.aclose()
 
     def _resolve_type_encoders(self, request: "Request[Any, Any, Any]") -> "TypeEncodersMap":
         route_handler = cast("Any | None", request.scope.get("route_handler"))  # pyright: ignore[reportUnknownMemberType]
@@ -547,6 +694,7 @@ class InertiaResponse(Response[T]):
         # Async prop callbacks must already be resolved by the handler wrapper,
         # which runs inside Litestar's DI cleanup scope. SSR is the only async
         # work that can still be safely deferred from this synchronous method.
+        needs_ssr = self._defer_ssr_stream
         if not self._async_prepass_done:
             partial_data_for_check = (
                 inertia_info.partial_keys if inertia_info.is_partial_render and inertia_info.partial_keys else None
@@ -575,25 +723,26 @@ class InertiaResponse(Response[T]):
                     "and async props resolve before request-scoped dependencies are released."
                 )
                 raise ImproperlyConfiguredException(msg)
-            if needs_ssr:
-                return cast(
-                    "ASGIResponse",
-                    _AsyncInertiaSSRResponse(
-                        response=self,
-                        app=app,
-                        request=cast("Request[Any, Any, Any]", request),
-                        kwargs={
-                            "background": background,
-                            "cookies": cookies,
-                            "encoded_headers": encoded_headers,
-                            "headers": headers,
-                            "is_head_response": is_head_response,
-                            "media_type": media_type,
-                            "status_code": status_code,
-                            "type_encoders": type_encoders,
-                        },
-                    ),
-                )
+        if needs_ssr:
+            self._defer_ssr_stream = False
+            return cast(
+                "ASGIResponse",
+                _AsyncInertiaSSRResponse(
+                    response=self,
+                    app=app,
+                    request=cast("Request[Any, Any, Any]", request),
+                    kwargs={
+                        "background": background,
+                        "cookies": cookies,
+                        "encoded_headers": encoded_headers,
+                        "headers": headers,
+                        "is_head_response": is_head_response,
+                        "media_type": media_type,
+                        "status_code": status_code,
+                        "type_encoders": type_encoders,
+                    },
+                ),
+            )
         headers = self.headers if headers is None else ({**headers, **self.headers} if self.headers else headers)
         cookies = self.cookies if cookies is None else itertools.chain(self.cookies, cookies)
         type_encoders = (
@@ -667,12 +816,39 @@ class InertiaResponse(Response[T]):
             )
 
         resolved_media_type = self._determine_media_type(self.media_type)
+        if vite_plugin.config.runtime.preload_headers:
+            headers = _with_preload_link_header(headers, vite_plugin)
+
+        ssr_stream = self._ssr_stream
+        if ssr_stream is not None:
+            # Render the shell around a marker, then stream the SSR body in its place.
+            self._cached_ssr_payload = _InertiaSSRResult(head=[], body=_SSR_STREAM_MARKER)
 
         if vite_plugin.config.wants_spa_config:
             body = self._render_spa(request, page_props, vite_plugin)
         else:
             body = self._render_template(request, page_props, type_encoders, inertia_plugin)
 
+        if ssr_stream is not None:
+            self._ssr_stream = None
+            return cast(
+                "ASGIResponse",
+                _InertiaSSRStreamResponse(
+                    stream=ssr_stream,
+                    shell=body,
+                    kwargs={
+                        "background": self.background or background,
+                        "cookies": cookies,
+                        "encoded_headers": encoded_headers,
+                        "encoding": self.encoding,
+                        "headers": headers,
+                        "is_head_response": is_head_response,
+                        "media_type": resolved_media_type,
+                        "status_code": resolved_status_code,
+                    },
+                ),
+            )
+
         return ASGIResponse(  # pyright: ignore[reportUnknownMemberType]
             background=self.background or background,
             body=body,
@@ -921,6 +1097,12 @@ async def _render_inertia_ssr(
     client: "httpx.AsyncClient | None" = None,
     *,
     type_encoders: "TypeEncodersMap | None" = None,
+    cache_store: "Store | None" = None,
+    cache_config: "InertiaSSRCacheConfig | None" = None,
+    inflight: "dict[str, _SSRFlight] | None" = None,
+    pool: "SSRWorkerPool | None" = None,
+    breaker: "SSRCircuitBreaker | None" = None,
+    fallback_mounts: "_MountsFactory | None" = None,
 ) -> _InertiaSSRResult:
     """Call the Inertia SSR server asynchronously and return head/body HTML.
 
@@ -931,17 +1113,224 @@ async def _render_inertia_ssr(
         client: Optional shared httpx.AsyncClient for connection pooling.
             If None, creates a new client per request (slower).
         type_encoders: Optional type encoders used to serialize page props.
+        cache_store: Optional store holding previously rendered results.
+        cache_config: SSR cache settings, required with ``cache_store``.
+        inflight: Optional registry of renders in progress, keyed by payload hash.
+            Concurrent calls with an identical payload share a single render.
+        pool: Optional pool of SSR workers. When given, each render goes to a worker
+            chosen by the pool instead of ``url``.
+        breaker: Optional circuit breaker consulted before, and updated after, every
+            request to the SSR server.
+        fallback_mounts: Builds the httpx mounts (e.g. Unix socket transports) of the
+            per-request client used when ``client`` is None.
 
     Returns:
         An _InertiaSSRResult with head and body HTML.
     """
-    return await _do_ssr_request(page, url, timeout_seconds, client, type_encoders=type_encoders)
+    # Use Litestar's msgspec encoder so msgspec Structs and other custom types embedded
+    # in handler return values serialize the same way as the regular Inertia render path
+    # (response.render uses get_serializer too). httpx's default json= serializer falls
+    # back to stdlib json.dumps and rejects Struct instances.
+    body = encode_json(page, serializer=get_serializer(type_encoders))
+
+    def send(target: str) -> "Awaitable[_InertiaSSRResult]":
+        return _do_ssr_request(body, target, timeout_seconds, client, fallback_mounts)
+
+    if (cache_store is None or cache_config is None) and inflight is None:
+        return await _post_ssr_render(send, url, pool, breaker)
+
+    digest = hashlib.sha256(body).hexdigest()
+    cache_key = ""
+    if cache_store is not None and cache_config is not None:
+        cache_key = f"{cache_config.key_prefix}:{page.get('component')}:{digest}"
+        cached = await cache_store.get(cache_key)
+        if cached is not None:
+            return _InertiaSSRResult(**decode_json(cached))
+
+    async def render() -> _InertiaSSRResult:
+        result = await _post_ssr_render(send, url, pool, breaker)
+        if cache_store is not None and cache_config is not None:
+            await cache_store.set(
+                cache_key, encode_json({"head": result.head, "body": result.body}), expires_in=cache_config.ttl
+            )
+        return result
+
+    if inflight is None:
+        return await render()
+    return await _coalesce_ssr_render(inflight, digest, render)
+
+
+async def _open_inertia_ssr_stream(
+    page: dict[str, Any],
+    url: str,
+    timeout_seconds: float,
+    client: "httpx.AsyncClient | None" = None,
+    *,
+    type_encoders: "TypeEncodersMap | None" = None,
+    pool: "SSRWorkerPool | None" = None,
+    breaker: "SSRCircuitBreaker | None" = None,
+    fallback_mounts: "_MountsFactory | None" = None,
+) -> "_InertiaSSRResult | _SSRStream":
+    """Start a streaming SSR render of ``page``.
+
+    The pool slot and circuit breaker token are held by the returned stream until it is
+    closed, so a worker still rendering counts as busy and a broken stream as a failure.
+
+    Returns:
+        The open stream, or an _InertiaSSRResult when the server answered with JSON.
+    """
+    body = encode_json(page, serializer=get_serializer(type_encoders))
+
+    def send(target: str) -> "Awaitable[_InertiaSSRResult | _SSRStream]":
+        return _open_ssr_stream(body, target, timeout_seconds, client, fallback_mounts)
+
+    return await _post_ssr_render(send, url, pool, breaker)
+
+
+async def _post_ssr_render(
+    send: "Callable[[str], Awaitable[_SSRResultT]]",
+    url: str,
+    pool: "SSRWorkerPool | None",
+    breaker: "SSRCircuitBreaker | None" = None,
+) -> _SSRResultT:
+    """Send one render to ``url``, or to the worker picked by ``pool``.
+
+    Connection failures count against the picked worker's health; error responses from a
+    reachable worker do not. Every outcome, including cancellation, is reported to ``breaker``.
+
+    Args:
+        send: Performs the request against the URL it is given.
+        url: The SSR server URL, used when there is no pool.
+        pool: Optional pool of SSR workers.
+        breaker: Optional circuit breaker.
+
+    Raises:
+        ImproperlyConfiguredException: If the circuit is open.
+
+    Returns:
+        The result of ``send``.
+    """
+    if breaker is None:
+        return await _post_ssr_render_to_worker(send, url, pool)
+    token = breaker.allow()
+    if token is None:
+        msg = "Inertia SSR circuit is open after repeated failures; skipping the SSR server."
+        raise ImproperlyConfiguredException(msg)
+    started = time.monotonic()
+    success = False
+    deferred = False
+    try:
+        result = await _post_ssr_render_to_worker(send, url, pool)
+        if isinstance(result, _SSRStream):
+            stream = result
+
+            def record_stream(ok: bool) -> None:
+                # Measured to the end of the upstream body, so a slow client reading the page is not a slow render.
+                finished = stream.finished_at if stream.finished_at is not None else time.monotonic()
+                breaker.record(success=ok, duration=finished - started, token=token)
+
+            stream.on_close(record_stream)
+            deferred = True
+        success = True
+    finally:
+        if not deferred:
+            breaker.record(success=success, duration=time.monotonic() - started, token=token)
+    return result
+
+
+async def _post_ssr_render_to_worker(
+    send: "Callable[[str], Awaitable[_SSRResultT]]", url: str, pool: "SSRWorkerPool | None"
+) -> _SSRResultT:
+    if pool is None:
+        return await send(url)
+    worker = pool.acquire()
+    healthy = True
+    deferred = False
+    try:
+        result = await send(worker.url)
+        if isinstance(result, _SSRStream):
+            # The worker keeps rendering while the body streams; release it once the stream closes.
+            result.on_close(lambda ok: pool.release(worker, healthy=ok))
+            deferred = True
+    except ImproperlyConfiguredException as exc:
+        healthy = not isinstance(exc.__cause__, httpx.RequestError)
+        raise
+    finally:
+        if not deferred:
+            pool.release(worker, healthy=healthy)
+    return result
+
+
+class _SSRFlight:
+    """A render in progress that concurrent identical SSR requests wait on."""
+
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.result: "_InertiaSSRResult | None" = None
+        self.error: "Exception | None" = None
+
+
+async def _coalesce_ssr_render(
+    inflight: "dict[str, _SSRFlight]", key: str, render: "Callable[[], Awaitable[_InertiaSSRResult]]"
+) -> _InertiaSSRResult:
+    """Run ``render`` once for all concurrent callers sharing ``key``.
+
+    The first caller renders; later callers wait for its result or error. When the first
+    caller is cancelled before finishing, a waiting caller renders for itself.
+
+    Raises:
+        Exception: The error raised by the shared render. Each waiter raises its own copy,
+            chained from the original, so tracebacks and handlers do not share one instance.
+
+    Returns:
+        The shared _InertiaSSRResult.
+    """
+    flight = inflight.get(key)
+    if flight is not None:
+        await flight.done.wait()
+        if flight.error is not None:
+            raise _copy_exception(flight.error) from flight.error
+        if flight.result is not None:
+            return flight.result
+        return await render()
+
+    flight = inflight[key] = _SSRFlight()
+    try:
+        flight.result = await render()
+    except Exception as exc:
+        flight.error = exc
+        raise
+    finally:
+        del inflight[key]
+        flight.done.set()
+    return flight.result
+
+
+def _copy_exception(error: Exception) -> Exception:
+    """Return a new instance of ``error`` with the same arguments and attributes.
+
+    Returns:
+        A copy without traceback or chaining, or ``error`` itself if it cannot be copied.
+    """
+    try:
+        fresh = type(error).__new__(type(error), *error.args)
+        fresh.args = error.args
+        fresh.__dict__.update(error.__dict__)
+    except Exception:  # noqa: BLE001
+        return error
+    return fresh
 
 
 @contextlib.asynccontextmanager
-async def _acquire_ssr_client(client: "httpx.AsyncClient | None") -> "AsyncGenerator[httpx.AsyncClient, None]":
+async def _acquire_ssr_client(
+    client: "httpx.AsyncClient | None", fallback_mounts: "_MountsFactory | None" = None
+) -> "AsyncGenerator[httpx.AsyncClient, None]":
     """Yield ``client`` when provided, otherwise a short-lived fallback client.
 
+    The fallback client is built with the mounts returned by ``fallback_mounts``.
+
     Yields:
         The shared client when supplied, or a fallback client whose lifecycle is
         bound to the context.
@@ -949,26 +1338,25 @@ async def _acquire_ssr_client(client: "httpx.AsyncClient | None") -> "AsyncGener
     if client is not None:
         yield client
     else:
-        async with httpx.AsyncClient() as fallback:
+        async with httpx.AsyncClient(mounts=fallback_mounts() if fallback_mounts else None) as fallback:
             yield fallback
 
 
 async def _do_ssr_request(
-    page: dict[str, Any],
+    body: bytes,
     url: str,
     timeout_seconds: float,
     client: "httpx.AsyncClient | None",
-    *,
-    type_encoders: "TypeEncodersMap | None" = None,
+    fallback_mounts: "_MountsFactory | None" = None,
 ) -> _InertiaSSRResult:
     """Execute the SSR request with optional client reuse.
 
     Args:
-        page: The page object to send to the SSR server.
+        body: The JSON-encoded page object to send to the SSR server.
         url: The SSR server URL.
         timeout_seconds: Request timeout in seconds.
         client: Optional shared httpx.AsyncClient.
-        type_encoders: Optional type encoders used to serialize page props.
+        fallback_mounts: Builds the mounts of the fallback client used when ``client`` is None.
 
     Raises:
         ImproperlyConfiguredException: If the SSR server is unreachable,
@@ -977,27 +1365,43 @@ async def _do_ssr_request(
     Returns:
         An _InertiaSSRResult with head and body HTML.
     """
-    # Use Litestar's msgspec encoder so msgspec Structs and other custom types embedded
-    # in handler return values serialize the same way as the regular Inertia render path
-    # (response.render uses get_serializer too). httpx's default json= serializer falls
-    # back to stdlib json.dumps and rejects Struct instances.
-    body = encode_json(page, serializer=get_serializer(type_encoders))
     headers = {"content-type": "application/json"}
 
     try:
-        async with _acquire_ssr_client(client) as resolved_client:
+        async with _acquire_ssr_client(client, fallback_mounts) as resolved_client:
             response = await resolved_client.post(url, content=body, headers=headers, timeout=timeout_seconds)
             response.raise_for_status()
-    except httpx.RequestError as exc:
+    except (httpx.RequestError, httpx.HTTPStatusError) as exc:
+        raise _ssr_request_error(exc, url) from exc
+
+    return _parse_inertia_ssr_response(response, url)
+
+
+def _ssr_request_error(exc: "httpx.RequestError | httpx.HTTPStatusError", url: str) -> ImproperlyConfiguredException:
+    """Return the error raised for a failed request to the SSR server.
+
+    Returns:
+        The exception to raise from ``exc``.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        msg = f"Inertia SSR server at {url!r} returned HTTP {exc.response.status_code}. Check the SSR server logs."
+    else:
         msg = (
             f"Inertia SSR is enabled but the SSR server is not reachable at {url!r}. "
             "Start the SSR server (Node) or disable InertiaConfig.ssr."
         )
-        raise ImproperlyConfiguredException(msg) from exc
-    except httpx.HTTPStatusError as exc:
-        msg = f"Inertia SSR server at {url!r} returned HTTP {exc.response.status_code}. Check the SSR server logs."
-        raise ImproperlyConfiguredException(msg) from exc
+    return ImproperlyConfiguredException(msg)
+
 
+def _parse_inertia_ssr_response(response: "httpx.Response", url: str) -> _InertiaSSRResult:
+    """Parse a read JSON response from the SSR server.
+
+    Raises:
+        ImproperlyConfiguredException: If the body is not valid JSON.
+
+    Returns:
+        An _InertiaSSRResult with head and body HTML.
+    """
     try:
         payload = response.json()
     except ValueError as exc:
@@ -1007,6 +1411,138 @@ async def _do_ssr_request(
     return _parse_inertia_ssr_payload(payload, url)
 
 
+_SSR_STREAM_MARKER = "<!--litestar-vite:ssr-stream-->"
+
+
+class _SSRStream:
+    """An SSR render whose HTML body is still arriving from the render server."""
+
+    __slots__ = ("_close_callbacks", "_owned_client", "failed", "finished_at", "response", "url")
+
+    def __init__(self, response: "httpx.Response", url: str, owned_client: "httpx.AsyncClient | None") -> None:
+        self.response = response
+        self.url = url
+        self.failed = False
+        self.finished_at: "float | None" = None
+        self._owned_client = owned_client
+        self._close_callbacks: "list[Callable[[bool], None]]" = []
+
+    def on_close(self, callback: "Callable[[bool], None]") -> None:
+        """Register a callback run once when the stream is closed.
+
+        Args:
+            callback: Called with True when the render completed, False when it broke off.
+        """
+        self._close_callbacks.append(callback)
+
+    async def iter_bytes(self) -> "AsyncGenerator[bytes, None]":
+        """Yield body chunks as they arrive.
+
+        A render that breaks off midway marks the stream as failed and re-raises, so the
+        response is aborted instead of completing truncated markup the client would hydrate.
+
+        Raises:
+            httpx.HTTPError: If the render server connection fails mid-stream.
+
+        Yields:
+            UTF-8 encoded chunks of the rendered app HTML.
+        """
+        try:
+            async for chunk in self.response.aiter_bytes():
+                yield chunk
+        except httpx.HTTPError as exc:
+            self.failed = True
+            logger.warning("Inertia SSR stream from %r broke off; aborting the response: %s", self.url, exc)
+            raise
+        finally:
+            self.finished_at = time.monotonic()
+
+    async def aclose(self) -> None:
+        """Close the upstream response and any client opened for it, then run the close callbacks."""
+        try:
+            with anyio.CancelScope(shield=True):
+                await self.response.aclose()
+                if self._owned_client is not None:
+                    await self._owned_client.aclose()
+        finally:
+            callbacks, self._close_callbacks = self._close_callbacks, []
+            for callback in callbacks:
+                callback(not self.failed)
+
+
+async def _open_ssr_stream(
+    body: bytes,
+    url: str,
+    timeout_seconds: float,
+    client: "httpx.AsyncClient | None",
+    fallback_mounts: "_MountsFactory | None" = None,
+) -> "_InertiaSSRResult | _SSRStream":
+    """Start a streaming render, returning once the SSR server has sent its headers.
+
+    The server is asked for ``text/html``. One that answers with the regular JSON payload
+    instead is read in full, so streaming degrades to a buffered render.
+
+    Args:
+        body: The JSON-encoded page object to send to the SSR server.
+        url: The SSR server URL.
+        timeout_seconds: Request timeout in seconds.
+        client: Optional shared httpx.AsyncClient.
+        fallback_mounts: Builds the mounts of the fallback client used when ``client`` is None.
+
+    Raises:
+        ImproperlyConfiguredException: If the SSR server is unreachable or returns an error status.
+
+    Returns:
+        The open stream, or an _InertiaSSRResult for a JSON response.
+    """
+    owned_client = httpx.AsyncClient(mounts=fallback_mounts() if fallback_mounts else None) if client is None else None
+    resolved_client = client or cast("httpx.AsyncClient", owned_client)
+    headers = {"content-type": "application/json", "accept": "text/html, application/json;q=0.9"}
+    request = resolved_client.build_request("POST", url, content=body, headers=headers, timeout=timeout_seconds)
+    response: "httpx.Response | None" = None
+    try:
+        response = await resolved_client.send(request, stream=True)
+        response.raise_for_status()
+        if response.headers.get("content-type", "").startswith("text/html"):
+            return _SSRStream(response, url, owned_client)
+        await response.aread()
+    except BaseException as exc:
+        # Shielded so a latency-budget cancellation cannot interrupt the cleanup and leak the connection.
+        with anyio.CancelScope(shield=True):
+            if response is not None:
+                await response.aclose()
+            if owned_client is not None:
+                await owned_client.aclose()
+        if isinstance(exc, (httpx.RequestError, httpx.HTTPStatusError)):
+            raise _ssr_request_error(exc, url) from exc
+        raise
+    with anyio.CancelScope(shield=True):
+        await response.aclose()
+        if owned_client is not None:
+            await owned_client.aclose()
+    return _parse_inertia_ssr_response(response, url)
+
+
+def _with_preload_link_header(headers: "dict[str, Any]", vite_plugin: "VitePlugin") -> "dict[str, Any]":
+    """Return ``headers`` with the manifest preload links appended to ``Link``.
+
+    The input mapping may be shared with the route layer, so a copy is returned
+    instead of updating it in place.
+
+    Args:
+        headers: Response headers.
+        vite_plugin: The Vite plugin instance (for asset loader access).
+
+    Returns:
+        The headers including the preload ``Link`` value.
+    """
+    link = vite_plugin.asset_loader.preload_link_header()
+    if not link:
+        return headers
+    existing = headers.get("Link")
+    return {**headers, "Link": f"{existing}, {link}" if existing else link}
+
+
 def _get_redirect_url(request: "Request[Any, Any, Any]", url: str | None) -> str:
     """Return a safe redirect URL, falling back to base_url when invalid.
 
@@ -1184,5 +1720,36 @@ class _AsyncInertiaSSRResponse:
         partial_except = info.partial_except_keys if info.is_partial_render and info.partial_except_keys else None
         await self._response._prefetch_ssr(self._request, info, partial_data, partial_except)  # pyright: ignore[reportPrivateUsage]
         self._response._async_prepass_done = True  # pyright: ignore[reportPrivateUsage]
-        asgi_response = self._response.to_asgi_response(self._app, self._request, **self._kwargs)
+        try:
+            asgi_response = self._response.to_asgi_response(self._app, self._request, **self._kwargs)
+        except BaseException:
+            await self._response._close_ssr_stream()  # pyright: ignore[reportPrivateUsage]
+            raise
         await asgi_response(scope, receive, send)
+
+
+class _InertiaSSRStreamResponse:
+    """ASGI response that sends the page shell, then the streamed SSR body inside it."""
+
+    __slots__ = ("_has_target", "_kwargs", "_prefix", "_stream", "_suffix")
+
+    def __init__(self, *, stream: "_SSRStream", shell: bytes, kwargs: "dict[str, Any]") -> None:
+        self._stream = stream
+        self._kwargs = kwargs
+        self._prefix, marker, self._suffix = shell.partition(_SSR_STREAM_MARKER.encode())
+        self._has_target = bool(marker)
+        if not self._has_target:
+            logger.warning("Inertia SSR target element not found in the page; the SSR stream is discarded")
+
+    async def _iter_body(self) -> "AsyncGenerator[bytes, None]":
+        yield self._prefix
+        if self._has_target:
+            async for chunk in self._stream.iter_bytes():
+                yield chunk
+            yield self._suffix
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        try:
+            await ASGIStreamingResponse(iterator=self._iter_body(), **self._kwargs)(scope, receive, send)
+        finally:
+            await self._stream.aclose()
@@ -0,0 +1,105 @@
+"""Circuit breaker guarding requests to the Inertia SSR server.
+
+:class:`SSRCircuitBreaker` tracks the outcome of recent renders. Once too many of them
+fail or run slow, the circuit opens and renders are refused immediately instead of each
+request waiting for a sick SSR server. After a cool-down a few probe renders are let
+through; if they succeed the circuit closes again.
+"""
+
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from litestar_vite.config import InertiaSSRCircuitBreakerConfig
+
+__all__ = ("SSRCircuitBreaker",)
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class SSRCircuitBreaker:
+    """Failure-rate and latency based circuit breaker for SSR renders.
+
+    Callers ask :meth:`allow` before a render and report it with :meth:`record`, passing
+    back the token :meth:`allow` returned. Renders slower than ``slow_call_seconds`` count
+    as failures.
+    """
+
+    __slots__ = ("_generation", "_opened_at", "_outcomes", "_probe_successes", "_probes_in_flight", "config", "state")
+
+    def __init__(self, config: "InertiaSSRCircuitBreakerConfig") -> None:
+        """Initialize the breaker.
+
+        Args:
+            config: Thresholds and timings of the breaker.
+        """
+        self.config = config
+        self.state: CircuitState = "closed"
+        self._outcomes: deque[bool] = deque(maxlen=config.window_size)
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        # Bumped on every state change, so results of renders admitted earlier are ignored.
+        self._generation = 1
+
+    def allow(self) -> "int | None":
+        """Return whether a render may be sent to the SSR server now.
+
+        Returns:
+            A token to pass to :meth:`record` when the circuit is closed, or when it is
+            half-open and a probe slot is free; otherwise None.
+        """
+        if self.state == "open":
+            if time.monotonic() - self._opened_at < self.config.open_seconds:
+                return None
+            self._set_state("half_open")
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+        if self.state == "half_open":
+            if self._probes_in_flight >= self.config.half_open_probes:
+                return None
+            self._probes_in_flight += 1
+        return self._generation
+
+    def record(self, *, success: bool, duration: float, token: "int | None" = None) -> None:
+        """Report the outcome of a render admitted by :meth:`allow`.
+
+        Args:
+            success: False when the render raised.
+            duration: Seconds the render took.
+            token: The token :meth:`allow` returned. A render admitted before the last
+                state change is ignored, so it cannot count as a half-open probe.
+        """
+        if token is not None and token != self._generation:
+            return
+        slow = self.config.slow_call_seconds
+        if slow is not None and duration > slow:
+            success = False
+        if self.state == "half_open":
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if not success:
+                self._open()
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.config.half_open_probes:
+                self._set_state("closed")
+                self._outcomes.clear()
+            return
+        if self.state == "open":
+            return
+        self._outcomes.append(success)
+        if len(self._outcomes) < self.config.minimum_calls:
+            return
+        failure_rate = self._outcomes.count(False) / len(self._outcomes)
+        if failure_rate >= self.config.failure_rate_threshold:
+            self._open()
+
+    def _set_state(self, state: CircuitState) -> None:
+        self.state = state
+        self._generation += 1
+
+    def _open(self) -> None:
+        self._set_state("open")
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
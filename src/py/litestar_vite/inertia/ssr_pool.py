@@ -0,0 +1,9 @@
+"""Load balancing across several Inertia SSR server processes.
+
+The pool lives in :mod:`litestar_vite.plugin._pool`, where the framework proxy shares it;
+it is re-exported here for the Inertia SSR client.
+"""
+
+from litestar_vite.plugin._pool import SSRWorker, SSRWorkerPool
+
+__all__ = ("SSRWorker", "SSRWorkerPool")
@@ -13,10 +13,11 @@ Key features:
 
 import hashlib
 import html
+import re
 from functools import cached_property
 from pathlib import Path
 from textwrap import dedent
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import urljoin
 
 import anyio
@@ -27,8 +28,15 @@ from litestar.serialization import decode_json
 from litestar_vite.exceptions import AssetNotFoundError, ManifestNotFoundError
 from litestar_vite.utils import read_bridge_config
 
+_DEFAULT_SCRIPT_ATTRS_KEY: "tuple[tuple[str, str], ...]" = (("type", "module"), ("async", ""), ("defer", ""))
+_EMITTED_ASSETS_SCOPE_KEY = "_litestar_vite_emitted_assets"
+# A default ``[hash]`` placeholder: a dash- or dot-separated run of exactly eight of Rollup's base64url
+# characters with at least one digit or capital, so plain words such as ``-settings`` do not count.
+_HASH_SEGMENT_RE = re.compile(r"[-.](?=[A-Za-z0-9_-]{0,7}[A-Z0-9])[A-Za-z0-9_-]{8}$")
+_FONT_TYPES = {".woff2": "font/woff2", ".woff": "font/woff", ".ttf": "font/ttf", ".otf": "font/otf"}
+
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping, Sequence
 
     from litestar.connection import Request
 
@@ -36,6 +44,25 @@ if TYPE_CHECKING:
     from litestar_vite.plugin import VitePlugin
 
 
+def _is_hashed_file(file: str, name: "str | None" = None) -> bool:
+    """Check whether a manifest output file carries a content hash in its name.
+
+    When the chunk's ``[name]`` is known and the file is named after it, only the remainder
+    after the name is checked, so a name such as ``vendor-chart2d3`` is never mistaken for a hash.
+
+    Args:
+        file: The output path from the manifest.
+        name: The ``name`` of the manifest chunk the file belongs to, if any.
+
+    Returns:
+        True if the file name ends in a hash segment.
+    """
+    stem = Path(file).stem
+    if name and stem.startswith(name):
+        return _HASH_SEGMENT_RE.fullmatch(stem[len(name) :]) is not None
+    return _HASH_SEGMENT_RE.search(stem) is not None
+
+
 def _get_request_from_context(context: "Mapping[str, Any]") -> "Request[Any, Any, Any]":
     """Get the request from the template context.
 
@@ -91,17 +118,26 @@ def render_hmr_client(context: "Mapping[str, Any]", /) -> "markupsafe.Markup":
 
 
 def render_asset_tag(
-    context: "Mapping[str, Any]", /, path: "str | list[str]", scripts_attrs: "dict[str, str] | None" = None
+    context: "Mapping[str, Any]",
+    /,
+    path: "str | list[str]",
+    scripts_attrs: "dict[str, str] | None" = None,
+    modulepreload: "bool | None" = None,
 ) -> "markupsafe.Markup":
     """Render asset tags for the specified path(s).
 
     This is a Jinja2 template callable that renders script/link tags
     for Vite-managed assets. Also works for HTMX partial responses.
 
+    Tags already emitted for the current request are skipped, so chunks shared
+    between several ``vite_asset()`` calls on one page are only written once.
+
     Args:
         context: The template context containing the request.
         path: Single path or list of paths to assets.
         scripts_attrs: Optional attributes for script tags.
+        modulepreload: Emit ``<link rel="modulepreload">`` for imported chunks.
+            Defaults to ``RuntimeConfig.modulepreload``.
 
     Returns:
         HTML markup for the asset tags, or empty markup if VitePlugin
@@ -115,7 +151,9 @@ def render_asset_tag(
     vite_plugin = _get_vite_plugin(context)
     if vite_plugin is None:
         return markupsafe.Markup("")
-    return vite_plugin.asset_loader.render_asset_tag(path, scripts_attrs)
+    request = _get_request_from_context(context)
+    emitted: set[str] = cast("dict[str, Any]", request.scope).setdefault(_EMITTED_ASSETS_SCOPE_KEY, set())
+    return vite_plugin.asset_loader.render_asset_tag(path, scripts_attrs, modulepreload=modulepreload, emitted=emitted)
 
 
 def render_static_asset(context: "Mapping[str, Any]", /, path: str) -> str:
@@ -225,6 +263,12 @@ class ViteAssetLoader:
         self._vite_base_path: "str | None" = None
         self._initialized: bool = False
         self._is_hot_dev = self._config.hot_reload and self._config.is_dev_mode
+        self._asset_tag_index: "dict[tuple[str, tuple[tuple[str, str], ...], bool], tuple[str, tuple[str, ...]]]" = {}
+        self._import_graph: "dict[str, tuple[str, ...]]" = {}
+        self._preload_link_index: "dict[tuple[str, ...], tuple[str, ...]]" = {}
+        self._asset_tag_index_source: "dict[str, Any] | None" = None
+        self._asset_tag_index_version: "str | None" = None
+        self._hashed_files: "frozenset[str] | None" = None
 
     @classmethod
     def initialize_loader(cls, config: "ViteConfig") -> "ViteAssetLoader":
@@ -294,12 +338,13 @@ class ViteAssetLoader:
         try:
             if await manifest_path.exists():
                 content = await manifest_path.read_text()
-                self._manifest_content = content
+                self.manifest_content = content
                 self._manifest = decode_json(content)
             else:
                 self._manifest = {}
         except (OSError, UnicodeDecodeError, SerializationException) as exc:
             raise ManifestNotFoundError(str(manifest_path)) from exc
+        self._build_asset_tag_index()
 
     def _load_manifest_sync(self) -> None:
         """Synchronously load and parse the Vite manifest file.
@@ -310,12 +355,13 @@ class ViteAssetLoader:
         manifest_path = self._get_manifest_path()
         try:
             if manifest_path.exists():
-                self._manifest_content = manifest_path.read_text()
+                self.manifest_content = manifest_path.read_text()
                 self._manifest = decode_json(self._manifest_content)
             else:
                 self._manifest = {}
         except (OSError, UnicodeDecodeError, SerializationException) as exc:
             raise ManifestNotFoundError(str(manifest_path)) from exc
+        self._build_asset_tag_index()
 
     async def _load_hot_file_async(self) -> None:
         """Asynchronously read the hot file for dev server URL."""
@@ -342,9 +388,19 @@ class ViteAssetLoader:
     def manifest_content(self, value: str) -> None:
         """Set the manifest content.
 
+        Changing the content invalidates the cached ``version_id`` and the
+        rendered asset tag index.
+
         Args:
             value: The raw JSON string content to set.
         """
+        if value != self._manifest_content:
+            self.__dict__.pop("version_id", None)
+            self._asset_tag_index = {}
+            self._import_graph = {}
+            self._preload_link_index = {}
+            self._asset_tag_index_version = None
+            self._hashed_files = None
         self._manifest_content = value
 
     @property
@@ -356,6 +412,32 @@ class ViteAssetLoader:
         """
         return self._manifest
 
+    @property
+    def hashed_files(self) -> "frozenset[str]":
+        """Content-hashed build output files listed in the manifest, relative to the bundle directory.
+
+        Vite names these files by a hash of their content, so they never change in place
+        and can be cached indefinitely. Files whose name carries no hash, as produced by
+        ``entryFileNames`` or ``assetFileNames`` patterns without ``[hash]``, are left out.
+
+        Returns:
+            The hashed ``file``, ``css`` and ``assets`` paths of every manifest chunk.
+        """
+        if self._hashed_files is None:
+            files: "set[str]" = set()
+            for chunk in self._manifest.values():
+                if not isinstance(chunk, dict):
+                    continue
+                entry = cast("dict[str, Any]", chunk)
+                name = entry.get("name") if isinstance(entry.get("name"), str) else None
+                if isinstance(file := entry.get("file"), str) and _is_hashed_file(file, name):
+                    files.add(file)
+                for key in ("css", "assets"):
+                    values = entry.get(key) or ()
+                    files.update(value for value in values if isinstance(value, str) and _is_hashed_file(value, name))
+            self._hashed_files = frozenset(files)
+        return self._hashed_files
+
     @cached_property
     def version_id(self) -> str:
         """Get the version ID of the manifest.
@@ -378,19 +460,28 @@ class ViteAssetLoader:
         return markupsafe.Markup(f"{self.generate_react_hmr_tags()}{self.generate_ws_client_tags()}")
 
     def render_asset_tag(
-        self, path: "str | list[str]", scripts_attrs: "dict[str, str] | None" = None
+        self,
+        path: "str | list[str]",
+        scripts_attrs: "dict[str, str] | None" = None,
+        *,
+        modulepreload: "bool | None" = None,
+        emitted: "set[str] | None" = None,
     ) -> "markupsafe.Markup":
         """Render asset tags for the specified path(s).
 
         Args:
             path: Single path or list of paths to assets.
             scripts_attrs: Optional attributes for script tags.
+            modulepreload: Emit ``modulepreload`` links for imported chunks.
+            emitted: Tags already written to the page (see ``generate_asset_tags``).
 
         Returns:
             HTML markup for script and link tags.
         """
         paths = [str(p) for p in path] if isinstance(path, list) else [str(path)]
-        return markupsafe.Markup("".join(self.generate_asset_tags(p, scripts_attrs=scripts_attrs) for p in paths))
+        return markupsafe.Markup(
+            self.generate_asset_tags(paths, scripts_attrs=scripts_attrs, modulepreload=modulepreload, emitted=emitted)
+        )
 
     def get_static_asset(self, path: str) -> str:
         """Get the URL for a static asset.
@@ -446,12 +537,27 @@ class ViteAssetLoader:
                 """)
         return ""
 
-    def generate_asset_tags(self, path: "str | list[str]", scripts_attrs: "dict[str, str] | None" = None) -> str:
+    def generate_asset_tags(
+        self,
+        path: "str | list[str]",
+        scripts_attrs: "dict[str, str] | None" = None,
+        *,
+        modulepreload: "bool | None" = None,
+        emitted: "set[str] | None" = None,
+    ) -> str:
         """Generate all asset tags for the specified file(s).
 
+        Each chunk of the import graph is emitted at most once, even when it is
+        shared between several requested entries.
+
         Args:
             path: Path or list of paths to assets.
             scripts_attrs: Optional attributes for script tags.
+            modulepreload: Emit ``<link rel="modulepreload">`` for imported chunks
+                instead of module scripts. Defaults to ``RuntimeConfig.modulepreload``.
+            emitted: Tags already written to the page. Matching tags are skipped and
+                newly rendered tags are added, so repeated calls for one page never
+                duplicate a chunk.
 
         Returns:
             HTML string with all necessary script and link tags.
@@ -476,31 +582,214 @@ class ViteAssetLoader:
             msg = "Cannot find %s in the Vite manifest. Run 'litestar assets build' and retry."
             raise ImproperlyConfiguredException(msg, missing)
 
-        tags: list[str] = []
-        manifest_entries = {p: self._manifest[p] for p in paths if p}
+        attrs_key = tuple(scripts_attrs.items()) if scripts_attrs else _DEFAULT_SCRIPT_ATTRS_KEY
+        preload = self._config.modulepreload if modulepreload is None else modulepreload
+        paths = [p for p in paths if p]
+        if emitted is None and len(paths) == 1:
+            return self._entry_tags(paths[0], attrs_key, preload)[0]
+
+        seen: set[str] = set() if emitted is None else emitted
+        rendered: list[str] = []
+        for p in paths:
+            for tag in self._entry_tags(p, attrs_key, preload)[1]:
+                if tag not in seen:
+                    seen.add(tag)
+                    rendered.append(tag)
+        return "".join(rendered)
+
+    def _ensure_asset_tag_index(self) -> None:
+        """Reset the import graph and rendered tag index if the manifest changed since they were built."""
+        if self._asset_tag_index_source is not self._manifest or self._asset_tag_index_version != self.version_id:
+            self._asset_tag_index = {}
+            self._import_graph = {}
+            self._preload_link_index = {}
+            self._asset_tag_index_source = self._manifest
+            self._asset_tag_index_version = self.version_id
+
+    def _build_asset_tag_index(self) -> None:
+        """Pre-compute the import graph and default tags for every manifest entry.
+
+        Called after the manifest is (re)loaded so that template calls using the
+        default script attributes resolve to a single dict lookup. Variants with
+        custom ``scripts_attrs`` are rendered on first use and memoized in the
+        same index until ``version_id`` changes.
+        """
+        self._ensure_asset_tag_index()
+        if self._is_hot_dev:
+            return
+        preload = self._config.modulepreload
+        for entry, chunk in self._manifest.items():
+            if isinstance(chunk, dict) and cast("dict[str, Any]", chunk).get("isEntry"):
+                self._entry_tags(entry, _DEFAULT_SCRIPT_ATTRS_KEY, preload)
 
-        if not scripts_attrs:
-            scripts_attrs = {"type": "module", "async": "", "defer": ""}
+    def _entry_tags(
+        self, path: str, attrs_key: "tuple[tuple[str, str], ...]", modulepreload: bool
+    ) -> "tuple[str, tuple[str, ...]]":
+        """Return the memoized rendering of a manifest entry.
 
-        asset_url_base = self._config.asset_url
+        Args:
+            path: The manifest key to render.
+            attrs_key: Script attributes as an ordered tuple of pairs.
+            modulepreload: Emit ``modulepreload`` links for imported chunks.
 
-        for manifest in manifest_entries.values():
-            if "css" in manifest:
-                tags.extend(self._style_tag(urljoin(asset_url_base, css_path)) for css_path in manifest.get("css", []))
+        Returns:
+            A ``(html, tags)`` pair: the joined HTML and the individual tags it is made of.
+        """
+        self._ensure_asset_tag_index()
+        key = (path, attrs_key, modulepreload)
+        rendered = self._asset_tag_index.get(key)
+        if rendered is None:
+            tags = self._render_manifest_entry(path, dict(attrs_key), modulepreload)
+            rendered = self._asset_tag_index[key] = ("".join(tags), tags)
+        return rendered
+
+    def _render_manifest_entry(
+        self, path: str, scripts_attrs: "dict[str, str]", modulepreload: bool
+    ) -> "tuple[str, ...]":
+        """Render the de-duplicated tags for a single manifest entry.
+
+        Stylesheets for the whole import closure come first, followed by the
+        imported chunks (as ``modulepreload`` links or module scripts) in
+        dependency order, and finally the entry itself.
 
-            if "imports" in manifest:
-                tags.extend(
-                    self.generate_asset_tags(vendor_path, scripts_attrs=scripts_attrs)
-                    for vendor_path in manifest.get("imports", [])
-                )
+        Args:
+            path: The manifest key to render.
+            scripts_attrs: Attributes for script tags.
+            modulepreload: Emit ``modulepreload`` links for imported chunks.
 
-            file_path = manifest.get("file", "")
+        Returns:
+            The ordered, de-duplicated tags.
+        """
+        asset_url_base = self._config.asset_url
+        chunks = [(key, self._manifest[key]) for key in self._import_closure(path)]
+
+        tags: list[str] = [
+            self._style_tag(urljoin(asset_url_base, css_path))
+            for _, chunk in chunks
+            for css_path in chunk.get("css", [])
+        ]
+        for key, chunk in chunks:
+            file_path = chunk.get("file", "")
+            url = urljoin(asset_url_base, file_path)
             if file_path.endswith(".css"):
-                tags.append(self._style_tag(urljoin(asset_url_base, file_path)))
+                tags.append(self._style_tag(url))
+            elif modulepreload and key != path:
+                tags.append(self._modulepreload_tag(url))
             else:
-                tags.append(self._script_tag(urljoin(asset_url_base, file_path), attrs=scripts_attrs))
+                tags.append(self._script_tag(url, attrs=scripts_attrs))
+        return tuple(dict.fromkeys(tags))
+
+    def preload_links(self, entries: "Sequence[str] | None" = None) -> "tuple[str, ...]":
+        """Return ``Link`` header values that preload the critical assets of manifest entries.
 
-        return "".join(tags)
+        Stylesheets are preloaded ``as=style``, the entry and its static imports
+        as ``modulepreload`` and fonts referenced by those chunks ``as=font``.
+        The result is memoized until ``version_id`` changes.
+
+        Args:
+            entries: Manifest keys to preload. Defaults to ``RuntimeConfig.preload_entries``,
+                or every chunk flagged ``isEntry`` when that is empty. Unknown keys are ignored.
+
+        Returns:
+            The link values in fetch-priority order, or an empty tuple in hot-dev mode.
+        """
+        if self._is_hot_dev or not self._manifest:
+            return ()
+        self._ensure_asset_tag_index()
+        if entries is None:
+            entries = self._config.runtime.preload_entries or [
+                key
+                for key, chunk in self._manifest.items()
+                if isinstance(chunk, dict) and cast("dict[str, Any]", chunk).get("isEntry")
+            ]
+        key = tuple(entry for entry in entries if entry in self._manifest)
+        cached = self._preload_link_index.get(key)
+        if cached is not None:
+            return cached
+
+        asset_url_base = self._config.asset_url
+        chunks = [self._manifest[chunk_key] for entry in key for chunk_key in self._import_closure(entry)]
+        links: list[str] = [
+            f"<{urljoin(asset_url_base, css_path)}>; rel=preload; as=style"
+            for chunk in chunks
+            for css_path in chunk.get("css", [])
+        ]
+        for chunk in chunks:
+            file_path = chunk.get("file", "")
+            url = urljoin(asset_url_base, file_path)
+            links.append(
+                f"<{url}>; rel=preload; as=style" if file_path.endswith(".css") else f"<{url}>; rel=modulepreload"
+            )
+        for chunk in chunks:
+            for asset_path in chunk.get("assets", []):
+                font_type = _FONT_TYPES.get(Path(asset_path).suffix.lower())
+                if font_type is not None:
+                    links.append(
+                        f"<{urljoin(asset_url_base, asset_path)}>; rel=preload; as=font; type={font_type}; crossorigin"
+                    )
+
+        result = self._preload_link_index[key] = tuple(dict.fromkeys(links))
+        return result
+
+    def preload_link_header(self, entries: "Sequence[str] | None" = None) -> str:
+        """Return the ``Link`` response header value for ``preload_links``.
+
+        Args:
+            entries: Manifest keys to preload (see ``preload_links``).
+
+        Returns:
+            A comma-separated ``Link`` header value, or an empty string when there is nothing to preload.
+        """
+        return ", ".join(self.preload_links(entries))
+
+    def _import_closure(self, path: str) -> "tuple[str, ...]":
+        """Return the transitive static imports of ``path`` in dependency order.
+
+        The result is topologically sorted (each chunk appears after everything
+        it imports, with ``path`` last), lists each chunk exactly once, and is
+        safe against import cycles. Closures are memoized per manifest.
+
+        Args:
+            path: The manifest key to resolve.
+
+        Returns:
+            The manifest keys of the import closure, ``path`` included.
+
+        Raises:
+            ImproperlyConfiguredException: If an imported chunk is missing from the manifest.
+        """
+        from litestar.exceptions import ImproperlyConfiguredException
+
+        self._ensure_asset_tag_index()
+        cached = self._import_graph.get(path)
+        if cached is not None:
+            return cached
+
+        order: list[str] = []
+        visited: set[str] = set()
+        stack: list[tuple[str, Iterator[str]]] = []
+
+        def enter(key: str) -> None:
+            chunk = self._manifest.get(key)
+            if chunk is None:
+                msg = "Cannot find %s in the Vite manifest. Run 'litestar assets build' and retry."
+                raise ImproperlyConfiguredException(msg, [key])
+            visited.add(key)
+            stack.append((key, iter(chunk.get("imports", []))))
+
+        enter(path)
+        while stack:
+            key, imports = stack[-1]
+            for dep in imports:
+                if dep not in visited:
+                    enter(dep)
+                    break
+            else:
+                stack.pop()
+                order.append(key)
+
+        closure = self._import_graph[path] = tuple(order)
+        return closure
 
     def _vite_server_url(self, path: "str | None" = None) -> str:
         """Generate a URL to an asset on the Vite development server.
@@ -548,6 +837,18 @@ class ViteAssetLoader:
         attrs_prefix = f"{attrs_str} " if attrs_str else ""
         return f'<script {attrs_prefix}src="{src}"></script>'
 
+    @staticmethod
+    def _modulepreload_tag(href: str) -> str:
+        """Generate an HTML modulepreload link tag.
+
+        Args:
+            href: The URL to the JavaScript module.
+
+        Returns:
+            HTML link tag string.
+        """
+        return f'<link rel="modulepreload" href="{href}" />'
+
     @staticmethod
     def _style_tag(href: str) -> str:
         """Generate an HTML link tag for CSS.
@@ -6,7 +6,10 @@ module so ``litestar_vite.plugin`` stays a thin re-export surface.
 
 import importlib
 import os
+import re
+import weakref
 from contextlib import asynccontextmanager, contextmanager
+from dataclasses import replace
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import urlsplit
@@ -14,14 +17,15 @@ from urllib.parse import urlsplit
 import httpx
 from litestar.exceptions import NotFoundException, SerializationException
 from litestar.middleware import DefineMiddleware
+from litestar.middleware.compression import CompressionMiddleware
 from litestar.plugins import CLIPlugin, InitPlugin
 from litestar.serialization import decode_json
-from litestar.static_files import create_static_files_router  # pyright: ignore[reportUnknownVariableType]
 
 from litestar_vite.config import JINJA_INSTALLED, TRUE_VALUES, ExternalDevServer, TypeGenConfig
 from litestar_vite.loader import ViteAssetLoader
 from litestar_vite.plugin._process import ViteProcess
 from litestar_vite.plugin._proxy import (
+    UpstreamProxy,
     ViteProxyMiddleware,
     create_disabled_vite_hmr_handlers,
     create_ssr_http_proxy_handler,
@@ -30,7 +34,9 @@ from litestar_vite.plugin._proxy import (
 )
 from litestar_vite.plugin._proxy_headers import ProxyHeadersMiddleware
 from litestar_vite.plugin._static import StaticPlacement, StaticServerConfig, StaticServerMount
+from litestar_vite.plugin._static_files import StaticAssetCache, create_vite_static_files_router
 from litestar_vite.plugin._utils import (
+    RoutePrefixMatcher,
     build_litestar_route_prefixes,
     create_proxy_client,
     is_non_serving_assets_cli,
@@ -51,9 +57,10 @@ if TYPE_CHECKING:
     from click import Group
     from litestar import Litestar
     from litestar.config.app import AppConfig
-    from litestar.types import ControllerRouterHandler, ExceptionHandlersMap
+    from litestar.types import ControllerRouterHandler, ExceptionHandlersMap, Message, Scope, Send
 
-    from litestar_vite.config import ViteConfig
+    from litestar_vite.codegen import BackgroundExport
+    from litestar_vite.config import FrameworkProxyConfig, ViteConfig
     from litestar_vite.config._inertia import InertiaSSRConfig
     from litestar_vite.handler import AppHandler
     from litestar_vite.plugin._static import StaticFilesConfig
@@ -101,6 +108,48 @@ def _user_has_root_http_handler(route_handlers: "Iterable[ControllerRouterHandle
     return any(_walk(item) for item in route_handlers or [])
 
 
+class _PrecompressedAwareCompressionMiddleware(CompressionMiddleware):
+    """Compression middleware that forwards responses already carrying a ``Content-Encoding``."""
+
+    def create_compression_send_wrapper(self, send: "Send", compression_encoding: str, scope: "Scope") -> "Send":
+        compress = super().create_compression_send_wrapper(send, compression_encoding, scope)
+        passthrough = False
+
+        async def send_wrapper(message: "Message") -> None:
+            nonlocal passthrough
+            if message["type"] == "http.response.start":
+                passthrough = any(name.lower() == b"content-encoding" for name, _ in message.get("headers", ()))
+            await (send if passthrough else compress)(message)
+
+        return send_wrapper
+
+
+def _exclude_static_from_compression(app_config: "AppConfig", opt: "dict[str, Any]", asset_url: str) -> None:
+    """Keep Litestar's compression middleware from compressing precompressed static files twice.
+
+    The stock middleware does not check for an existing ``Content-Encoding`` and would compress
+    a ``.br`` or ``.gz`` sibling a second time. It is swapped for a subclass that forwards such
+    responses unchanged, so assets without a sibling are still compressed on the fly. A custom
+    ``middleware_class`` is left alone; the static router is excluded from it instead, through
+    ``exclude_opt_key`` when configured or otherwise an ``exclude`` pattern for ``asset_url``.
+    """
+    compression_config = app_config.compression_config
+    if compression_config is None:
+        return
+    if compression_config.middleware_class is CompressionMiddleware:
+        app_config.compression_config = replace(
+            compression_config, middleware_class=_PrecompressedAwareCompressionMiddleware
+        )
+        return
+    if compression_config.exclude_opt_key:
+        opt[compression_config.exclude_opt_key] = True
+        return
+    exclude = compression_config.exclude
+    patterns = [exclude] if isinstance(exclude, str) else list(exclude or [])
+    patterns.append(f"^{re.escape(asset_url)}")
+    app_config.compression_config = replace(compression_config, exclude=patterns)
+
+
 class VitePlugin(InitPlugin, CLIPlugin):
     """Vite plugin for Litestar.
 
@@ -124,15 +173,18 @@ class VitePlugin(InitPlugin, CLIPlugin):
     """
 
     __slots__ = (
+        "_asset_cache",
         "_asset_loader",
         "_config",
         "_proxy_client",
         "_proxy_target",
+        "_route_matcher",
         "_route_prefix_cache",
         "_spa_handler",
-        "_ssr_process",
+        "_ssr_processes",
         "_static_files_config",
         "_static_files_config_supplied",
+        "_upstream_proxies",
         "_vite_process",
     )
 
@@ -156,13 +208,16 @@ class VitePlugin(InitPlugin, CLIPlugin):
         self._config = config
         self._asset_loader = asset_loader
         self._vite_process: "ViteProcess | None" = None
-        self._ssr_process: "ViteProcess | None" = None
+        self._ssr_processes: "list[ViteProcess]" = []
         self._static_files_config: "StaticFilesConfig | None" = static_files_config
         self._static_files_config_supplied = static_files_config is not None
         self._proxy_target: "str | None" = None
         self._proxy_client: "httpx.AsyncClient | None" = None
+        self._upstream_proxies: "weakref.WeakSet[UpstreamProxy]" = weakref.WeakSet()
         self._route_prefix_cache: tuple[str, ...] | None = None
+        self._route_matcher: "RoutePrefixMatcher | None" = None
         self._spa_handler: "AppHandler | None" = None
+        self._asset_cache: "StaticAssetCache | None" = None
 
     def _get_vite_process(self) -> ViteProcess:
         """Get or create the Vite process manager lazily."""
@@ -178,15 +233,15 @@ class VitePlugin(InitPlugin, CLIPlugin):
             return False
         return is_non_serving_context()
 
-    def _get_ssr_process(self) -> ViteProcess:
-        """Get or create the SSR process manager lazily.
+    def _get_ssr_process(self, index: int = 0) -> ViteProcess:
+        """Get or create the SSR process manager for worker ``index`` lazily.
 
-        Returns a separate ViteProcess instance so SSR has its own tracked cleanup
-        and stop() lifecycle independent of Vite.
+        Returns a separate ViteProcess instance per SSR worker so each has its own
+        tracked cleanup, restart supervision and stop() lifecycle independent of Vite.
         """
-        if self._ssr_process is None:
-            self._ssr_process = ViteProcess(executor=self._config.executor)
-        return self._ssr_process
+        while len(self._ssr_processes) <= index:
+            self._ssr_processes.append(ViteProcess(executor=self._config.executor))
+        return self._ssr_processes[index]
 
     def _resolved_ssr_config(self) -> "InertiaSSRConfig | None":
         """Return the active InertiaSSRConfig when Inertia + SSR are enabled."""
@@ -198,22 +253,32 @@ class VitePlugin(InitPlugin, CLIPlugin):
         return inertia.ssr_config
 
     def _run_ssr_health_check(self, ssr_config: "InertiaSSRConfig") -> None:
-        """Poll the SSR url until it responds (or until timeout)."""
+        """Poll every SSR worker url until it responds (or until timeout)."""
         import time
         from urllib.parse import urlparse
 
         deadline = time.monotonic() + ssr_config.health_check_timeout
         # Poll the origin (a GET on /render typically returns 405; any non-connection
         # error means the server is up).
-        parsed = urlparse(ssr_config.url)
-        origin = f"{parsed.scheme}://{parsed.netloc}"
+        sockets: list[str | None] = [*ssr_config.worker_sockets] or [None] * ssr_config.workers
+        pending = {
+            f"{parsed.scheme}://{parsed.netloc}": socket_path
+            for parsed, socket_path in zip(map(urlparse, ssr_config.worker_urls), sockets, strict=True)
+        }
         while time.monotonic() < deadline:
-            try:
-                response = httpx.get(origin, timeout=2.0)
-                if response.status_code < 500:
-                    return
-            except httpx.RequestError as exc:
-                str(exc)
+            for origin, socket_path in list(pending.items()):
+                try:
+                    if socket_path is None:
+                        response = httpx.get(origin, timeout=2.0)
+                    else:
+                        with httpx.Client(transport=httpx.HTTPTransport(uds=socket_path), timeout=2.0) as client:
+                            response = client.get(origin)
+                    if response.status_code < 500:
+                        del pending[origin]
+                except httpx.RequestError as exc:
+                    str(exc)
+            if not pending:
+                return
             time.sleep(0.25)
         log_warn(
             f"Inertia SSR server did not become ready within {ssr_config.health_check_timeout}s.",
@@ -264,6 +329,14 @@ class VitePlugin(InitPlugin, CLIPlugin):
         """
         return self._proxy_client
 
+    def register_upstream_proxy(self, upstream: "UpstreamProxy") -> None:
+        """Close ``upstream``'s fallback client when the app lifespan ends.
+
+        Args:
+            upstream: A proxy created for this plugin.
+        """
+        self._upstream_proxies.add(upstream)
+
     def get_static_server_config(self) -> StaticServerConfig:
         """Describe where the production static bundle should be served from.
 
@@ -555,7 +628,24 @@ class VitePlugin(InitPlugin, CLIPlugin):
         }
         user_config = self._static_files_config.as_router_kwargs() if self._static_files_config else {}
         static_files_config: dict[str, Any] = {**base_config, **user_config}
-        app_config.route_handlers.append(create_static_files_router(**static_files_config))
+        # Precompressed siblings are build output; dev serves sources and a possibly stale bundle.
+        encodings = () if self._config.is_dev_mode else self._config.runtime.precompressed_encodings
+        if encodings:
+            _exclude_static_from_compression(app_config, static_files_config["opt"], self._config.asset_url)
+        # An explicit ``cache_control`` keeps its one header for every file.
+        hashed_files = None if "cache_control" in user_config else self._hashed_asset_files
+        # Only the immutable build output is cached, as served with the default headers.
+        cache_size = 0 if self._config.is_dev_mode else self._config.runtime.asset_cache_size
+        if cache_size and hashed_files is not None and not static_files_config.get("send_as_attachment"):
+            self._asset_cache = StaticAssetCache(bundle_dir, cache_size, encodings=encodings)
+        app_config.route_handlers.append(
+            create_vite_static_files_router(
+                encodings=encodings, hashed_files=hashed_files, asset_cache=self._asset_cache, **static_files_config
+            )
+        )
+
+    def _hashed_asset_files(self) -> "frozenset[str]":
+        return self.asset_loader.hashed_files
 
     def _configure_dev_proxy(self, app_config: "AppConfig") -> None:
         """Configure dev proxy middleware and handlers based on the canonical mode.
@@ -670,6 +760,45 @@ class VitePlugin(InitPlugin, CLIPlugin):
                 create_vite_hmr_handler(hotfile_path=hotfile_path, hmr_path=hmr_path, asset_url=self._config.asset_url)
             )
 
+    def _uses_framework_upstreams(self) -> bool:
+        """Return whether production framework mode forwards requests to SSR servers."""
+        return (
+            self._config.wants_html_proxy
+            and not self._config.is_dev_mode
+            and self._config.runtime.framework_proxy is not None
+            and not is_non_serving_assets_cli()
+        )
+
+    def _configure_framework_upstream_proxy(self, app_config: "AppConfig") -> None:
+        """Forward requests no Litestar route claims to the production SSR servers.
+
+        Replaces the SPA handler that otherwise serves the built client bundle. The same
+        catch-all as the development proxy is registered, backed by a pool of the
+        ``RuntimeConfig.framework_proxy`` targets.
+
+        Args:
+            app_config: The Litestar application configuration.
+        """
+        from litestar_vite.plugin._pool import SSRWorkerPool
+
+        proxy_config = cast("FrameworkProxyConfig", self._config.runtime.framework_proxy)
+        pool = SSRWorkerPool(
+            cast("tuple[str, ...]", proxy_config.targets),
+            eject_after=proxy_config.eject_after,
+            eject_seconds=proxy_config.eject_seconds,
+            balance=proxy_config.balance,
+        )
+        user_owns_root = _user_has_root_http_handler(app_config.route_handlers)
+        app_config.route_handlers.append(
+            create_ssr_http_proxy_handler(
+                http2=self._config.http2,
+                plugin=self,
+                paths=["/{path:path}"] if user_owns_root else ["/", "/{path:path}"],
+                upstreams=pool,
+                retries=proxy_config.retries,
+            )
+        )
+
     def on_app_init(self, app_config: "AppConfig") -> "AppConfig":
         """Configure the Litestar application for Vite.
 
@@ -742,7 +871,9 @@ class VitePlugin(InitPlugin, CLIPlugin):
             and not self._config.is_dev_mode
             and self._config.runtime.external_dev_server is not None
         )
-        if use_spa_handler:
+        if self._uses_framework_upstreams():
+            self._configure_framework_upstream_proxy(app_config)
+        elif use_spa_handler:
             self._spa_handler = AppHandler(self._config, csrf_config=app_config.csrf_config)
             app_config.route_handlers.append(self._spa_handler.create_route_handler())
         elif self._config.mode == "hybrid":
@@ -760,6 +891,12 @@ class VitePlugin(InitPlugin, CLIPlugin):
             self._route_prefix_cache = build_litestar_route_prefixes(app, self._config.runtime.extra_route_prefixes)
         return self._route_prefix_cache
 
+    def get_route_matcher(self, app: "Litestar") -> "RoutePrefixMatcher":
+        """Return the matcher compiled from :meth:`get_route_prefixes`, built once."""
+        if self._route_matcher is None:
+            self._route_matcher = RoutePrefixMatcher(self.get_route_prefixes(app))
+        return self._route_matcher
+
     def _check_health(self) -> None:
         """Check if the Vite dev server is running and ready.
 
@@ -825,7 +962,9 @@ class VitePlugin(InitPlugin, CLIPlugin):
 
         This exports OpenAPI schema, route metadata (JSON), typed routes (TypeScript),
         and Inertia pages metadata when type generation is enabled. The Vite plugin
-        watches these files and triggers @hey-api/openapi-ts when they change.
+        watches these files and triggers @hey-api/openapi-ts when they change. The export
+        is skipped while the routes, project sources and settings match the fingerprint
+        stored by the last export.
 
         Uses the shared `export_integration_assets` function to guarantee
         byte-identical output between CLI and plugin.
@@ -842,12 +981,40 @@ class VitePlugin(InitPlugin, CLIPlugin):
             return
 
         try:
-            export_integration_assets(app, self._config)
+            export_integration_assets(app, self._config, skip_if_unchanged=True)
         except (OSError, TypeError, ValueError, ImportError):  # pragma: no cover
-            log_warn(
-                "Vite type metadata export failed; run 'litestar assets generate-types' for details.",
-                level=self._config.logging_config.level,
-            )
+            self._warn_type_export_failed()
+
+    def _warn_type_export_failed(self, _exc: "Exception | None" = None) -> None:
+        """Warn that the type metadata export failed."""
+        log_warn(
+            "Vite type metadata export failed; run 'litestar assets generate-types' for details.",
+            level=self._config.logging_config.level,
+        )
+
+    def _start_type_export(self, app: "Litestar") -> "BackgroundExport | None":
+        """Export type metadata on startup, in the background when configured.
+
+        Args:
+            app: The Litestar application instance.
+
+        Returns:
+            The scheduled background export to close on shutdown, or None when the
+            export ran synchronously or is disabled.
+        """
+        from litestar_vite.codegen import BackgroundExport, typegen_outputs_requested
+
+        types = self._config.types
+        if not isinstance(types, TypeGenConfig) or not types.background_export:
+            self._export_types_sync(app)
+            return None
+        if not typegen_outputs_requested(types):
+            return None
+        export = BackgroundExport(
+            app, self._config, delay=types.background_export_delay, on_error=self._warn_type_export_failed
+        )
+        export.schedule()
+        return export
 
     @contextmanager
     def server_lifespan(self, app: "Litestar") -> "Generator[None, None, None]":
@@ -856,7 +1023,7 @@ class VitePlugin(InitPlugin, CLIPlugin):
         This is called by Litestar CLI before workers start. It handles:
         - Environment variable setup (with logging)
         - Vite dev server process start/stop (ONE instance for all workers)
-        - Type export on startup
+        - Type export on startup (or on a background thread with ``background_export``)
 
         Note: SPA handler and asset loader initialization happens in the per-worker
         `lifespan` method, which is auto-registered in `on_app_init`.
@@ -882,57 +1049,85 @@ class VitePlugin(InitPlugin, CLIPlugin):
             set_environment(config=self._config, app=app)
             set_app_environment(app)
 
-        self._export_types_sync(app)
-
-        ssr_config = self._resolved_ssr_config()
-        ssr_should_start = ssr_config is not None and ssr_config.command is not None and ssr_config.auto_start
-        ssr_process: ViteProcess | None = None
+        type_export = self._start_type_export(app)
+        try:
+            ssr_config = self._resolved_ssr_config()
+            ssr_should_start = ssr_config is not None and ssr_config.command is not None and ssr_config.auto_start
+            ssr_processes: list[ViteProcess] = []
 
-        if self._config.is_dev_mode and self._config.runtime.start_dev_server:
-            ext = self._config.runtime.external_dev_server
-            is_external = isinstance(ext, ExternalDevServer) and ext.enabled
+            if self._config.is_dev_mode and self._config.runtime.start_dev_server:
+                ext = self._config.runtime.external_dev_server
+                is_external = isinstance(ext, ExternalDevServer) and ext.enabled
 
-            command_to_run = self._resolve_dev_command()
-            if is_external and isinstance(ext, ExternalDevServer) and ext.target:
-                self._write_hotfile(ext.target)
+                command_to_run = self._resolve_dev_command()
+                if is_external and isinstance(ext, ExternalDevServer) and ext.target:
+                    self._write_hotfile(ext.target)
 
-            vite_process: ViteProcess | None = None
-            try:
-                vite_process = self._get_vite_process()
-                vite_process.start(command_to_run, self._config.root_dir)
-                if self._config.health_check and not is_external:
-                    self._run_health_check()
-                if ssr_should_start and ssr_config is not None:
-                    ssr_process = self._start_ssr_process(ssr_config)
-                yield
-            finally:
-                self._stop_ssr_process(ssr_process)
-                if vite_process is not None:
-                    vite_process.stop()
-        elif ssr_should_start and ssr_config is not None:
-            try:
-                ssr_process = self._start_ssr_process(ssr_config)
+                vite_process: ViteProcess | None = None
+                try:
+                    vite_process = self._get_vite_process()
+                    vite_process.start(command_to_run, self._config.root_dir)
+                    if self._config.health_check and not is_external:
+                        self._run_health_check()
+                    if ssr_should_start and ssr_config is not None:
+                        ssr_processes = self._start_ssr_processes(ssr_config)
+                    yield
+                finally:
+                    self._stop_ssr_processes(ssr_processes)
+                    if vite_process is not None:
+                        vite_process.stop()
+            elif ssr_should_start and ssr_config is not None:
+                try:
+                    ssr_processes = self._start_ssr_processes(ssr_config)
+                    yield
+                finally:
+                    self._stop_ssr_processes(ssr_processes)
+            else:
                 yield
-            finally:
-                self._stop_ssr_process(ssr_process)
-        else:
-            yield
+        finally:
+            if type_export is not None:
+                type_export.close()
+
+    def _start_ssr_processes(self, ssr_config: "InertiaSSRConfig") -> "list[ViteProcess]":
+        """Spawn the SSR /render Node process(es) and run an optional health check.
 
-    def _start_ssr_process(self, ssr_config: "InertiaSSRConfig") -> "ViteProcess":
-        """Spawn the SSR /render Node process and run an optional health check."""
+        With several workers, each process is started with ``INERTIA_SSR_PORT`` set to
+        the port of its worker URL. With ``unix_socket``, each receives its socket path as
+        ``INERTIA_SSR_SOCKET`` and a stale socket file left by a previous run is removed
+        first. If one process fails to start, those already running are stopped.
+        """
         if ssr_config.command is None:  # pragma: no cover - guarded by callers
             msg = "InertiaSSRConfig.command must be set to spawn the SSR process"
             raise ValueError(msg)
-        process = self._get_ssr_process()
         cwd = ssr_config.cwd or self._config.root_dir
-        process.start(ssr_config.command, cwd)
+        sockets = ssr_config.worker_sockets
+        processes: list[ViteProcess] = []
+        try:
+            for index, url in enumerate(ssr_config.worker_urls):
+                env: dict[str, str] = {}
+                if ssr_config.workers > 1:
+                    env["INERTIA_SSR_PORT"] = str(urlsplit(url).port)
+                if sockets:
+                    socket_path = Path(sockets[index])
+                    if socket_path.is_socket():
+                        socket_path.unlink()
+                    env["INERTIA_SSR_SOCKET"] = str(socket_path)
+                process = self._get_ssr_process(index)
+                processes.append(process)
+                if env:
+                    process.start(ssr_config.command, cwd, env=env)
+                else:
+                    process.start(ssr_config.command, cwd)
+        except BaseException:
+            self._stop_ssr_processes(processes)
+            raise
         if ssr_config.health_check:
             self._run_ssr_health_check(ssr_config)
-        return process
+        return processes
 
-    def _stop_ssr_process(self, ssr_process: "ViteProcess | None") -> None:
-        """Stop the SSR process if one was started."""
-        if ssr_process is not None:
+    def _stop_ssr_processes(self, ssr_processes: "list[ViteProcess]") -> None:
+        """Stop the SSR processes that were started."""
+        for ssr_process in ssr_processes:
             ssr_process.stop()
 
     @asynccontextmanager
@@ -963,8 +1158,16 @@ class VitePlugin(InitPlugin, CLIPlugin):
 
         # Initialize shared proxy client for ViteProxyMiddleware/SSRProxyController
         # Uses connection pooling for better performance (HTTP/2 multiplexing, TLS reuse)
-        if self._config.is_dev_mode and self._config.proxy_mode is not None:
-            self._proxy_client = create_proxy_client(http2=self._config.http2)
+        if (self._config.is_dev_mode and self._config.proxy_mode is not None) or self._uses_framework_upstreams():
+            runtime = self._config.runtime
+            self._proxy_client = create_proxy_client(
+                http2=self._config.http2,
+                timeout=runtime.proxy_read_timeout,
+                max_keepalive=runtime.proxy_max_keepalive_connections,
+                max_connections=runtime.proxy_max_connections,
+                connect_timeout=runtime.proxy_connect_timeout,
+                pool_timeout=runtime.proxy_pool_timeout,
+            )
 
         if self._asset_loader is None:
             self._asset_loader = ViteAssetLoader(config=self._config)
@@ -973,6 +1176,13 @@ class VitePlugin(InitPlugin, CLIPlugin):
         if self._spa_handler is not None and not self._spa_handler.is_initialized:
             await self._spa_handler.initialize_async(vite_url=self._proxy_target, manifest=self._asset_loader.manifest)
 
+        if self._asset_cache is not None:
+            # JS and CSS first: they block rendering, and small chunks are the bulk of requests.
+            hashed_files = sorted(
+                self._asset_loader.hashed_files, key=lambda path: (not path.endswith((".js", ".css")), path)
+            )
+            await self._asset_cache.warm(hashed_files)
+
         is_ssr_mode = self._config.wants_html_proxy
         if not self._config.is_dev_mode and not self._config.has_built_assets() and not is_ssr_mode:
             log_warn(
@@ -987,5 +1197,7 @@ class VitePlugin(InitPlugin, CLIPlugin):
             if self._proxy_client is not None:
                 await self._proxy_client.aclose()
                 self._proxy_client = None
+            for upstream in list(self._upstream_proxies):
+                await upstream.aclose()
             if self._spa_handler is not None:
                 await self._spa_handler.shutdown_async()
@@ -0,0 +1,110 @@
+"""Load balancing across several render server processes.
+
+:class:`SSRWorkerPool` picks the URL for each request to a pool of SSR servers: the
+healthy worker with the fewest requests in flight. Workers that keep refusing connections
+are ejected for a cool-down period, while their process supervisor restarts them. It backs
+both the Inertia SSR client and the production framework proxy.
+"""
+
+import time
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+__all__ = ("SSRWorker", "SSRWorkerPool")
+
+
+class SSRWorker:
+    """Health and load state of one SSR server."""
+
+    __slots__ = ("ejected_until", "failures", "outstanding", "url")
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.outstanding = 0
+        self.failures = 0
+        self.ejected_until = 0.0
+
+    def is_available(self, now: float) -> bool:
+        """Return whether the worker may receive renders.
+
+        Args:
+            now: The current :func:`time.monotonic` value.
+
+        Returns:
+            True unless the worker is inside its ejection window.
+        """
+        return self.ejected_until <= now
+
+
+class SSRWorkerPool:
+    """Spread SSR renders across workers by least outstanding requests or in turn.
+
+    Callers :meth:`acquire` a worker, post the render to its ``url`` and hand it back with
+    :meth:`release`. A worker that fails ``eject_after`` times in a row is skipped for
+    ``eject_seconds``; afterwards it receives renders again and is ejected on its next
+    failure. When every worker is ejected, renders still go to the least loaded one so
+    the error surfaces to the caller instead of a silent drop.
+    """
+
+    __slots__ = ("_next", "balance", "eject_after", "eject_seconds", "workers")
+
+    def __init__(
+        self,
+        urls: "Sequence[str]",
+        *,
+        eject_after: int = 3,
+        eject_seconds: float = 10.0,
+        balance: Literal["least_connections", "round_robin"] = "least_connections",
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            urls: Render URL of every worker.
+            eject_after: Consecutive failures before a worker is ejected.
+            eject_seconds: Seconds an ejected worker is skipped.
+            balance: Pick the worker with the fewest requests in flight, or take the
+                available workers in turn.
+        """
+        self.workers = [SSRWorker(url) for url in urls]
+        self.eject_after = eject_after
+        self.eject_seconds = eject_seconds
+        self.balance = balance
+        self._next = 0
+
+    def acquire(self) -> SSRWorker:
+        """Return the worker for the next render and count it as in flight.
+
+        Ties are broken round-robin so idle workers share the load evenly.
+
+        Returns:
+            The chosen worker.
+        """
+        now = time.monotonic()
+        count = len(self.workers)
+        candidates = [self.workers[(self._next + offset) % count] for offset in range(count)]
+        available = [worker for worker in candidates if worker.is_available(now)] or candidates
+        if self.balance == "round_robin":
+            worker = available[0]
+        else:
+            worker = min(available, key=lambda candidate: candidate.outstanding)
+        self._next = (self._next + 1) % count
+        worker.outstanding += 1
+        return worker
+
+    def release(self, worker: SSRWorker, *, healthy: bool = True) -> None:
+        """Return a worker after a render.
+
+        Args:
+            worker: The worker returned by :meth:`acquire`.
+            healthy: False when the worker could not be reached.
+        """
+        worker.outstanding -= 1
+        if healthy:
+            worker.failures = 0
+            worker.ejected_until = 0.0
+            return
+        worker.failures += 1
+        if worker.failures >= self.eject_after:
+            worker.ejected_until = time.monotonic() + self.eject_seconds
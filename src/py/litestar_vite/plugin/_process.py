@@ -49,6 +49,7 @@ class ViteProcess:
         self._executor = executor
         self._restart_command: "list[str] | None" = None
         self._restart_cwd: "Path | None" = None
+        self._restart_env: "dict[str, str] | None" = None
         self._restart_error: "ViteProcessError | None" = None
         self._stopping = False
         self._watcher_generation = 0
@@ -70,12 +71,13 @@ class ViteProcess:
                 instance.stop()
         cls._instances.clear()
 
-    def start(self, command: list[str], cwd: "Path | str | None") -> None:
+    def start(self, command: list[str], cwd: "Path | str | None", env: "dict[str, str] | None" = None) -> None:
         """Start the Vite process.
 
         Args:
             command: The command to run (e.g., ["npm", "run", "dev"]).
             cwd: The working directory for the process.
+            env: Extra environment variables for the process, reapplied on restart.
 
         If the process exits immediately, this method captures stdout/stderr and raises a
         ViteProcessError with diagnostic details.
@@ -97,6 +99,7 @@ class ViteProcess:
                     self._restart_error = None
                     self._restart_command = list(command)
                     self._restart_cwd = cwd
+                    self._restart_env = env
                     self.process = self._spawn_process(command, cwd, raise_immediate_exit=True)
                     self._watcher_generation += 1
                     self._start_watcher(self._watcher_generation)
@@ -139,7 +142,10 @@ class ViteProcess:
 
     def _spawn_process(self, command: list[str], cwd: Path, *, raise_immediate_exit: bool) -> "subprocess.Popen[Any]":
         """Start a child process and optionally fail fast for immediate exits."""
-        process = self._executor.run(command, cwd)
+        if self._restart_env:
+            process = self._executor.run(command, cwd, env=self._restart_env)
+        else:
+            process = self._executor.run(command, cwd)
         self._start_stderr_drain(process)
         if process and process.poll() is not None:
             error = self._build_immediate_exit_error(process, command)
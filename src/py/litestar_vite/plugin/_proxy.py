@@ -1,5 +1,6 @@
 """HTTP/WebSocket proxy middleware and HMR handlers."""
 
+import asyncio
 import logging
 import time
 from collections.abc import AsyncGenerator, Awaitable
@@ -20,16 +21,20 @@ from litestar_vite.utils import read_hotfile_url
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from contextlib import AbstractAsyncContextManager
 
     from litestar.types import ASGIApp, Receive, Scope, Send
     from websockets.typing import Subprotocol
 
     from litestar_vite.plugin import VitePlugin
+    from litestar_vite.plugin._pool import SSRWorker, SSRWorkerPool
 
 _DISCONNECT_EXCEPTIONS = (WebSocketDisconnect, anyio.ClosedResourceError, websockets.ConnectionClosed)
 
 _BODY_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
 
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
 _PROXY_ALLOW_PREFIXES: tuple[str, ...] = (
     "/@vite",
     "/@id/",
@@ -123,6 +128,14 @@ _HOTFILE_REVALIDATE_TTL_SECONDS = 0.3
 
 _NO_CONNECTION_TOKENS: "frozenset[str]" = frozenset()
 
+# ASGI servers lower-case request header names, so raw request headers are filtered as bytes.
+_RAW_REQUEST_SKIP_HEADERS = frozenset(name.encode("latin-1") for name in _REQUEST_SKIP_HEADERS)
+_RAW_RESPONSE_SKIP_HEADERS = frozenset(name.encode("latin-1") for name in _HOP_BY_HOP_HEADERS)
+
+# Used when the proxy runs without a VitePlugin; mirrors the RuntimeConfig defaults.
+_DEFAULT_PROXY_TIMEOUT = httpx.Timeout(30.0, connect=5.0, pool=10.0)
+_DEFAULT_PROXY_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0)
+
 
 def _normalize_header_key(raw_key: Any) -> str:
     """Normalize a raw header key to a lower-cased string."""
@@ -155,11 +168,6 @@ def _collect_connection_tokens(headers: Any) -> "frozenset[str]":
     return frozenset(tokens) if tokens else _NO_CONNECTION_TOKENS
 
 
-def _filter_hop_by_hop_headers(headers: Any) -> list[tuple[str, str]]:
-    """Filter hop-by-hop headers while preserving case-sensitive duplicates and order."""
-    return _extract_request_headers(headers)
-
-
 def _extract_request_headers(headers: Any, extra_skip_headers: "frozenset[str] | None" = None) -> list[tuple[str, str]]:
     """Extract request headers, excluding hop-by-hop and optional additional skip headers.
 
@@ -188,6 +196,20 @@ def _extract_request_headers(headers: Any, extra_skip_headers: "frozenset[str] |
     return filtered
 
 
+def _filter_raw_request_headers(headers: "list[tuple[bytes, bytes]]") -> "list[tuple[bytes, bytes]]":
+    """Filter hop-by-hop headers from raw ASGI request headers without decoding them.
+
+    Falls back to :func:`_extract_request_headers` when a ``Connection`` header lists
+    additional hop-by-hop names.
+
+    Returns:
+        The headers to forward upstream.
+    """
+    if any(key == b"connection" for key, _ in headers):
+        return [(key.encode("latin-1"), value.encode("latin-1")) for key, value in _extract_request_headers(headers)]
+    return [(key, value) for key, value in headers if key not in _RAW_REQUEST_SKIP_HEADERS]
+
+
 def _extract_proxy_response_headers(headers: "httpx.Headers") -> list[tuple[bytes, bytes]]:
     """Extract response headers while preserving duplicates and filtering hop-by-hop headers.
 
@@ -197,20 +219,13 @@ def _extract_proxy_response_headers(headers: "httpx.Headers") -> list[tuple[byte
     Returns:
         A list of (header_name, header_value) tuples.
     """
-    hop_by_hop = set(_HOP_BY_HOP_HEADERS)
-    # Collect dynamically-declared hop-by-hop headers from Connection header
-    hop_by_hop.update(
-        _collect_connection_tokens((key.decode("latin-1"), value.decode("latin-1")) for key, value in headers.raw)
-    )
-
-    extracted: list[tuple[bytes, bytes]] = []
-    for key, value in headers.raw:
-        lower_key = key.decode("latin-1").lower()
-        if lower_key in hop_by_hop:
-            continue
-        extracted.append((key, value))
-
-    return extracted
+    raw = [(key.lower(), key, value) for key, value in headers.raw]
+    hop_by_hop: "frozenset[bytes] | set[bytes]" = _RAW_RESPONSE_SKIP_HEADERS
+    if any(lower_key == b"connection" for lower_key, _, _ in raw):
+        # Collect dynamically-declared hop-by-hop headers from Connection header
+        tokens = _collect_connection_tokens((key, value) for _, key, value in raw)
+        hop_by_hop = _RAW_RESPONSE_SKIP_HEADERS | {token.encode("latin-1") for token in tokens}
+    return [(key, value) for lower_key, key, value in raw if lower_key not in hop_by_hop]
 
 
 async def _stream_request_body(receive: "Callable[[], Awaitable[dict[str, Any]]]") -> AsyncGenerator[bytes, None]:
@@ -259,6 +274,83 @@ async def _proxy_stream_response(
     await send({"type": "http.response.body", "body": b"", "more_body": False})
 
 
+async def _forward_upstream_stream(
+    stream_context: "AbstractAsyncContextManager[httpx.Response]", response: "httpx.Response", send: "Send"
+) -> None:
+    """Stream an opened upstream response to the client, then exit its stream context."""
+    try:
+        await _proxy_stream_response(response=response, send=cast("Callable[[dict[str, Any]], Any]", send))
+    finally:
+        try:
+            await stream_context.__aexit__(None, None, None)
+        except (RuntimeError, OSError, httpx.HTTPError) as exc:
+            _LOGGER.debug("Failed to close SSR proxy stream context cleanly: %s", exc)
+
+
+class UpstreamProxy:
+    """Forward HTTP requests to an upstream server over one pooled, keep-alive client.
+
+    The shared :attr:`VitePlugin.proxy_client <litestar_vite.plugin.VitePlugin.proxy_client>`
+    is used whenever it exists, so its connect/read/pool timeouts and pool sizes from
+    ``RuntimeConfig`` apply. Without one (a proxy used outside the plugin lifespan), a
+    client is created on first use and reused for every later request on the same event
+    loop, never per request. The plugin closes that client when its lifespan ends; a proxy
+    created without a plugin is closed with :meth:`aclose`.
+    """
+
+    __slots__ = ("__weakref__", "_client", "_client_loop", "_http2", "_plugin")
+
+    def __init__(self, *, http2: bool = True, plugin: "VitePlugin | None" = None) -> None:
+        """Initialize the proxy.
+
+        Args:
+            http2: Enable HTTP/2 for the fallback client when the ``h2`` package is installed.
+            plugin: The plugin owning the shared proxy client.
+        """
+        self._http2 = http2
+        self._plugin = plugin
+        self._client: "httpx.AsyncClient | None" = None
+        self._client_loop: "asyncio.AbstractEventLoop | None" = None
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """Return the client requests are sent with."""
+        shared = self._plugin.proxy_client if self._plugin is not None else None
+        if shared is not None:
+            return shared
+        loop = asyncio.get_running_loop()
+        # A client's connections belong to the loop that opened them.
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                http2=check_http2_support(self._http2), timeout=_DEFAULT_PROXY_TIMEOUT, limits=_DEFAULT_PROXY_LIMITS
+            )
+            self._client_loop = loop
+            if self._plugin is not None:
+                self._plugin.register_upstream_proxy(self)
+        return self._client
+
+    def stream(
+        self,
+        method: str,
+        url: str,
+        headers: "list[tuple[bytes, bytes]] | list[tuple[str, str]]",
+        body: "AsyncGenerator[bytes, None] | None",
+    ) -> "AbstractAsyncContextManager[httpx.Response]":
+        """Open a streamed upstream request.
+
+        Returns:
+            A context manager yielding the response once its headers arrived.
+        """
+        return self.client.stream(method, url, headers=headers, content=body, follow_redirects=False)
+
+    async def aclose(self) -> None:
+        """Close the fallback client, if one was created on the running event loop."""
+        client, self._client = self._client, None
+        if client is not None and self._client_loop is asyncio.get_running_loop():
+            await client.aclose()
+        self._client_loop = None
+
+
 class ViteProxyMiddleware(AbstractMiddleware):
     """ASGI middleware to proxy Vite dev HTTP traffic to internal Vite server.
 
@@ -289,6 +381,7 @@ class ViteProxyMiddleware(AbstractMiddleware):
         self.asset_prefix = normalize_prefix(asset_url) if asset_url else "/"
         self.http2 = http2
         self._plugin = plugin
+        self._upstream = UpstreamProxy(http2=http2, plugin=plugin)
         self._proxy_allow_prefixes = normalize_proxy_prefixes(
             base_prefixes=_PROXY_ALLOW_PREFIXES,
             asset_url=asset_url,
@@ -376,33 +469,16 @@ class ViteProxyMiddleware(AbstractMiddleware):
         if query_string:
             url = f"{url}?{query_string}"
 
-        headers = _filter_hop_by_hop_headers(scope.get("headers", []))
+        headers = _filter_raw_request_headers(scope.get("headers", []))
         # Only stream request body for methods that carry a body.
         # Passing an async generator as content for GET/HEAD/OPTIONS causes httpx
         # to add Transfer-Encoding: chunked, which Vite dev server rejects with 400.
         # See: https://github.com/litestar-org/litestar-vite/issues/242
         request_body = _stream_request_body(receive) if method in _BODY_METHODS else None
 
-        # Use shared client from plugin when available (connection pooling)
-        client = self._plugin.proxy_client if self._plugin is not None else None
-
         try:
-            if client is not None:
-                # Use shared client (connection pooling, HTTP/2 multiplexing)
-                async with client.stream(
-                    method, url, headers=headers, content=request_body, timeout=10.0, follow_redirects=False
-                ) as upstream_resp:
-                    await _proxy_stream_response(upstream_resp, send)
-            else:
-                # Fallback: per-request client (graceful degradation)
-                http2_enabled = check_http2_support(self.http2)
-                async with (
-                    httpx.AsyncClient(http2=http2_enabled) as fallback_client,
-                    fallback_client.stream(
-                        method, url, headers=headers, content=request_body, timeout=10.0, follow_redirects=False
-                    ) as upstream_resp,
-                ):
-                    await _proxy_stream_response(upstream_resp, send)
+            async with self._upstream.stream(method, url, headers, request_body) as upstream_resp:
+                await _proxy_stream_response(upstream_resp, send)
         except Exception as exc:  # noqa: BLE001  # pragma: no cover - catch all cleanup errors
             await send({"type": "http.response.start", "status": 502, "headers": [(b"content-type", b"text/plain")]})
             await send({"type": "http.response.body", "body": f"Upstream error: {exc}".encode(), "more_body": False})
@@ -845,6 +921,7 @@ class SSRProxyMiddleware(AbstractMiddleware):
         super().__init__(app)
         self._http2 = http2
         self._plugin = plugin
+        self._upstream = UpstreamProxy(http2=http2, plugin=plugin)
         self._get_target_url = create_target_url_getter(target, hotfile_path, [target])
 
     def _get_target_base_url(self) -> "str | None":
@@ -902,29 +979,15 @@ class SSRProxyMiddleware(AbstractMiddleware):
         if is_proxy_debug():
             console.print(f"[dim][ssr-proxy] {method} {raw_path} → {url}[/]")
 
-        headers = _filter_hop_by_hop_headers(scope.get("headers", []))
+        headers = _filter_raw_request_headers(scope.get("headers", []))
         # #246 invariant: only stream a body for methods that carry one. Sending an
         # async generator as content for GET/HEAD/OPTIONS forces Transfer-Encoding: chunked,
         # which Vite-style upstream servers reject with 400.
         request_body = _stream_request_body(receive) if method in _BODY_METHODS else None
 
-        client = self._plugin.proxy_client if self._plugin is not None else None
-
         try:
-            if client is not None:
-                async with client.stream(
-                    method, url, headers=headers, content=request_body, timeout=30.0, follow_redirects=False
-                ) as upstream_resp:
-                    await _proxy_stream_response(upstream_resp, send)
-            else:
-                http2_enabled = check_http2_support(self._http2)
-                async with (
-                    httpx.AsyncClient(http2=http2_enabled, timeout=30.0) as fallback_client,
-                    fallback_client.stream(
-                        method, url, headers=headers, content=request_body, timeout=30.0, follow_redirects=False
-                    ) as upstream_resp,
-                ):
-                    await _proxy_stream_response(upstream_resp, send)
+            async with self._upstream.stream(method, url, headers, request_body) as upstream_resp:
+                await _proxy_stream_response(upstream_resp, send)
         except httpx.ConnectError:
             await send({"type": "http.response.start", "status": 503, "headers": [(b"content-type", b"text/plain")]})
             await send({
@@ -943,6 +1006,8 @@ def create_ssr_http_proxy_handler(
     http2: bool = True,
     plugin: "VitePlugin | None" = None,
     paths: "list[str] | None" = None,
+    upstreams: "SSRWorkerPool | None" = None,
+    retries: int = 0,
 ) -> Any:
     """Create an HTTP catch-all route handler that proxies to an SSR framework dev server.
 
@@ -956,23 +1021,36 @@ def create_ssr_http_proxy_handler(
     when the user has registered a handler at ``/`` so Litestar does not raise
     ``Handler already registered for path '/'`` at app construction.
 
+    In production, ``upstreams`` spreads requests over several SSR servers instead. A
+    server that cannot be reached counts against its health in the pool, and idempotent
+    requests are retried on the next server.
+
     Args:
         target: Static target URL (for external dev servers with a known URL).
         hotfile_path: Path to the hotfile for dynamic target discovery.
         http2: Enable HTTP/2 for proxy connections.
         plugin: Optional VitePlugin reference for accessing the shared proxy client.
         paths: Override the default HTTP paths; defaults to ``["/", "/{path:path}"]``.
+        upstreams: Pool of SSR server base URLs; replaces ``target`` and ``hotfile_path``.
+        retries: Extra attempts for GET, HEAD and OPTIONS requests after a connection error
+            when ``upstreams`` is given.
 
     Returns:
         A Litestar HTTP route handler decorated with ``@route``.
     """
-    from litestar import HttpMethod, Request, Response, route
+    from litestar import HttpMethod, Request, route
+    from litestar.response.base import ASGIResponse
 
     if paths is None:
         paths = ["/", "/{path:path}"]
 
     cached_target: list[str | None] = [target]
     get_target_url = create_target_url_getter(target, hotfile_path, cached_target)
+    upstream = UpstreamProxy(http2=http2, plugin=plugin)
+
+    def _release(worker: "SSRWorker | None", *, healthy: bool) -> None:
+        if upstreams is not None and worker is not None:
+            upstreams.release(worker, healthy=healthy)
 
     @route(
         path=paths,
@@ -990,75 +1068,60 @@ def create_ssr_http_proxy_handler(
         opt={"exclude_from_auth": True},
     )
     async def http_proxy(request: "Request[Any, Any, Any]") -> "ASGIApp":
-        """Proxy any HTTP request to the SSR framework dev server."""
-        target_url = get_target_url()
-        if target_url is None:
-            return cast(
-                "ASGIApp", Response(content=b"SSR server not running", status_code=503, media_type="text/plain")
-            )
+        """Proxy any HTTP request to the SSR framework dev server.
 
+        The upstream request is opened by the returned app, so a response that is never
+        sent holds neither an upstream connection nor a pool worker.
+        """
         req_path: str = request.url.path
-        url = build_proxy_url(target_url, req_path, request.url.query or "")
-
-        if is_proxy_debug():
-            console.print(f"[dim][ssr-proxy] {request.method} {req_path} → {url}[/]")
-
-        headers_to_forward = _filter_hop_by_hop_headers(request.headers.items())
+        headers_to_forward = _filter_raw_request_headers(list(request.scope["headers"]))
         # #246 invariant: GET/HEAD/OPTIONS must not stream a body — Vite-style upstreams
         # reject the resulting Transfer-Encoding: chunked with 400.
         request_body = request.stream() if request.method in _BODY_METHODS else None
+        # Only a request that never reached a server, and is safe to repeat, is retried.
+        attempts = 1 + retries if upstreams is not None and request.method in _IDEMPOTENT_METHODS else 1
 
-        client = plugin.proxy_client if plugin is not None else None
-
-        stream_context: Any = None
-        http_client: httpx.AsyncClient | None = None
-        try:
-            if client is not None:
-                stream_context = client.stream(
-                    request.method,
-                    url,
-                    headers=headers_to_forward,
-                    content=request_body,
-                    follow_redirects=False,
-                    timeout=30.0,
-                )
-            else:
-                http2_enabled = check_http2_support(http2)
-                http_client = httpx.AsyncClient(http2=http2_enabled, timeout=30.0)
-                stream_context = http_client.stream(
-                    request.method, url, headers=headers_to_forward, content=request_body, follow_redirects=False
-                )
-
-            upstream_resp = await stream_context.__aenter__()
-        except httpx.ConnectError:
-            if http_client is not None:
-                await http_client.aclose()
-            return cast(
-                "ASGIApp",
-                Response(
-                    content=f"SSR server not running at {target_url}".encode(), status_code=503, media_type="text/plain"
-                ),
-            )
-        except httpx.HTTPError as exc:
-            if http_client is not None:
-                await http_client.aclose()
-            return cast("ASGIApp", Response(content=str(exc).encode(), status_code=502, media_type="text/plain"))
-
-        async def _close_stream_context() -> None:
-            try:
-                await stream_context.__aexit__(None, None, None)
-                if http_client is not None:
-                    await http_client.aclose()
-            except (RuntimeError, OSError, httpx.HTTPError) as exc:
-                _LOGGER.debug("Failed to close SSR proxy stream context cleanly: %s", exc)
-
-        async def asgi_response_app(_scope: "Scope", _receive: "Receive", send: "Send") -> None:
-            del _scope, _receive
-            await _proxy_stream_response(
-                response=upstream_resp,
-                send=cast("Callable[[dict[str, Any]], Any]", send),
-                close_callback=_close_stream_context,
-            )
+        async def asgi_response_app(scope: "Scope", receive: "Receive", send: "Send") -> None:
+            remaining = attempts
+            while True:
+                worker = upstreams.acquire() if upstreams is not None else None
+                healthy = True
+                try:
+                    target_url = worker.url if worker is not None else get_target_url()
+                    if target_url is None:
+                        unavailable = ASGIResponse(
+                            body=b"SSR server not running", status_code=503, media_type="text/plain"
+                        )
+                        await unavailable(scope, receive, send)
+                        return
+
+                    url = build_proxy_url(target_url, req_path, request.url.query or "")
+                    if is_proxy_debug():
+                        console.print(f"[dim][ssr-proxy] {request.method} {req_path} → {url}[/]")
+
+                    stream_context = upstream.stream(request.method, url, headers_to_forward, request_body)
+                    try:
+                        upstream_resp = await stream_context.__aenter__()
+                    except httpx.ConnectError:
+                        healthy = False
+                        remaining -= 1
+                        if remaining > 0:
+                            continue
+                        error = ASGIResponse(
+                            body=f"SSR server not running at {target_url}".encode(),
+                            status_code=503,
+                            media_type="text/plain",
+                        )
+                    except httpx.HTTPError as exc:
+                        healthy = False
+                        error = ASGIResponse(body=str(exc).encode(), status_code=502, media_type="text/plain")
+                    else:
+                        await _forward_upstream_stream(stream_context, upstream_resp, send)
+                        return
+                    await error(scope, receive, send)
+                    return
+                finally:
+                    _release(worker, healthy=healthy)
 
         return asgi_response_app
 
@@ -0,0 +1,623 @@
+"""Static file serving with precompressed variants and cache validators.
+
+Vite build output is immutable between deploys, so compressing it once at build time is
+cheaper than recompressing every response. :func:`precompress_assets` writes ``.br``,
+``.zst`` and ``.gz`` siblings next to the bundle files, and the router created by
+:func:`create_vite_static_files_router` answers a request for ``app.js`` with the best
+sibling the client's ``Accept-Encoding`` allows, falling back to the file itself.
+Content-hashed files from the manifest are marked immutable and can be held in memory by
+:class:`StaticAssetCache`; other files carry validators for conditional requests.
+"""
+
+import gzip
+import hashlib
+import importlib
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from functools import lru_cache, partial
+from mimetypes import guess_type
+from pathlib import Path, PurePath
+from typing import TYPE_CHECKING, Any, Literal, cast
+from urllib.parse import quote
+
+import anyio
+from litestar import Request, Router, get, head
+from litestar.file_system import BaseLocalFileSystem
+from litestar.params import FromPath
+from litestar.response.base import ASGIResponse
+from litestar.response.file import (
+    ASGIFileResponse,
+    create_etag_for_file,  # pyright: ignore[reportUnknownVariableType]
+    get_fsspec_mtime_equivalent,
+)
+from litestar.static_files import StaticFiles
+from litestar.status_codes import HTTP_200_OK, HTTP_304_NOT_MODIFIED
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Iterable, Mapping, Sequence
+    from os import PathLike
+
+    from litestar.types import ASGIApp, Receive, Scope, Send
+    from litestar.types.file_types import FileInfo
+
+__all__ = (
+    "IMMUTABLE_CACHE_CONTROL",
+    "PRECOMPRESSED_SUFFIXES",
+    "StaticAssetCache",
+    "ViteStaticFiles",
+    "accepted_encodings",
+    "available_encoders",
+    "create_vite_static_files_router",
+    "precompress_assets",
+)
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+"""``Cache-Control`` value for content-hashed build output."""
+
+PRECOMPRESSED_SUFFIXES: "dict[str, str]" = {"br": ".br", "zstd": ".zst", "gzip": ".gz"}
+"""File suffix of the precompressed sibling for each supported content encoding."""
+
+_COMPRESSIBLE_SUFFIXES = frozenset({
+    ".cjs",
+    ".css",
+    ".html",
+    ".ico",
+    ".js",
+    ".json",
+    ".map",
+    ".mjs",
+    ".svg",
+    ".txt",
+    ".wasm",
+    ".webmanifest",
+    ".xml",
+})
+_MIN_COMPRESS_SIZE = 1024
+
+
+@lru_cache(maxsize=128)
+def accepted_encodings(accept_encoding: str, encodings: "tuple[str, ...]") -> "tuple[str, ...]":
+    """Return the ``encodings`` an ``Accept-Encoding`` header allows, best first.
+
+    Encodings are ordered by quality value; equal values keep the order of ``encodings``.
+    A ``*`` entry applies to every encoding the header does not name.
+
+    Args:
+        accept_encoding: The request's ``Accept-Encoding`` header value.
+        encodings: The encodings the server can offer, in order of preference.
+
+    Returns:
+        The acceptable encodings.
+    """
+    qualities: "dict[str, float]" = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        key, _, value = params.strip().partition("=")
+        if key.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        qualities[name] = quality
+    wildcard = qualities.get("*", 0.0)
+    ranked = [(qualities.get(encoding, wildcard), index, encoding) for index, encoding in enumerate(encodings)]
+    return tuple(
+        encoding for quality, _, encoding in sorted(ranked, key=lambda item: (-item[0], item[1])) if quality > 0
+    )
+
+
+def _zstd_compressor() -> "Callable[[bytes], bytes] | None":
+    try:
+        zstd: Any = importlib.import_module("compression.zstd")
+    except ImportError:
+        pass
+    else:
+        return partial(zstd.compress, level=19)
+    try:
+        zstandard: Any = importlib.import_module("zstandard")
+    except ImportError:
+        return None
+    return zstandard.ZstdCompressor(level=19).compress  # type: ignore[no-any-return]
+
+
+def _brotli_compressor() -> "Callable[[bytes], bytes] | None":
+    try:
+        brotli: Any = importlib.import_module("brotli")
+    except ImportError:
+        return None
+    return partial(brotli.compress, quality=11)
+
+
+def available_encoders(encodings: "Sequence[str]") -> "dict[str, Callable[[bytes], bytes]]":
+    """Return a compressor for each of ``encodings`` that can be produced here.
+
+    ``gzip`` uses the standard library. ``br`` needs the ``brotli`` package and ``zstd``
+    needs Python 3.14's ``compression.zstd`` or the ``zstandard`` package.
+
+    Args:
+        encodings: Content encodings to look up.
+
+    Returns:
+        Compressors keyed by encoding; encodings without an installed compressor are omitted.
+    """
+    factories: "dict[str, Callable[[], Callable[[bytes], bytes] | None]]" = {
+        "br": _brotli_compressor,
+        "zstd": _zstd_compressor,
+        "gzip": lambda: partial(gzip.compress, compresslevel=9, mtime=0),
+    }
+    encoders: "dict[str, Callable[[bytes], bytes]]" = {}
+    for encoding in encodings:
+        factory = factories.get(encoding)
+        if factory is not None and (encoder := factory()) is not None:
+            encoders[encoding] = encoder
+    return encoders
+
+
+def precompress_assets(directory: Path, encodings: "Sequence[str]") -> "list[Path]":
+    """Write precompressed siblings for the text assets under ``directory``.
+
+    Files smaller than 1 KiB, binary formats that are already compressed, and variants that
+    would not be smaller than the original are skipped; a stale sibling of a skipped variant
+    is removed so it cannot shadow the file.
+
+    Args:
+        directory: The build output directory.
+        encodings: Content encodings to produce. Encodings without an installed compressor
+            are ignored (see :func:`available_encoders`).
+
+    Returns:
+        The written sibling files.
+    """
+    encoders = available_encoders(encodings)
+    written: "list[Path]" = []
+    if not encoders or not directory.is_dir():
+        return written
+    for path in sorted(directory.rglob("*")):
+        if path.suffix not in _COMPRESSIBLE_SUFFIXES or not path.is_file():
+            continue
+        data = path.read_bytes()
+        for encoding, compress in encoders.items():
+            target = path.with_name(path.name + PRECOMPRESSED_SUFFIXES[encoding])
+            compressed = compress(data) if len(data) >= _MIN_COMPRESS_SIZE else data
+            if len(compressed) >= len(data):
+                target.unlink(missing_ok=True)
+                continue
+            target.write_bytes(compressed)
+            written.append(target)
+    return written
+
+
+class _CachedRepresentation:
+    """One encoding of a cached file with its pre-encoded response headers."""
+
+    __slots__ = ("body", "etag", "headers", "not_modified_headers")
+
+    def __init__(
+        self,
+        body: bytes,
+        etag: str,
+        headers: "list[tuple[bytes, bytes]]",
+        not_modified_headers: "list[tuple[bytes, bytes]]",
+    ) -> None:
+        self.body = body
+        self.etag = etag
+        self.headers = headers
+        self.not_modified_headers = not_modified_headers
+
+
+class _CachedAsset:
+    __slots__ = ("mtime", "representations", "size")
+
+    def __init__(self, representations: "dict[str | None, _CachedRepresentation]", mtime: float) -> None:
+        self.representations = representations
+        self.mtime = mtime
+        self.size = sum(len(representation.body) for representation in representations.values())
+
+
+class _CachedAssetResponse:
+    """Minimal ASGI app sending a pre-built response; no per-request header encoding."""
+
+    __slots__ = ("body", "headers", "status_code")
+
+    def __init__(self, status_code: int, headers: "list[tuple[bytes, bytes]]", body: bytes) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+
+    async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.headers})
+        await send({"type": "http.response.body", "body": self.body, "more_body": False})
+
+
+class StaticAssetCache:
+    """Size-bounded LRU cache of content-hashed build output held in memory.
+
+    Only files named by their content hash are cached, so an entry can never go stale. Each
+    entry keeps the file and its precompressed siblings together with their encoded response
+    headers, and a hit is answered without touching the filesystem.
+    """
+
+    __slots__ = ("_entries", "_uncacheable", "directory", "encodings", "max_bytes", "max_file_size", "size")
+
+    def __init__(
+        self, directory: Path, max_bytes: int, *, encodings: "Sequence[str]" = (), max_file_size: int = 1024 * 1024
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: The build output directory the cached paths are relative to.
+            max_bytes: Upper bound for the bodies held in memory, over all encodings.
+            encodings: Content encodings whose siblings are cached, in order of preference.
+            max_file_size: Files whose representations add up to more than this are not cached.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_file_size = min(max_file_size, max_bytes)
+        self.encodings = tuple(encodings)
+        self.size = 0
+        self._entries: "OrderedDict[str, _CachedAsset]" = OrderedDict()
+        self._uncacheable: "set[str]" = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, relative_path: object) -> bool:
+        return relative_path in self._entries
+
+    def respond(
+        self, relative_path: str, request_headers: "Mapping[str, str]", *, is_head_response: bool
+    ) -> "ASGIApp | None":
+        """Answer a request from the cache.
+
+        Args:
+            relative_path: The requested file path, relative to ``directory``.
+            request_headers: The request headers.
+            is_head_response: Whether the response is for a HEAD request.
+
+        Returns:
+            An ASGI app sending the best cached representation, or ``None`` on a miss.
+        """
+        asset = self._entries.get(relative_path)
+        if asset is None:
+            return None
+        self._entries.move_to_end(relative_path)
+        encoding = None
+        if self.encodings:
+            accept_encoding = request_headers.get("accept-encoding") or ""
+            encoding = next(
+                (name for name in accepted_encodings(accept_encoding, self.encodings) if name in asset.representations),
+                None,
+            )
+        representation = asset.representations[encoding]
+        if _is_not_modified(request_headers, representation.etag, asset.mtime):
+            return _CachedAssetResponse(HTTP_304_NOT_MODIFIED, representation.not_modified_headers, b"")
+        body = b"" if is_head_response else representation.body
+        return _CachedAssetResponse(HTTP_200_OK, representation.headers, body)
+
+    async def load(self, relative_path: str) -> bool:
+        """Read a file and its precompressed siblings into the cache.
+
+        Least recently used entries are evicted to stay within ``max_bytes``.
+
+        Args:
+            relative_path: The file path, relative to ``directory``. It must name a
+                content-hashed file.
+
+        Returns:
+            True when the file is cached.
+        """
+        if relative_path in self._entries:
+            return True
+        if relative_path in self._uncacheable:
+            return False
+        asset = await anyio.to_thread.run_sync(self._read, relative_path)
+        if asset is None:
+            # Missing or too large; hashed files do not change, so do not look again.
+            self._uncacheable.add(relative_path)
+            return False
+        if relative_path not in self._entries:
+            self._entries[relative_path] = asset
+            self.size += asset.size
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= evicted.size
+        return True
+
+    async def warm(self, relative_paths: "Iterable[str]") -> int:
+        """Load ``relative_paths`` in order until the cache is full.
+
+        Args:
+            relative_paths: Content-hashed file paths, relative to ``directory``.
+
+        Returns:
+            The number of cached files.
+        """
+        for relative_path in relative_paths:
+            if self.size >= self.max_bytes:
+                break
+            await self.load(relative_path)
+        return len(self._entries)
+
+    def _read(self, relative_path: str) -> "_CachedAsset | None":
+        file_path = (self.directory / relative_path).resolve()
+        if not file_path.is_relative_to(self.directory.resolve()):
+            return None
+        try:
+            stat_result = file_path.stat()
+        except OSError:
+            return None
+        if not file_path.is_file() or stat_result.st_size > self.max_file_size:
+            return None
+        bodies: "dict[str | None, bytes]" = {None: file_path.read_bytes()}
+        for encoding in self.encodings:
+            try:
+                bodies[encoding] = file_path.with_name(file_path.name + PRECOMPRESSED_SUFFIXES[encoding]).read_bytes()
+            except OSError:
+                continue
+        if sum(len(body) for body in bodies.values()) > self.max_file_size:
+            bodies = {None: bodies[None]}
+        media_type = guess_type(file_path.name)[0] or "application/octet-stream"
+        quoted_filename = quote(file_path.name)
+        if quoted_filename == file_path.name:
+            content_disposition = f'inline; filename="{file_path.name}"'
+        else:
+            content_disposition = f"inline; filename*=utf-8''{quoted_filename}"
+        representations: "dict[str | None, _CachedRepresentation]" = {}
+        for encoding, body in bodies.items():
+            etag = _hashed_etag(relative_path, encoding)
+            validators = {
+                "etag": etag,
+                "cache-control": IMMUTABLE_CACHE_CONTROL,
+                "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+            }
+            if self.encodings:
+                validators["vary"] = "Accept-Encoding"
+            headers = {**validators, "content-disposition": content_disposition}
+            if encoding is not None:
+                headers["content-encoding"] = encoding
+            representations[encoding] = _CachedRepresentation(
+                body=body,
+                etag=etag,
+                headers=ASGIResponse(body=body, media_type=media_type, headers=headers).encode_headers(),
+                not_modified_headers=ASGIResponse(
+                    status_code=HTTP_304_NOT_MODIFIED, headers=validators
+                ).encode_headers(),
+            )
+        return _CachedAsset(representations, stat_result.st_mtime)
+
+
+class ViteStaticFiles(StaticFiles):
+    """Litestar's static files app, extended with precompressed siblings and cache validators.
+
+    Files listed by ``hashed_files`` are named by their content hash, so they are sent as
+    immutable with a strong ETag derived from the name. Every other file must be revalidated
+    and is answered with ``304 Not Modified`` when the client's copy is current. With an
+    ``asset_cache``, hashed files are served from memory after the first request.
+    """
+
+    __slots__ = ("asset_cache", "encodings", "hashed_files")
+
+    def __init__(
+        self,
+        *,
+        encodings: "Sequence[str]" = (),
+        hashed_files: "Callable[[], Collection[str]] | None" = None,
+        asset_cache: "StaticAssetCache | None" = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the app.
+
+        Args:
+            encodings: Content encodings whose siblings may be served, in order of preference.
+            hashed_files: Returns the content-hashed file paths, relative to the static
+                directories. ``None`` leaves caching headers to the router.
+            asset_cache: In-memory cache for the hashed files. Requires ``hashed_files``.
+            **kwargs: Keyword arguments for :class:`~litestar.static_files.StaticFiles`.
+        """
+        super().__init__(**kwargs)  # pyright: ignore[reportUnknownMemberType]
+        self.encodings = tuple(encodings)
+        self.hashed_files = hashed_files
+        self.asset_cache = asset_cache if hashed_files is not None else None
+
+    async def handle_request(
+        self, path: str, request_headers: "Mapping[str, str]", *, is_head_response: bool
+    ) -> "ASGIResponse":
+        """Resolve ``path`` and pick the representation for the client.
+
+        Args:
+            path: The requested file path, relative to the static directories.
+            request_headers: The request headers.
+            is_head_response: Whether the response is for a HEAD request.
+
+        Returns:
+            A file response for the best precompressed sibling or the file itself, or an
+            empty ``304`` response when the client's cached copy is current.
+        """
+        cache = self.asset_cache
+        if cache is not None:
+            relative_path = path.lstrip("/")
+            cached = cache.respond(relative_path, request_headers, is_head_response=is_head_response)
+            if cached is None and relative_path in cast("Callable[[], Collection[str]]", self.hashed_files)():
+                await cache.load(relative_path)
+                cached = cache.respond(relative_path, request_headers, is_head_response=is_head_response)
+            if cached is not None:
+                # Returned to the handler as-is; Litestar sends any ASGI app without inspecting it.
+                return cast("ASGIResponse", cached)
+        response = await self.handle(path=path, is_head_response=is_head_response)
+        encoding = None
+        if self.encodings:
+            response, encoding = await self._negotiate_encoding(
+                response, request_headers.get("accept-encoding"), is_head_response
+            )
+        if self.hashed_files is None:
+            return response
+        return self._apply_validators(response, path.lstrip("/"), encoding, request_headers)
+
+    async def _negotiate_encoding(
+        self, response: ASGIFileResponse, accept_encoding: "str | None", is_head_response: bool
+    ) -> "tuple[ASGIFileResponse, str | None]":
+        response.headers["vary"] = "Accept-Encoding"
+        file_path = str(response.file_path)  # pyright: ignore[reportUnknownMemberType,reportUnknownArgumentType]
+        for encoding in accepted_encodings(accept_encoding or "", self.encodings):
+            sibling = f"{file_path}{PRECOMPRESSED_SUFFIXES[encoding]}"
+            try:
+                file_info = await self.adapter.info(sibling)  # pyright: ignore[reportUnknownMemberType]
+            except FileNotFoundError:
+                continue
+            if file_info["type"] != "file":
+                continue
+            content_disposition_type: Literal["inline", "attachment"] = (
+                "attachment" if self.send_as_attachment else "inline"
+            )
+            compressed = ASGIFileResponse(
+                file_path=sibling,
+                file_info=file_info,
+                file_system=self.adapter.file_system,
+                filename=PurePath(file_path).name,
+                content_disposition_type=content_disposition_type,
+                is_head_response=is_head_response,
+                headers={**(self.headers or {}), "content-encoding": encoding, "vary": "Accept-Encoding"},
+                status_code=response.status_code,
+            )
+            return compressed, encoding
+        return response, None
+
+    def _apply_validators(
+        self,
+        response: ASGIFileResponse,
+        relative_path: str,
+        encoding: "str | None",
+        request_headers: "Mapping[str, str]",
+    ) -> "ASGIResponse":
+        # The ``404.html`` page of ``html_mode`` describes a missing file, not a cacheable one.
+        if response.status_code != HTTP_200_OK:
+            return response
+        file_info = cast("FileInfo", response.file_info)
+        mtime = get_fsspec_mtime_equivalent(file_info)  # type: ignore[arg-type]
+        if self.hashed_files is not None and relative_path in self.hashed_files():
+            etag = _hashed_etag(relative_path, encoding)
+            cache_control = IMMUTABLE_CACHE_CONTROL
+        else:
+            file_path = str(response.file_path)  # pyright: ignore[reportUnknownMemberType,reportUnknownArgumentType]
+            etag = create_etag_for_file(path=file_path, modified_time=mtime, file_size=file_info["size"])
+            cache_control = "no-cache"
+        headers = {"etag": etag, "cache-control": cache_control}
+        if self.encodings:
+            headers["vary"] = "Accept-Encoding"
+        if mtime is not None:
+            headers["last-modified"] = formatdate(mtime, usegmt=True)
+        if _is_not_modified(request_headers, etag, mtime):
+            return ASGIResponse(status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+        for key, value in headers.items():
+            response.headers[key] = value
+        return response
+
+
+def _hashed_etag(relative_path: str, encoding: "str | None") -> str:
+    """Build the strong ETag of one representation of a content-hashed file.
+
+    The name changes whenever the content does, so it is a strong validator per encoding.
+
+    Returns:
+        The quoted ETag.
+    """
+    digest = hashlib.sha256(f"{relative_path}:{encoding or 'identity'}".encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def _is_not_modified(request_headers: "Mapping[str, str]", etag: str, mtime: "float | None") -> bool:
+    """Evaluate the conditional request headers against the current representation.
+
+    ``If-None-Match`` takes precedence over ``If-Modified-Since`` as required by RFC 9110.
+
+    Returns:
+        True when the client's cached copy is current.
+    """
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # GET conditionals use the weak comparison, which ignores the ``W/`` prefix.
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag.removeprefix("W/") in candidates
+    if_modified_since = request_headers.get("if-modified-since")
+    if if_modified_since is None or mtime is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return int(mtime) <= since.timestamp()
+
+
+def create_vite_static_files_router(
+    path: str,
+    directories: "Sequence[str | PathLike[str]]",
+    *,
+    encodings: "Sequence[str]" = (),
+    hashed_files: "Callable[[], Collection[str]] | None" = None,
+    asset_cache: "StaticAssetCache | None" = None,
+    name: str = "static",
+    html_mode: bool = False,
+    send_as_attachment: bool = False,
+    resolve_symlinks: bool = True,
+    **router_kwargs: Any,
+) -> Router:
+    """Create a router serving ``directories`` under ``path``.
+
+    A drop-in for Litestar's ``create_static_files_router`` whose handlers see the request
+    headers, so precompressed siblings and conditional requests can be handled.
+
+    Args:
+        path: The route path prefix.
+        directories: Directories to serve files from.
+        encodings: Content encodings whose siblings may be served, in order of preference.
+            Empty serves files as-is.
+        hashed_files: Returns the content-hashed file paths, which are served as immutable.
+            ``None`` sends no validators beyond Litestar's defaults.
+        asset_cache: Serve hashed files from this in-memory cache.
+        name: The route name.
+        html_mode: Serve ``index.html`` for directories and ``404.html`` for missing files.
+        send_as_attachment: Send files with ``Content-Disposition: attachment``.
+        resolve_symlinks: Resolve symlinks in ``directories``.
+        **router_kwargs: Keyword arguments for the :class:`~litestar.Router`.
+
+    Returns:
+        The static files router.
+    """
+    static_files = ViteStaticFiles(
+        encodings=encodings,
+        hashed_files=hashed_files,
+        asset_cache=asset_cache,
+        is_html_mode=html_mode,
+        directories=directories,
+        file_system=BaseLocalFileSystem(),
+        send_as_attachment=send_as_attachment,
+        resolve_symlinks=resolve_symlinks,
+    )
+
+    @get("{file_path:path}", name=name)
+    async def get_handler(file_path: FromPath[PurePath], request: Request[Any, Any, Any]) -> ASGIResponse:
+        return await static_files.handle_request(file_path.as_posix(), request.headers, is_head_response=False)
+
+    # Litestar only accepts bodiless return annotations on HEAD handlers; a 304 has no body either.
+    @head("/{file_path:path}", name=f"{name}/head")
+    async def head_handler(file_path: FromPath[PurePath], request: Request[Any, Any, Any]) -> ASGIFileResponse:
+        response = await static_files.handle_request(file_path.as_posix(), request.headers, is_head_response=True)
+        return cast("ASGIFileResponse", response)
+
+    handlers = [get_handler, head_handler]
+
+    if html_mode:
+
+        @get("/", name=f"{name}/index")
+        async def index_handler(request: Request[Any, Any, Any]) -> ASGIResponse:
+            return await static_files.handle_request("/", request.headers, is_head_response=False)
+
+        handlers.append(index_handler)
+
+    return Router(path=path, route_handlers=handlers, **router_kwargs)
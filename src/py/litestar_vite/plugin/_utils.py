@@ -1,6 +1,7 @@
 """Utilities for logging, environment setup, and route detection."""
 
 __all__ = (
+    "RoutePrefixMatcher",
     "configure_proxy_logging",
     "console",
     "create_proxy_client",
@@ -16,6 +17,7 @@ __all__ = (
     "normalize_prefix",
     "pick_free_port",
     "resolve_litestar_version",
+    "send_early_hints",
     "set_app_environment",
     "set_environment",
     "static_not_found_handler",
@@ -28,6 +30,7 @@ import importlib.metadata
 import logging
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast, overload
 
@@ -39,10 +42,13 @@ from litestar_vite.codegen import write_if_changed as _write_if_changed
 from litestar_vite.config import InertiaConfig, TypeGenConfig
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
     import httpx
     from litestar import Litestar, Response
     from litestar.connection import Request
     from litestar.exceptions import NotFoundException
+    from litestar.types import Scope, Send
 
     from litestar_vite.config import ViteConfig
 
@@ -117,6 +123,9 @@ def create_proxy_client(
     max_keepalive: int = 20,
     max_connections: int = 40,
     keepalive_expiry: float = 60.0,
+    *,
+    connect_timeout: "float | None" = None,
+    pool_timeout: "float | None" = None,
 ) -> "httpx.AsyncClient":
     """Create an httpx.AsyncClient with connection pooling for proxy use.
 
@@ -126,10 +135,12 @@ def create_proxy_client(
 
     Args:
         http2: Enable HTTP/2 support (requires h2 package).
-        timeout: Request timeout in seconds.
+        timeout: Read and write timeout in seconds.
         max_keepalive: Maximum number of keep-alive connections per host.
         max_connections: Maximum total concurrent connections.
         keepalive_expiry: Idle timeout before closing keep-alive connections.
+        connect_timeout: Connect timeout in seconds. Defaults to ``timeout``.
+        pool_timeout: Seconds to wait for a free pooled connection. Defaults to ``timeout``.
 
     Returns:
         A configured httpx.AsyncClient with connection pooling.
@@ -140,7 +151,12 @@ def create_proxy_client(
     limits = httpx.Limits(
         max_keepalive_connections=max_keepalive, max_connections=max_connections, keepalive_expiry=keepalive_expiry
     )
-    return httpx.AsyncClient(limits=limits, timeout=httpx.Timeout(timeout), http2=http2_enabled)
+    timeouts = httpx.Timeout(
+        timeout,
+        connect=timeout if connect_timeout is None else connect_timeout,
+        pool=timeout if pool_timeout is None else pool_timeout,
+    )
+    return httpx.AsyncClient(limits=limits, timeout=timeouts, http2=http2_enabled)
 
 
 def infer_port_from_argv() -> str | None:
@@ -712,6 +728,56 @@ def build_litestar_route_prefixes(app: "Litestar", extra_route_prefixes: tuple[s
     return tuple(unique_prefixes)
 
 
+class RoutePrefixMatcher:
+    """Answer :func:`is_litestar_route` with a segment trie instead of a prefix scan.
+
+    A prefix matches a path equal to it or continuing it with ``/``, which holds exactly
+    when the prefix's ``/``-separated segments begin the path's segments. A lookup therefore
+    walks the path once, however many routes are registered. Recent answers are kept in an
+    LRU cache since SPA and proxy checks see the same paths over and over.
+    """
+
+    __slots__ = ("_root", "matches", "prefixes")
+
+    def __init__(self, prefixes: "Iterable[str]", *, cache_size: int = 2048) -> None:
+        """Compile ``prefixes`` into the trie.
+
+        Args:
+            prefixes: Route prefixes as returned by :func:`build_litestar_route_prefixes`.
+            cache_size: Number of recent paths whose answer is remembered.
+        """
+        self.prefixes = tuple(prefixes)
+        self._root: "dict[str, Any]" = {}
+        for prefix in self.prefixes:
+            node = self._root
+            for segment in prefix.split("/"):
+                node = node.setdefault(segment, {})
+            # Segments never contain "/", so it is free to mark the end of a prefix.
+            node["/"] = {}
+        self.matches: "Callable[[str], bool]" = lru_cache(maxsize=cache_size)(self._matches)
+
+    def _matches(self, path: str) -> bool:
+        node = self._root
+        for segment in path.split("/"):
+            if "/" in node:
+                return True
+            child = node.get(segment)
+            if child is None:
+                return False
+            node = child
+        return "/" in node
+
+
+def _get_route_matcher(app: "Litestar") -> RoutePrefixMatcher:
+    from litestar_vite.plugin._core import VitePlugin
+
+    try:
+        plugin = app.plugins.get(VitePlugin)
+    except (AttributeError, KeyError):
+        return RoutePrefixMatcher(build_litestar_route_prefixes(app))
+    return plugin.get_route_matcher(app)
+
+
 def get_litestar_route_prefixes(app: "Litestar") -> tuple[str, ...]:
     """Return route prefixes, using VitePlugin-owned caching when available.
 
@@ -751,8 +817,29 @@ def is_litestar_route(path: str, app: "Litestar") -> bool:
     Returns:
         True if the path matches a Litestar route, False otherwise.
     """
-    excluded = get_litestar_route_prefixes(app)
-    return any(path == prefix or path.startswith(f"{prefix}/") for prefix in excluded)
+    matcher = _get_route_matcher(app)
+    if is_proxy_debug():
+        console.print(f"[dim][route-detection] Cached prefixes: {matcher.prefixes}[/]")
+    return matcher.matches(path)
+
+
+async def send_early_hints(scope: "Scope", send: "Send", links: "Sequence[str]") -> bool:
+    """Send a ``103 Early Hints`` response when the ASGI server supports it.
+
+    Args:
+        scope: The ASGI connection scope.
+        send: The ASGI send callable.
+        links: ``Link`` header values to announce.
+
+    Returns:
+        True if the early hint was sent, otherwise False.
+    """
+    extensions: "dict[str, Any]" = cast("dict[str, Any]", scope).get("extensions") or {}
+    if not links or "http.response.early_hint" not in extensions:
+        return False
+    message = {"type": "http.response.early_hint", "links": [link.encode("latin-1") for link in links]}
+    await send(cast("Any", message))
+    return True
 
 
 def static_not_found_handler(
@@ -12,14 +12,19 @@ from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
+import pydantic
+import pytest
 from litestar import Request, get
+from litestar.exceptions import NotFoundException
 from litestar.middleware.session.server_side import ServerSideSessionConfig
 from litestar.stores.memory import MemoryStore
 from litestar.template.config import TemplateConfig
 from litestar.testing import create_test_client  # pyright: ignore[reportUnknownVariableType]
 
-from litestar_vite.inertia import InertiaHeaders, InertiaPlugin
-from litestar_vite.inertia.helpers import defer, lazy, once, optional
+from litestar_vite.config import InertiaConfig, InertiaPropCacheConfig
+from litestar_vite.inertia import InertiaHeaders, InertiaPlugin, PropCache, get_prop_timings
+from litestar_vite.inertia.helpers import defer, lazy, once, optional, resolve_async_props_concurrently
+from litestar_vite.inertia.prop_cache import LRUMemoryStore
 from litestar_vite.plugin import VitePlugin
 
 
@@ -465,3 +470,393 @@ async def test_ssr_with_async_prop_resolves_on_request_loop(tmp_path: Path) -> N
     # The Inertia partial-reload request previously returned JSON with the
     # resolved data; verify the loop-id assertion holds for that path too.
     assert response.json()["props"]["data"]["loop_id"] == response.json()["props"]["data"]["handler_loop_id"]
+
+
+async def test_concurrent_async_props_overlap_on_request_loop(
+    inertia_config: InertiaConfig,
+    inertia_plugin: InertiaPlugin,
+    vite_plugin: VitePlugin,
+    template_config: TemplateConfig,  # pyright: ignore[reportUnknownParameterType,reportMissingTypeArgument]
+) -> None:
+    """With ``concurrent_async_props`` the selected callbacks run at the same time,
+    while partial-reload filtering still skips unrequested props."""
+    inertia_config.concurrent_async_props = True
+    in_flight = 0
+    peak = 0
+    skipped = AsyncMock(return_value="never")
+
+    async def track(value: str) -> str:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return value
+
+    @get("/", component="Home")
+    async def handler(request: Request[Any, Any, Any]) -> "dict[str, Any]":
+        async def fetch_a() -> str:
+            return await track("a")
+
+        async def fetch_b() -> str:
+            return await track("b")
+
+        async def fetch_c() -> str:
+            return await track("c")
+
+        return {
+            "alpha": defer("alpha", fetch_a),
+            "beta": optional("beta", fetch_b),
+            "gamma": {"nested": optional("nested", fetch_c)},
+            "skipped": optional("skipped", skipped),
+        }
+
+    with create_test_client(
+        route_handlers=[handler],
+        plugins=[inertia_plugin, vite_plugin],
+        template_config=template_config,
+        middleware=[ServerSideSessionConfig().middleware],
+        stores={"sessions": MemoryStore()},
+    ) as client:
+        response = client.get("/", headers=_inertia_headers(partial_data=["alpha", "beta", "gamma", "nested"]))
+        props = response.json()["props"]
+
+    assert props["alpha"] == "a"
+    assert props["beta"] == "b"
+    assert props["gamma"] == {"nested": "c"}
+    assert "skipped" not in props
+    assert peak == 3
+    skipped.assert_not_awaited()
+
+
+async def test_concurrent_async_props_respects_limit_and_reraises_first_error() -> None:
+    """The concurrency limit bounds in-flight callbacks and errors surface unwrapped."""
+    in_flight = 0
+    peak = 0
+
+    async def track() -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return peak
+
+    props = {f"p{i}": optional(f"p{i}", track) for i in range(5)}
+    await resolve_async_props_concurrently(props, partial_data=set(props), limit=2)
+
+    assert peak == 2
+    assert all(prop.render() is not None for prop in props.values())
+
+    async def fail() -> str:
+        raise NotFoundException("missing")
+
+    with pytest.raises(NotFoundException, match="missing"):
+        await resolve_async_props_concurrently(
+            {"ok": optional("ok", track), "bad": optional("bad", fail)}, partial_data={"ok", "bad"}
+        )
+
+
+async def test_sync_props_offloaded_to_worker_threads(
+    inertia_config: InertiaConfig,
+    inertia_plugin: InertiaPlugin,
+    vite_plugin: VitePlugin,
+    template_config: TemplateConfig,  # pyright: ignore[reportUnknownParameterType,reportMissingTypeArgument]
+) -> None:
+    """``sync_props_to_thread`` runs sync callbacks off the event loop and records their timings;
+    ``sync_to_thread=False`` keeps a prop inline."""
+    inertia_config.sync_props_to_thread = True
+    inertia_config.sync_props_thread_limit = 2
+    timings: "dict[str, float]" = {}
+
+    def in_loop_thread() -> bool:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    @get("/", component="Home")
+    async def handler(request: Request[Any, Any, Any]) -> "dict[str, Any]":
+        return {
+            "offloaded": defer("offloaded", in_loop_thread),
+            "cached": once("cached", in_loop_thread),
+            "inline": optional("inline", in_loop_thread, sync_to_thread=False),
+        }
+
+    async def record_timings(request: Request[Any, Any, Any]) -> None:
+        timings.update(get_prop_timings(request))
+
+    with create_test_client(
+        route_handlers=[handler],
+        plugins=[inertia_plugin, vite_plugin],
+        template_config=template_config,
+        middleware=[ServerSideSessionConfig().middleware],
+        stores={"sessions": MemoryStore()},
+        after_response=record_timings,
+    ) as client:
+        response = client.get("/", headers=_inertia_headers(partial_data=["offloaded", "cached", "inline"]))
+        props = response.json()["props"]
+
+    assert (props["offloaded"], props["cached"], props["inline"]) == (False, False, True)
+    assert set(timings) == {"offloaded", "cached"}
+    assert all(duration >= 0 for duration in timings.values())
+    assert inertia_plugin.prop_thread_limiter is not None
+    assert inertia_plugin.prop_thread_limiter.total_tokens == 2
+
+
+async def test_sync_props_not_walked_without_opt_in(
+    inertia_plugin: InertiaPlugin,
+    vite_plugin: VitePlugin,
+    template_config: TemplateConfig,  # pyright: ignore[reportUnknownParameterType,reportMissingTypeArgument]
+) -> None:
+    """Without ``sync_props_to_thread`` or a prop opting in, the thread pass and its timings are skipped."""
+    from litestar_vite.inertia import helpers
+
+    # An opt-in elsewhere in the process does not affect responses that do not use it.
+    optional("elsewhere", lambda: True, sync_to_thread=True)
+    scope_keys: "set[str]" = set()
+
+    @get("/", component="Home")
+    async def handler() -> "dict[str, Any]":
+        return {"inline": optional("inline", lambda: True)}
+
+    async def record_scope(request: Request[Any, Any, Any]) -> None:
+        scope_keys.update(request.scope)
+
+    with (
+        patch("litestar_vite.inertia.response.resolve_sync_props_in_thread") as offload,
+        create_test_client(
+            route_handlers=[handler],
+            plugins=[inertia_plugin, vite_plugin],
+            template_config=template_config,
+            middleware=[ServerSideSessionConfig().middleware],
+            stores={"sessions": MemoryStore()},
+            after_response=record_scope,
+        ) as client,
+    ):
+        response = client.get("/", headers=_inertia_headers(partial_data=["inline"]))
+
+    assert response.json()["props"]["inline"] is True
+    offload.assert_not_called()
+    assert helpers._PROP_TIMINGS_SCOPE_KEY not in scope_keys  # pyright: ignore[reportPrivateUsage]
+
+
+async def test_cached_props_resolve_once_across_requests(
+    inertia_plugin: InertiaPlugin,
+    vite_plugin: VitePlugin,
+    template_config: TemplateConfig,  # pyright: ignore[reportUnknownParameterType,reportMissingTypeArgument]
+) -> None:
+    """``cache=`` stores resolved values server-side; later requests skip the callbacks."""
+    calls: "list[str]" = []
+
+    async def load_flags() -> "dict[str, bool]":
+        calls.append("flags")
+        return {"beta": True}
+
+    def load_stats() -> "list[int]":
+        calls.append("stats")
+        return [1, 2, 3]
+
+    @get("/", component="Home")
+    async def handler() -> "dict[str, Any]":
+        return {
+            "flags": once("flags", load_flags, cache=True),
+            "stats": defer("stats", load_stats, cache=PropCache(ttl=60)).once(),
+        }
+
+    with create_test_client(
+        route_handlers=[handler],
+        plugins=[inertia_plugin, vite_plugin],
+        template_config=template_config,
+        middleware=[ServerSideSessionConfig().middleware],
+        stores={"sessions": MemoryStore()},
+    ) as client:
+        first = client.get("/", headers=_inertia_headers(partial_data=["flags", "stats"])).json()["props"]
+        second = client.get("/", headers=_inertia_headers(partial_data=["flags", "stats"])).json()["props"]
+
+    assert first["flags"] == second["flags"] == {"beta": True}
+    assert first["stats"] == second["stats"] == [1, 2, 3]
+    assert sorted(calls) == ["flags", "stats"]
+
+
+async def test_cached_props_use_key_function_and_named_store(
+    inertia_config: InertiaConfig,
+    inertia_plugin: InertiaPlugin,
+    vite_plugin: VitePlugin,
+    template_config: TemplateConfig,  # pyright: ignore[reportUnknownParameterType,reportMissingTypeArgument]
+) -> None:
+    """The key function scopes cached values per request, in the store named by the config."""
+    inertia_config.prop_cache = InertiaPropCacheConfig(store="props", key_prefix="test")
+    prop_store = MemoryStore()
+    calls: "list[str]" = []
+
+    def load_settings(user: str) -> str:
+        calls.append(user)
+        return f"settings for {user}"
+
+    def user_key(connection: Any) -> str:
+        return str(connection.headers.get("x-user", "anonymous"))
+
+    @get("/", component="Home")
+    async def handler(request: Request[Any, Any, Any]) -> "dict[str, Any]":
+        user = user_key(request)
+        return {"settings": once("settings", lambda: load_settings(user), cache=PropCache(key=user_key))}
+
+    with create_test_client(
+        route_handlers=[handler],
+        plugins=[inertia_plugin, vite_plugin],
+        template_config=template_config,
+        middleware=[ServerSideSessionConfig().middleware],
+        stores={"sessions": MemoryStore(), "props": prop_store},
+    ) as client:
+        responses = [
+            client.get("/", headers={**_inertia_headers(), "x-user": user}).json()["props"]["settings"]
+            for user in ("ada", "bob", "ada")
+        ]
+
+    assert responses == ["settings for ada", "settings for bob", "settings for ada"]
+    assert calls == ["ada", "bob"]
+    bob_keys = [key for key in prop_store._store if key.startswith("test:") and key.endswith(":settings:bob")]  # pyright: ignore[reportPrivateUsage]
+    assert len(bob_keys) == 1
+    assert await prop_store.get(bob_keys[0]) == b'"settings for bob"'
+
+
+async def test_cached_props_are_scoped_to_route_and_callback(
+    inertia_plugin: InertiaPlugin,
+    vite_plugin: VitePlugin,
+    template_config: TemplateConfig,  # pyright: ignore[reportUnknownParameterType,reportMissingTypeArgument]
+) -> None:
+    """Props sharing a name on different routes get separate entries; without cached props the store is skipped."""
+
+    def shared_stats() -> str:
+        return "shared"
+
+    @get("/a", component="A")
+    async def page_a() -> "dict[str, Any]":
+        return {"stats": once("stats", lambda: "a", cache=True), "shared": once("shared", shared_stats, cache=True)}
+
+    @get("/b", component="B")
+    async def page_b() -> "dict[str, Any]":
+        return {"stats": once("stats", lambda: "b", cache=True), "shared": once("shared", shared_stats, cache=True)}
+
+    @get("/plain", component="Plain")
+    async def plain() -> "dict[str, Any]":
+        return {"value": "x"}
+
+    with create_test_client(
+        route_handlers=[page_a, page_b, plain],
+        plugins=[inertia_plugin, vite_plugin],
+        template_config=template_config,
+        middleware=[ServerSideSessionConfig().middleware],
+        stores={"sessions": MemoryStore()},
+    ) as client:
+        props = [
+            client.get(path, headers=_inertia_headers(partial_data=["stats", "shared"])).json()["props"]
+            for path in ("/a", "/b", "/a")
+        ]
+        with patch("litestar_vite.inertia.response.load_cached_props") as load:
+            assert client.get("/plain", headers=_inertia_headers()).json()["props"]["value"] == "x"
+
+    assert [page["stats"] for page in props] == ["a", "b", "a"]
+    assert [page["shared"] for page in props] == ["shared"] * 3
+    load.assert_not_called()
+
+
+class _Flags(pydantic.BaseModel):
+    beta: bool
+
+
+async def test_cached_props_encode_models_with_type_encoders(
+    inertia_plugin: InertiaPlugin,
+    vite_plugin: VitePlugin,
+    template_config: TemplateConfig,  # pyright: ignore[reportUnknownParameterType,reportMissingTypeArgument]
+) -> None:
+    """Cached values are encoded with the app's type encoders, so pydantic models are cached too."""
+    calls: "list[str]" = []
+
+    def load_flags() -> _Flags:
+        calls.append("flags")
+        return _Flags(beta=True)
+
+    @get("/", component="Home")
+    async def handler() -> "dict[str, Any]":
+        return {"flags": once("flags", load_flags, cache=True)}
+
+    with create_test_client(
+        route_handlers=[handler],
+        plugins=[inertia_plugin, vite_plugin],
+        template_config=template_config,
+        middleware=[ServerSideSessionConfig().middleware],
+        stores={"sessions": MemoryStore()},
+    ) as client:
+        responses = [client.get("/", headers=_inertia_headers()).json()["props"]["flags"] for _ in range(2)]
+
+    assert responses == [{"beta": True}, {"beta": True}]
+    assert calls == ["flags"]
+
+
+async def test_cached_props_are_evaluated_every_request_when_prop_cache_disabled(
+    inertia_config: InertiaConfig,
+    inertia_plugin: InertiaPlugin,
+    vite_plugin: VitePlugin,
+    template_config: TemplateConfig,  # pyright: ignore[reportUnknownParameterType,reportMissingTypeArgument]
+) -> None:
+    """``prop_cache=False`` turns the server-side cache off for props that request it."""
+    inertia_config.prop_cache = False
+    inertia_config.__post_init__()
+    calls: "list[str]" = []
+
+    def load_flags() -> "dict[str, bool]":
+        calls.append("flags")
+        return {"beta": True}
+
+    @get("/", component="Home")
+    async def handler() -> "dict[str, Any]":
+        return {"flags": once("flags", load_flags, cache=True)}
+
+    with create_test_client(
+        route_handlers=[handler],
+        plugins=[inertia_plugin, vite_plugin],
+        template_config=template_config,
+        middleware=[ServerSideSessionConfig().middleware],
+        stores={"sessions": MemoryStore()},
+    ) as client:
+        with patch("litestar_vite.inertia.response.load_cached_props") as load:
+            for _ in range(2):
+                assert client.get("/", headers=_inertia_headers()).json()["props"]["flags"] == {"beta": True}
+
+    assert calls == ["flags", "flags"]
+    load.assert_not_called()
+
+
+async def test_lru_memory_store_evicts_least_recently_used() -> None:
+    store = LRUMemoryStore(max_entries=2)
+    await store.set("a", b"1")
+    await store.set("b", b"2")
+    assert await store.get("a") == b"1"
+
+    await store.set("c", b"3")
+
+    assert await store.get("b") is None
+    assert await store.get("a") == b"1"
+    assert await store.get("c") == b"3"
+
+
+async def test_lru_memory_store_expires_and_deletes_entries() -> None:
+    store = LRUMemoryStore(max_entries=2)
+    await store.set("a", "1", expires_in=60)
+    await store.set("b", b"2")
+
+    assert 55 <= (await store.expires_in("a") or 0) <= 60
+    assert await store.expires_in("b") is None
+
+    await store.delete("a")
+    await store.set("c", b"3")
+
+    assert not await store.exists("a")
+    assert await store.get("b") == b"2"
+    assert await store.get("c") == b"3"
+
+    await store.delete_all()
+    assert await store.get("b") is None
@@ -1,14 +1,15 @@
 """Tests for InertiaMiddleware version mismatch detection."""
 
+from pathlib import Path
 from typing import Any
 
 import pytest
-from litestar import Request, delete, get, patch, post, put
+from litestar import Litestar, Request, delete, get, patch, post, put
 from litestar.middleware.session.server_side import ServerSideSessionConfig
 from litestar.params import FromQuery
 from litestar.stores.memory import MemoryStore
 from litestar.template.config import TemplateConfig
-from litestar.testing import create_test_client
+from litestar.testing import AsyncTestClient, create_test_client
 
 from litestar_vite.inertia import InertiaHeaders, InertiaPlugin
 from litestar_vite.inertia.middleware import InertiaRequest
@@ -281,3 +282,80 @@ async def test_version_mismatch_preserves_query_string(
         # URL should include query parameters
         location = response.headers[InertiaHeaders.LOCATION.value]
         assert "q=test" in location
+
+
+async def test_first_load_sends_early_hints_for_inertia_pages(tmp_path: Path) -> None:
+    from litestar_vite.config import InertiaConfig, PathConfig, RuntimeConfig, SPAConfig, ViteConfig
+
+    resource_dir = tmp_path / "resources"
+    resource_dir.mkdir()
+    (resource_dir / "index.html").write_text(
+        '<!DOCTYPE html><html><head></head><body><div id="app"></div></body></html>'
+    )
+    bundle_dir = tmp_path / "public"
+    bundle_dir.mkdir()
+    (bundle_dir / "manifest.json").write_text('{"resources/main.ts": {"file": "assets/main.js", "isEntry": true}}')
+    inertia_config = InertiaConfig(root_template="index.html")
+    vite_plugin = VitePlugin(
+        config=ViteConfig(
+            mode="hybrid",
+            paths=PathConfig(root=tmp_path, resource_dir=resource_dir, bundle_dir=bundle_dir),
+            runtime=RuntimeConfig(dev_mode=False, early_hints=True),
+            spa=SPAConfig(app_selector="#app"),
+            inertia=inertia_config,
+        )
+    )
+
+    @get("/", component="Home")
+    async def page() -> dict[str, Any]:
+        return {"message": "Hello"}
+
+    @get("/api/data")
+    async def api() -> dict[str, Any]:
+        return {"message": "Hello"}
+
+    app = Litestar(
+        route_handlers=[page, api],
+        plugins=[InertiaPlugin(config=inertia_config), vite_plugin],
+        middleware=[ServerSideSessionConfig().middleware],
+        stores={"sessions": MemoryStore()},
+    )
+
+    async def call(path: str) -> list[dict[str, Any]]:
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"host", b"testserver")],
+            "client": ("testclient", 50000),
+            "server": ("testserver", 80),
+            "extensions": {"http.response.early_hint": {}},
+        }
+        messages: list[dict[str, Any]] = []
+
+        async def receive() -> dict[str, Any]:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: dict[str, Any]) -> None:
+            messages.append(message)
+
+        await app(scope, receive, send)  # type: ignore[arg-type]
+        return messages
+
+    async with AsyncTestClient(app=app):
+        page_messages = await call("/")
+        api_messages = await call("/api/data")
+
+    assert page_messages[0] == {
+        "type": "http.response.early_hint",
+        "links": [b"</static/assets/main.js>; rel=modulepreload"],
+    }
+    assert page_messages[1]["type"] == "http.response.start"
+    assert page_messages[1]["status"] == 200
+    assert api_messages[0]["type"] == "http.response.start"
@@ -1,10 +1,13 @@
 import asyncio
 import json
+from collections.abc import AsyncGenerator
 from pathlib import Path
 from time import sleep
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import anyio
+import httpx
 import pytest
 from litestar import Request, delete, get, post
 from litestar.exceptions import ImproperlyConfiguredException, NotAuthorizedException
@@ -50,8 +53,11 @@ from litestar_vite.inertia.response import (
     InertiaRedirect,
     InertiaResponse,
     _InertiaSSRResult,
+    _open_inertia_ssr_stream,
+    _open_ssr_stream,
     _parse_inertia_ssr_payload,
     _render_inertia_ssr,
+    _SSRStream,
 )
 from litestar_vite.plugin import VitePlugin
 
@@ -3022,7 +3028,6 @@ async def test_ssr_client_shared_across_requests(
     template_config: TemplateConfig,  # pyright: ignore[reportUnknownParameterType,reportMissingTypeArgument]
 ) -> None:
     """Test that the same SSR client instance is used across multiple requests."""
-    import httpx
     from litestar.middleware.session.server_side import ServerSideSessionConfig
     from litestar.stores.memory import MemoryStore
     from litestar.testing import create_test_client
@@ -3137,6 +3142,498 @@ async def test_ssr_request_body_uses_provided_type_encoders() -> None:
     assert json.loads(client.content.decode()) == {"widget": {"w": 5}}
 
 
+async def test_ssr_cache_reuses_result_for_identical_page() -> None:
+    from litestar_vite.config import InertiaSSRCacheConfig
+    from litestar_vite.inertia.prop_cache import LRUMemoryStore
+
+    class StubResponse:
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self) -> dict[str, Any]:
+            return {"head": ["<title>SSR</title>"], "body": "<div></div>"}
+
+    class StubClient:
+        calls = 0
+
+        async def post(self, _url: str, **_kwargs: Any) -> StubResponse:
+            self.calls += 1
+            return StubResponse()
+
+    client = StubClient()
+    store = LRUMemoryStore(max_entries=8)
+    cache_config = InertiaSSRCacheConfig()
+    page = {"component": "Home", "props": {"title": "Hi"}, "url": "/", "version": "1"}
+
+    for _ in range(2):
+        result = await _render_inertia_ssr(
+            page,
+            "http://x/render",
+            1.0,
+            client,  # type: ignore[arg-type]
+            cache_store=store,
+            cache_config=cache_config,
+        )
+        assert result == _InertiaSSRResult(head=["<title>SSR</title>"], body="<div></div>")
+    assert client.calls == 1
+
+    await _render_inertia_ssr(
+        {**page, "props": {"title": "Other"}},
+        "http://x/render",
+        1.0,
+        client,  # type: ignore[arg-type]
+        cache_store=store,
+        cache_config=cache_config,
+    )
+    assert client.calls == 2
+
+
+def test_ssr_cache_respects_route_opt_out(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from litestar_vite.config import InertiaSSRConfig, PathConfig, RuntimeConfig, SPAConfig
+
+    resource_dir = tmp_path / "resources"
+    resource_dir.mkdir()
+    (resource_dir / "index.html").write_text(
+        '<!DOCTYPE html><html><head></head><body><div id="app"></div></body></html>'
+    )
+    monkeypatch.delenv("VITE_DEV_MODE", raising=False)
+    monkeypatch.delenv("VITE_HOT_RELOAD", raising=False)
+
+    inertia_config = InertiaConfig(root_template="index.html", ssr=InertiaSSRConfig(cache=True))
+    vite_plugin = VitePlugin(
+        config=ViteConfig(
+            mode="hybrid",
+            paths=PathConfig(resource_dir=resource_dir),
+            runtime=RuntimeConfig(dev_mode=False),
+            spa=SPAConfig(app_selector="#app"),
+            inertia=inertia_config,
+        )
+    )
+
+    @get("/cached", component="Home")
+    async def cached() -> dict[str, Any]:
+        return {"message": "Hello"}
+
+    @get("/uncached", component="Home", ssr_cache=False)
+    async def uncached() -> dict[str, Any]:
+        return {"message": "Hello"}
+
+    with patch(
+        "litestar_vite.inertia.response._do_ssr_request",
+        new_callable=AsyncMock,
+        return_value=_InertiaSSRResult(head=[], body='<div id="app"><span>SSR body</span></div>'),
+    ) as ssr_request:
+        with create_test_client(
+            route_handlers=[cached, uncached],
+            plugins=[InertiaPlugin(config=inertia_config), vite_plugin],
+            middleware=[ServerSideSessionConfig().middleware],
+            stores={"sessions": MemoryStore()},
+        ) as client:
+            for path in ("/cached", "/cached", "/uncached", "/uncached"):
+                response = client.get(path)
+                assert response.status_code == 200
+                assert "<span>SSR body</span>" in response.text
+
+    assert ssr_request.await_count == 3
+
+
+async def test_ssr_coalesces_concurrent_identical_renders() -> None:
+    from litestar_vite.inertia.response import _SSRFlight
+
+    release = asyncio.Event()
+    posted: list[bytes] = []
+
+    class StubResponse:
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self) -> dict[str, Any]:
+            return {"head": [], "body": "<div></div>"}
+
+    class StubClient:
+        async def post(self, _url: str, *, content: bytes, **_kwargs: Any) -> StubResponse:
+            posted.append(content)
+            await release.wait()
+            return StubResponse()
+
+    client = StubClient()
+    inflight: dict[str, _SSRFlight] = {}
+    page = {"component": "Home", "props": {}, "url": "/", "version": "1"}
+
+    async def render(page: dict[str, Any]) -> _InertiaSSRResult:
+        return await _render_inertia_ssr(page, "http://x/render", 1.0, client, inflight=inflight)  # type: ignore[arg-type]
+
+    tasks = [asyncio.create_task(render(page)) for _ in range(5)]
+    tasks.append(asyncio.create_task(render({**page, "url": "/other"})))
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert len(posted) == 2
+    assert all(result.body == "<div></div>" for result in results)
+    assert inflight == {}
+
+
+async def test_ssr_coalesced_renders_share_errors() -> None:
+    from litestar_vite.inertia.response import _SSRFlight
+
+    calls = 0
+    release = asyncio.Event()
+
+    class StubClient:
+        async def post(self, _url: str, **_kwargs: Any) -> Any:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            raise httpx.ConnectError("down")
+
+    inflight: dict[str, _SSRFlight] = {}
+    tasks = [
+        asyncio.create_task(
+            _render_inertia_ssr({"component": "Home"}, "http://x/render", 1.0, StubClient(), inflight=inflight)  # type: ignore[arg-type]
+        )
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert calls == 1
+    assert all(isinstance(result, ImproperlyConfiguredException) for result in results)
+    assert len({id(result) for result in results}) == 3
+    causes = [result.__cause__ for result in results]
+    shared = next(result for result in results if causes.count(result) == 2)
+    assert all(result is shared or result.__cause__ is shared for result in results)
+    assert all(str(result) == str(shared) for result in results)
+    assert inflight == {}
+
+
+async def test_ssr_pool_routes_renders_and_tracks_connection_failures() -> None:
+    from litestar_vite.inertia.ssr_pool import SSRWorkerPool
+
+    posted: list[str] = []
+
+    class StubResponse:
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self) -> dict[str, Any]:
+            return {"head": [], "body": "<div></div>"}
+
+    class StubClient:
+        async def post(self, url: str, **_kwargs: Any) -> StubResponse:
+            posted.append(url)
+            if url == "http://a/render":
+                raise httpx.ConnectError("refused")
+            return StubResponse()
+
+    pool = SSRWorkerPool(["http://a/render", "http://b/render"], eject_after=1)
+
+    with pytest.raises(ImproperlyConfiguredException):
+        await _render_inertia_ssr({"component": "Home"}, "http://unused", 1.0, StubClient(), pool=pool)  # type: ignore[arg-type]
+    result = await _render_inertia_ssr({"component": "Home"}, "http://unused", 1.0, StubClient(), pool=pool)  # type: ignore[arg-type]
+    await _render_inertia_ssr({"component": "Home"}, "http://unused", 1.0, StubClient(), pool=pool)  # type: ignore[arg-type]
+
+    assert result.body == "<div></div>"
+    assert posted == ["http://a/render", "http://b/render", "http://b/render"]
+    assert [worker.failures for worker in pool.workers] == [1, 0]
+    assert all(worker.outstanding == 0 for worker in pool.workers)
+
+
+async def test_ssr_client_renders_over_unix_socket(tmp_path: Path) -> None:
+    from litestar import Litestar
+
+    from litestar_vite.config import InertiaSSRConfig
+
+    requests: list[bytes] = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        requests.append(await reader.readuntil(b"\r\n\r\n"))
+        payload = b'{"head": [], "body": "<div>uds</div>"}'
+        writer.write(
+            b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+            + f"content-length: {len(payload)}\r\n\r\n".encode()
+            + payload
+        )
+        await writer.drain()
+        writer.close()
+
+    socket_path = tmp_path / "ssr.sock"
+    server = await asyncio.start_unix_server(handle, str(socket_path))
+    plugin = InertiaPlugin(InertiaConfig(ssr=InertiaSSRConfig(unix_socket=socket_path)))
+    ssr_config = plugin.config.ssr_config
+    assert ssr_config is not None
+
+    async with server, plugin.lifespan(Litestar()):
+        result = await _render_inertia_ssr({"component": "Home"}, ssr_config.url, 1.0, plugin.ssr_client)
+
+    assert result.body == "<div>uds</div>"
+    assert requests[0].startswith(b"POST /render HTTP/1.1")
+
+
+async def test_ssr_fallback_client_renders_over_unix_url(tmp_path: Path) -> None:
+    from functools import partial
+
+    from litestar_vite.config import InertiaSSRConfig
+    from litestar_vite.inertia.plugin import ssr_socket_mounts
+
+    requests: list[bytes] = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        requests.append(await reader.readuntil(b"\r\n\r\n"))
+        payload = b'{"head": [], "body": "<div>uds</div>"}'
+        writer.write(
+            b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+            + f"content-length: {len(payload)}\r\n\r\n".encode()
+            + payload
+        )
+        await writer.drain()
+        writer.close()
+
+    socket_path = tmp_path / "ssr.sock"
+    ssr_config = InertiaSSRConfig(url=f"unix:{socket_path}:/ssr")
+    assert ssr_config.unix_socket == str(socket_path)
+    assert ssr_config.url == "http://localhost/ssr"
+
+    async with await asyncio.start_unix_server(handle, str(socket_path)):
+        result = await _render_inertia_ssr(
+            {"component": "Home"}, ssr_config.url, 1.0, None, fallback_mounts=partial(ssr_socket_mounts, ssr_config)
+        )
+
+    assert result.body == "<div>uds</div>"
+    assert requests[0].startswith(b"POST /ssr HTTP/1.1")
+
+
+async def test_ssr_socket_mounts_route_every_unix_worker_to_its_socket() -> None:
+    from litestar_vite.config import InertiaSSRConfig
+    from litestar_vite.inertia.plugin import ssr_socket_mounts
+
+    ssr_config = InertiaSSRConfig(url="unix:/tmp/x.sock", workers=2)
+    mounts = ssr_socket_mounts(ssr_config)
+    transports = list(mounts.values())
+
+    async with httpx.AsyncClient(mounts=mounts) as client:
+        resolved = [
+            client._transport_for_url(httpx.URL(url))  # pyright: ignore[reportPrivateUsage]
+            for url in ssr_config.worker_urls
+        ]
+
+    assert ssr_config.worker_sockets == ["/tmp/x.sock.0", "/tmp/x.sock.1"]
+    assert resolved[0] is transports[0]
+    assert resolved[1] is transports[1]
+
+
+def test_ssr_config_rejects_conflicting_unix_addresses() -> None:
+    from litestar_vite.config import InertiaSSRConfig
+
+    with pytest.raises(ValueError, match="socket path"):
+        InertiaSSRConfig(url="unix:")
+    with pytest.raises(ValueError, match="different sockets"):
+        InertiaSSRConfig(url="unix:/run/a.sock", unix_socket="/run/b.sock")
+
+
+def _hybrid_ssr_client(tmp_path: Path, ssr_config: Any, handler: Any) -> Any:
+    from litestar_vite.config import PathConfig, RuntimeConfig, SPAConfig
+
+    resource_dir = tmp_path / "resources"
+    resource_dir.mkdir()
+    (resource_dir / "index.html").write_text(
+        '<!DOCTYPE html><html><head></head><body><div id="app"></div></body></html>'
+    )
+    inertia_config = InertiaConfig(root_template="index.html", ssr=ssr_config)
+    vite_plugin = VitePlugin(
+        config=ViteConfig(
+            mode="hybrid",
+            paths=PathConfig(resource_dir=resource_dir),
+            runtime=RuntimeConfig(dev_mode=False),
+            spa=SPAConfig(app_selector="#app"),
+            inertia=inertia_config,
+        )
+    )
+    return create_test_client(
+        route_handlers=[handler],
+        plugins=[InertiaPlugin(config=inertia_config), vite_plugin],
+        middleware=[ServerSideSessionConfig().middleware],
+        stores={"sessions": MemoryStore()},
+    )
+
+
+def test_ssr_failure_falls_back_to_client_side_rendering(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from litestar_vite.config import InertiaSSRConfig
+
+    monkeypatch.delenv("VITE_DEV_MODE", raising=False)
+
+    @get("/", component="Home")
+    async def handler() -> dict[str, Any]:
+        return {"message": "Hello"}
+
+    with patch(
+        "litestar_vite.inertia.response._do_ssr_request",
+        new_callable=AsyncMock,
+        side_effect=ImproperlyConfiguredException("SSR server down"),
+    ) as ssr_request:
+        with _hybrid_ssr_client(
+            tmp_path, InertiaSSRConfig(fallback_to_csr=True, circuit_breaker=True), handler
+        ) as client:
+            responses = [client.get("/") for _ in range(12)]
+
+    for response in responses:
+        assert response.status_code == 200
+        assert '"component":"Home"' in response.text
+        assert "Hello" in response.text
+    # The breaker opens after its minimum of 10 failed calls; later requests skip the SSR server.
+    assert ssr_request.await_count == 10
+
+
+def test_ssr_latency_budget_falls_back_to_client_side_rendering(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from litestar_vite.config import InertiaSSRConfig
+
+    monkeypatch.delenv("VITE_DEV_MODE", raising=False)
+
+    async def slow_render(*_args: Any, **_kwargs: Any) -> _InertiaSSRResult:
+        await asyncio.sleep(5)
+        return _InertiaSSRResult(head=[], body='<div id="app">late</div>')
+
+    @get("/", component="Home")
+    async def handler() -> dict[str, Any]:
+        return {"message": "Hello"}
+
+    with patch("litestar_vite.inertia.response._do_ssr_request", side_effect=slow_render):
+        with _hybrid_ssr_client(
+            tmp_path, InertiaSSRConfig(fallback_to_csr=True, latency_budget=0.05), handler
+        ) as client:
+            response = client.get("/")
+
+    assert response.status_code == 200
+    assert "late" not in response.text
+    assert '"component":"Home"' in response.text
+
+
+async def test_open_ssr_stream_streams_html_and_parses_json() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["accept"].startswith("text/html")
+        if request.url.path == "/stream":
+            return httpx.Response(200, headers={"content-type": "text/html"}, content=b'<div id="app">hi</div>')
+        return httpx.Response(200, json={"head": [], "body": "<div>json</div>"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        stream = await _open_ssr_stream(b"{}", "http://ssr/stream", 1.0, client)
+        assert isinstance(stream, _SSRStream)
+        chunks = [chunk async for chunk in stream.iter_bytes()]
+        await stream.aclose()
+
+        result = await _open_ssr_stream(b"{}", "http://ssr/render", 1.0, client)
+
+    assert b"".join(chunks) == b'<div id="app">hi</div>'
+    assert result == _InertiaSSRResult(head=[], body="<div>json</div>")
+
+
+async def test_open_ssr_stream_closes_response_when_cancelled() -> None:
+    class SlowStream(httpx.AsyncByteStream):
+        closed = False
+
+        async def __aiter__(self) -> AsyncGenerator[bytes, None]:
+            await asyncio.sleep(10)
+            yield b"{}"
+
+        async def aclose(self) -> None:
+            await asyncio.sleep(0)
+            self.closed = True
+
+    stream = SlowStream()
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": "application/json"}, stream=stream)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with anyio.move_on_after(0.05) as scope:
+            await _open_ssr_stream(b"{}", "http://ssr/render", 1.0, client)
+
+    assert scope.cancelled_caught
+    assert stream.closed
+
+
+async def test_ssr_stream_holds_pool_worker_and_breaker_until_closed() -> None:
+    from litestar_vite.config import InertiaSSRCircuitBreakerConfig
+    from litestar_vite.inertia.ssr_breaker import SSRCircuitBreaker
+    from litestar_vite.inertia.ssr_pool import SSRWorkerPool
+
+    async def body() -> AsyncGenerator[bytes, None]:
+        yield b'<div id="app"><h1>'
+        raise httpx.ReadError("connection reset")
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": "text/html"}, content=body())
+
+    pool = SSRWorkerPool(["http://ssr/render"], eject_after=1)
+    breaker = SSRCircuitBreaker(InertiaSSRCircuitBreakerConfig(window_size=1, minimum_calls=1))
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        stream = await _open_inertia_ssr_stream(
+            {"component": "Home"}, "http://unused", 1.0, client, pool=pool, breaker=breaker
+        )
+        assert isinstance(stream, _SSRStream)
+        assert pool.workers[0].outstanding == 1
+        with pytest.raises(httpx.ReadError):
+            _ = [chunk async for chunk in stream.iter_bytes()]
+        assert breaker.state == "closed"
+        await stream.aclose()
+
+    assert pool.workers[0].outstanding == 0
+    assert pool.workers[0].failures == 1
+    assert breaker.state == "open"
+
+
+def test_ssr_streaming_sends_shell_around_streamed_body(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from litestar_vite.config import InertiaSSRConfig
+
+    monkeypatch.delenv("VITE_DEV_MODE", raising=False)
+    pages: list[dict[str, Any]] = []
+
+    async def body() -> AsyncGenerator[bytes, None]:
+        yield b'<div id="app"><h1>'
+        yield b"Hello</h1></div>"
+
+    async def open_stream(page: bytes, url: str, *_args: Any) -> _SSRStream:
+        pages.append(json.loads(page))
+        response = httpx.Response(200, headers={"content-type": "text/html"}, content=body())
+        return _SSRStream(response, url, None)
+
+    @get("/", component="Home")
+    async def handler() -> dict[str, Any]:
+        return {"message": "Hello"}
+
+    with patch("litestar_vite.inertia.response._open_ssr_stream", side_effect=open_stream):
+        with _hybrid_ssr_client(tmp_path, InertiaSSRConfig(streaming=True), handler) as client:
+            response = client.get("/")
+
+    assert response.status_code == 200
+    assert response.text == '<!DOCTYPE html><html><head></head><body><div id="app"><h1>Hello</h1></div></body></html>'
+    assert pages[0]["component"] == "Home"
+
+
+def test_ssr_stream_not_opened_for_replaced_response(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from litestar_vite.config import InertiaSSRConfig
+
+    monkeypatch.delenv("VITE_DEV_MODE", raising=False)
+
+    async def replace(_response: Response[Any]) -> Response[Any]:
+        return Response("replaced")
+
+    @get("/", component="Home", after_request=replace)
+    async def handler() -> dict[str, Any]:
+        return {"message": "Hello"}
+
+    with patch("litestar_vite.inertia.response._open_ssr_stream", new_callable=AsyncMock) as open_stream:
+        with _hybrid_ssr_client(tmp_path, InertiaSSRConfig(streaming=True), handler) as client:
+            response = client.get("/")
+
+    assert response.text == "replaced"
+    open_stream.assert_not_awaited()
+
+
 # ===== SSR Response Size Validation =====
 
 
@@ -3373,3 +3870,55 @@ def test_deferred_props_initial_response_still_advertises_all_keys() -> None:
         assert "b" not in body["props"]
         assert body["deferredProps"]["default"] == ["a"]
         assert body["deferredProps"]["other"] == ["b"]
+
+
+async def test_html_response_sends_preload_link_header(tmp_path: Path) -> None:
+    from litestar_vite.config import PathConfig, RuntimeConfig, SPAConfig
+
+    resource_dir = tmp_path / "resources"
+    resource_dir.mkdir()
+    (resource_dir / "index.html").write_text(
+        '<!DOCTYPE html><html><head></head><body><div id="app"></div></body></html>'
+    )
+    bundle_dir = tmp_path / "public"
+    bundle_dir.mkdir()
+    (bundle_dir / "manifest.json").write_text(
+        '{"resources/main.ts": {"file": "assets/main.js", "isEntry": true, "css": ["assets/main.css"]}}'
+    )
+    inertia_config = InertiaConfig(root_template="index.html")
+    vite_plugin = VitePlugin(
+        config=ViteConfig(
+            mode="hybrid",
+            paths=PathConfig(root=tmp_path, resource_dir=resource_dir, bundle_dir=bundle_dir),
+            runtime=RuntimeConfig(dev_mode=False, preload_headers=True),
+            spa=SPAConfig(app_selector="#app"),
+            inertia=inertia_config,
+        )
+    )
+
+    @get("/", component="Home", response_headers={"Link": "<https://cdn.example.com>; rel=preconnect"})
+    async def handler() -> dict[str, Any]:
+        return {"message": "Hello"}
+
+    with create_test_client(
+        route_handlers=[handler],
+        plugins=[InertiaPlugin(config=inertia_config), vite_plugin],
+        middleware=[ServerSideSessionConfig().middleware],
+        stores={"sessions": MemoryStore()},
+    ) as client:
+        html_response = client.get("/")
+        json_response = client.get(
+            "/",
+            headers={
+                InertiaHeaders.ENABLED.value: "true",
+                InertiaHeaders.VERSION.value: vite_plugin.asset_loader.version_id,
+            },
+        )
+
+    assert html_response.status_code == 200
+    assert html_response.headers["link"] == (
+        "<https://cdn.example.com>; rel=preconnect, "
+        "</static/assets/main.css>; rel=preload; as=style, </static/assets/main.js>; rel=modulepreload"
+    )
+    assert json_response.status_code == 200
+    assert "modulepreload" not in json_response.headers.get("link", "")
@@ -0,0 +1,70 @@
+from unittest.mock import patch
+
+from litestar_vite.config import InertiaSSRCircuitBreakerConfig
+from litestar_vite.inertia.ssr_breaker import SSRCircuitBreaker
+
+
+def _breaker(**kwargs: object) -> SSRCircuitBreaker:
+    options: dict[str, object] = {"window_size": 4, "minimum_calls": 4, "open_seconds": 10.0, **kwargs}
+    return SSRCircuitBreaker(InertiaSSRCircuitBreakerConfig(**options))  # type: ignore[arg-type]
+
+
+def test_opens_once_failure_rate_reached() -> None:
+    breaker = _breaker()
+    for success in (True, False, True):
+        assert breaker.allow()
+        breaker.record(success=success, duration=0.01)
+    assert breaker.state == "closed"
+
+    breaker.record(success=False, duration=0.01)
+
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+def test_slow_renders_count_as_failures() -> None:
+    breaker = _breaker(slow_call_seconds=0.5)
+    for _ in range(4):
+        breaker.record(success=True, duration=1.0)
+
+    assert breaker.state == "open"
+
+
+def test_half_open_probe_closes_or_reopens() -> None:
+    breaker = _breaker(minimum_calls=1, window_size=1)
+
+    with patch("litestar_vite.inertia.ssr_breaker.time.monotonic", return_value=100.0):
+        breaker.record(success=False, duration=0.01)
+    assert breaker.state == "open"
+
+    with patch("litestar_vite.inertia.ssr_breaker.time.monotonic", return_value=111.0):
+        assert breaker.allow()
+        assert breaker.state == "half_open"
+        assert not breaker.allow()
+        breaker.record(success=False, duration=0.01)
+    assert breaker.state == "open"
+
+    with patch("litestar_vite.inertia.ssr_breaker.time.monotonic", return_value=122.0):
+        assert breaker.allow()
+        breaker.record(success=True, duration=0.01)
+    assert breaker.state == "closed"
+    assert breaker.allow()
+
+
+def test_renders_admitted_before_half_open_are_not_probes() -> None:
+    breaker = _breaker(minimum_calls=1, window_size=1)
+
+    with patch("litestar_vite.inertia.ssr_breaker.time.monotonic", return_value=100.0):
+        stale = breaker.allow()
+        breaker.record(success=False, duration=0.01, token=breaker.allow())
+    assert breaker.state == "open"
+
+    with patch("litestar_vite.inertia.ssr_breaker.time.monotonic", return_value=111.0):
+        probe = breaker.allow()
+        assert breaker.state == "half_open"
+        breaker.record(success=True, duration=0.01, token=stale)
+        assert breaker.state == "half_open"
+        assert not breaker.allow()
+
+        breaker.record(success=True, duration=0.01, token=probe)
+    assert breaker.state == "closed"
@@ -0,0 +1,52 @@
+from unittest.mock import patch
+
+from litestar_vite.plugin._pool import SSRWorkerPool
+
+
+def test_acquire_prefers_least_outstanding_worker() -> None:
+    pool = SSRWorkerPool(["http://a", "http://b", "http://c"])
+
+    first = pool.acquire()
+    second = pool.acquire()
+    third = pool.acquire()
+    assert {first.url, second.url, third.url} == {"http://a", "http://b", "http://c"}
+
+    pool.release(second)
+    assert pool.acquire() is second
+    assert [worker.outstanding for worker in pool.workers] == [1, 1, 1]
+
+
+def test_failing_worker_is_ejected_then_readmitted() -> None:
+    pool = SSRWorkerPool(["http://a", "http://b"], eject_after=2, eject_seconds=10.0)
+    bad, good = pool.workers
+
+    with patch("litestar_vite.plugin._pool.time.monotonic", return_value=100.0):
+        for _ in range(2):
+            bad.outstanding += 1
+            pool.release(bad, healthy=False)
+        assert not bad.is_available(100.0)
+        assert [pool.acquire() for _ in range(3)] == [good, good, good]
+
+    with patch("litestar_vite.plugin._pool.time.monotonic", return_value=111.0):
+        assert pool.acquire() is bad
+        pool.release(bad)
+
+    assert bad.failures == 0
+    assert bad.is_available(0.0)
+
+
+def test_all_ejected_workers_still_receive_renders() -> None:
+    pool = SSRWorkerPool(["http://a"], eject_after=1)
+    worker = pool.acquire()
+    pool.release(worker, healthy=False)
+
+    assert pool.acquire() is worker
+
+
+def test_round_robin_takes_available_workers_in_turn() -> None:
+    pool = SSRWorkerPool(["http://a", "http://b", "http://c"], balance="round_robin")
+    first = pool.acquire()
+    pool.acquire()
+
+    pool.release(first)
+    assert [pool.acquire().url for _ in range(4)] == ["http://c", "http://a", "http://b", "http://c"]
@@ -33,6 +33,36 @@ def test_asset_loader_manifest_property_exposes_parsed_dict(tmp_path: Path) -> N
     assert loader.manifest == {"main.js": {"file": "assets/main.123456.js"}}
 
 
+def test_asset_loader_hashed_files_lists_manifest_outputs(tmp_path: Path) -> None:
+    bundle_dir = tmp_path / "public"
+    bundle_dir.mkdir()
+    manifest = {
+        "main.ts": {
+            "file": "assets/main-Bx1aZ9qK.js",
+            "css": ["assets/main-C3d4_e5F.css"],
+            "assets": ["assets/logo-e5f6G-7h.svg", "assets/logo.svg"],
+        },
+        "_shared.js": {"file": "assets/shared-g7h8i9j0.js"},
+        "admin.ts": {"file": "assets/admin-settings.js", "css": ["assets/admin.css"]},
+        "_react.js": {"file": "assets/lib-react18.js"},
+        "chart.ts": {"file": "assets/vendor-chart2d3.js", "name": "vendor-chart2d3"},
+        "beta.ts": {"file": "assets/app-v2beta1.js", "css": ["assets/main.2024Q1.css"]},
+        "dash.ts": {"file": "assets/dash-Ab12Cd34.js", "name": "dash"},
+    }
+    (bundle_dir / "manifest.json").write_text(json.dumps(manifest))
+
+    config = ViteConfig(paths=PathConfig(bundle_dir=bundle_dir), runtime=RuntimeConfig(dev_mode=False))
+    loader = ViteAssetLoader.initialize_loader(config=config)
+
+    assert loader.hashed_files == {
+        "assets/main-Bx1aZ9qK.js",
+        "assets/main-C3d4_e5F.css",
+        "assets/logo-e5f6G-7h.svg",
+        "assets/shared-g7h8i9j0.js",
+        "assets/dash-Ab12Cd34.js",
+    }
+
+
 def test_parse_manifest_when_file_exists_in_vite_dir(tmp_path: Path) -> None:
     bundle_dir = tmp_path / "public"
     (bundle_dir / ".vite").mkdir(parents=True)
@@ -353,3 +383,214 @@ def test_vite_server_url_ignores_bridge_when_appurl_null(tmp_path: Path, monkeyp
 
     assert url.startswith("http://hot:5006"), url
     read_bridge_config.cache_clear()
+
+
+# ===== Rendered asset tag index =====
+
+
+def test_asset_tag_index_built_on_parse_manifest(tmp_path: Path) -> None:
+    bundle_dir = tmp_path / "public"
+    bundle_dir.mkdir()
+    (bundle_dir / "manifest.json").write_text(
+        json.dumps({
+            "main.js": {"file": "assets/main.js", "isEntry": True, "imports": ["_vendor.js"]},
+            "_vendor.js": {"file": "assets/vendor.js"},
+        })
+    )
+    config = ViteConfig(
+        paths=PathConfig(bundle_dir=bundle_dir, asset_url="/static/"), runtime=RuntimeConfig(dev_mode=False)
+    )
+    loader = ViteAssetLoader.initialize_loader(config)
+
+    assert ("main.js", (("type", "module"), ("async", ""), ("defer", "")), False) in loader._asset_tag_index
+    assert loader.generate_asset_tags("main.js") == (
+        '<script type="module" async="" defer="" src="/static/assets/vendor.js"></script>'
+        '<script type="module" async="" defer="" src="/static/assets/main.js"></script>'
+    )
+
+
+def test_asset_tag_index_memoizes_scripts_attrs_variants() -> None:
+    config = ViteConfig(paths=PathConfig(asset_url="/static/"), runtime=RuntimeConfig(dev_mode=False))
+    loader = ViteAssetLoader(config)
+    loader._manifest = {"main.js": {"file": "assets/main.js"}}
+
+    first = loader.generate_asset_tags("main.js", scripts_attrs={"type": "module"})
+    loader._manifest["main.js"]["file"] = "assets/changed.js"
+    second = loader.generate_asset_tags("main.js", scripts_attrs={"type": "module"})
+
+    assert first == second == '<script type="module" src="/static/assets/main.js"></script>'
+    assert "assets/changed.js" in loader.generate_asset_tags("main.js")
+
+
+def test_asset_tag_index_invalidated_when_manifest_changes(tmp_path: Path) -> None:
+    bundle_dir = tmp_path / "public"
+    bundle_dir.mkdir()
+    manifest = bundle_dir / "manifest.json"
+    manifest.write_text('{"main.js": {"file": "assets/main.111.js", "isEntry": true}}')
+    config = ViteConfig(
+        paths=PathConfig(bundle_dir=bundle_dir, asset_url="/static/"), runtime=RuntimeConfig(dev_mode=False)
+    )
+    loader = ViteAssetLoader.initialize_loader(config)
+    first_version = loader.version_id
+    assert "main.111.js" in loader.generate_asset_tags("main.js")
+
+    manifest.write_text('{"main.js": {"file": "assets/main.222.js", "isEntry": true}}')
+    loader.parse_manifest()
+
+    assert loader.version_id != first_version
+    assert "main.222.js" in loader.generate_asset_tags("main.js")
+
+
+def test_generate_asset_tags_deduplicates_shared_chunks() -> None:
+    config = ViteConfig(paths=PathConfig(asset_url="/static/"), runtime=RuntimeConfig(dev_mode=False))
+    loader = ViteAssetLoader(config)
+    loader._manifest = {
+        "main.js": {"file": "assets/main.js", "imports": ["_a.js", "_b.js"]},
+        "_a.js": {"file": "assets/a.js", "imports": ["_shared.js"], "css": ["assets/shared.css"]},
+        "_b.js": {"file": "assets/b.js", "imports": ["_shared.js"], "css": ["assets/shared.css"]},
+        "_shared.js": {"file": "assets/shared.js", "imports": ["_a.js"]},
+    }
+
+    tags = loader.generate_asset_tags("main.js")
+
+    assert tags.count("assets/shared.js") == 1
+    assert tags.count("assets/shared.css") == 1
+    assert tags.index("assets/shared.js") < tags.index("assets/main.js")
+
+
+# ===== Import graph =====
+
+
+def _graph_loader(**runtime: object) -> ViteAssetLoader:
+    config = ViteConfig(paths=PathConfig(asset_url="/static/"), runtime=RuntimeConfig(dev_mode=False, **runtime))  # type: ignore[arg-type]
+    loader = ViteAssetLoader(config)
+    loader._manifest = {
+        "main.js": {
+            "file": "assets/main.js",
+            "isEntry": True,
+            "imports": ["_ui.js", "_data.js"],
+            "css": ["assets/main.css"],
+        },
+        "admin.js": {"file": "assets/admin.js", "isEntry": True, "imports": ["_ui.js"]},
+        "_ui.js": {"file": "assets/ui.js", "imports": ["_vendor.js"], "css": ["assets/ui.css"]},
+        "_data.js": {"file": "assets/data.js", "imports": ["_vendor.js"]},
+        "_vendor.js": {"file": "assets/vendor.js", "css": ["assets/vendor.css"]},
+    }
+    return loader
+
+
+def test_import_closure_is_topologically_ordered() -> None:
+    loader = _graph_loader()
+
+    assert loader._import_closure("main.js") == ("_vendor.js", "_ui.js", "_data.js", "main.js")
+
+
+def test_import_closure_handles_cycles() -> None:
+    loader = _graph_loader()
+    loader._manifest["_vendor.js"]["imports"] = ["_ui.js"]
+
+    assert loader._import_closure("main.js") == ("_vendor.js", "_ui.js", "_data.js", "main.js")
+
+
+def test_import_closure_missing_import_raises() -> None:
+    loader = _graph_loader()
+    loader._manifest["_data.js"]["imports"] = ["_gone.js"]
+
+    with pytest.raises(ImproperlyConfiguredException):
+        loader.generate_asset_tags("main.js")
+
+
+def test_generate_asset_tags_emits_diamond_import_once() -> None:
+    tags = _graph_loader().generate_asset_tags("main.js")
+
+    assert tags == (
+        '<link rel="stylesheet" href="/static/assets/vendor.css" />'
+        '<link rel="stylesheet" href="/static/assets/ui.css" />'
+        '<link rel="stylesheet" href="/static/assets/main.css" />'
+        '<script type="module" async="" defer="" src="/static/assets/vendor.js"></script>'
+        '<script type="module" async="" defer="" src="/static/assets/ui.js"></script>'
+        '<script type="module" async="" defer="" src="/static/assets/data.js"></script>'
+        '<script type="module" async="" defer="" src="/static/assets/main.js"></script>'
+    )
+
+
+def test_generate_asset_tags_deduplicates_across_entries() -> None:
+    tags = _graph_loader().generate_asset_tags(["main.js", "admin.js"])
+
+    assert tags.count("assets/vendor.js") == 1
+    assert tags.count("assets/ui.css") == 1
+    assert tags.endswith('<script type="module" async="" defer="" src="/static/assets/admin.js"></script>')
+
+
+def test_generate_asset_tags_skips_already_emitted_tags() -> None:
+    loader = _graph_loader()
+    emitted: set[str] = set()
+
+    first = loader.generate_asset_tags("main.js", emitted=emitted)
+    second = loader.generate_asset_tags("admin.js", emitted=emitted)
+
+    assert "assets/ui.js" in first
+    assert second == '<script type="module" async="" defer="" src="/static/assets/admin.js"></script>'
+
+
+def test_generate_asset_tags_modulepreload() -> None:
+    tags = _graph_loader().generate_asset_tags("admin.js", modulepreload=True)
+
+    assert tags == (
+        '<link rel="stylesheet" href="/static/assets/vendor.css" />'
+        '<link rel="stylesheet" href="/static/assets/ui.css" />'
+        '<link rel="modulepreload" href="/static/assets/vendor.js" />'
+        '<link rel="modulepreload" href="/static/assets/ui.js" />'
+        '<script type="module" async="" defer="" src="/static/assets/admin.js"></script>'
+    )
+
+
+def test_generate_asset_tags_modulepreload_from_runtime_config() -> None:
+    tags = _graph_loader(modulepreload=True).generate_asset_tags("admin.js")
+
+    assert '<link rel="modulepreload" href="/static/assets/ui.js" />' in tags
+    assert '<script type="module" async="" defer="" src="/static/assets/ui.js"></script>' not in tags
+
+
+# ===== Preload links =====
+
+
+def test_preload_links_from_manifest_entries() -> None:
+    loader = _graph_loader()
+    loader._manifest["_vendor.js"]["assets"] = ["assets/inter.woff2", "assets/logo.png"]
+
+    links = loader.preload_links(["admin.js"])
+
+    assert links == (
+        "</static/assets/vendor.css>; rel=preload; as=style",
+        "</static/assets/ui.css>; rel=preload; as=style",
+        "</static/assets/vendor.js>; rel=modulepreload",
+        "</static/assets/ui.js>; rel=modulepreload",
+        "</static/assets/admin.js>; rel=modulepreload",
+        "</static/assets/inter.woff2>; rel=preload; as=font; type=font/woff2; crossorigin",
+    )
+    assert loader.preload_link_header(["admin.js"]) == ", ".join(links)
+
+
+def test_preload_links_default_to_all_entries_once() -> None:
+    links = _graph_loader().preload_links()
+
+    assert links.count("</static/assets/vendor.js>; rel=modulepreload") == 1
+    assert "</static/assets/main.js>; rel=modulepreload" in links
+    assert "</static/assets/admin.js>; rel=modulepreload" in links
+
+
+def test_preload_links_use_runtime_preload_entries() -> None:
+    links = _graph_loader(preload_entries=("admin.js",)).preload_links()
+
+    assert "</static/assets/admin.js>; rel=modulepreload" in links
+    assert "</static/assets/main.js>; rel=modulepreload" not in links
+
+
+def test_preload_links_empty_in_hot_dev_mode(tmp_path: Path) -> None:
+    config = ViteConfig(paths=PathConfig(bundle_dir=tmp_path), runtime=RuntimeConfig(dev_mode=True))
+    loader = ViteAssetLoader(config)
+    loader._manifest = {"main.js": {"file": "assets/main.js", "isEntry": True}}
+
+    assert loader.preload_links() == ()
+    assert loader.preload_link_header() == ""
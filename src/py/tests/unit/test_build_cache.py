@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import pytest
+
+from litestar_vite.build_cache import BuildCache
+from litestar_vite.config import BuildCacheConfig, PathConfig, TypeGenConfig, ViteConfig
+
+
+def _make_config(tmp_path: Path) -> ViteConfig:
+    (tmp_path / "src" / "generated").mkdir(parents=True)
+    (tmp_path / "src" / "main.ts").write_text("console.log('hi')")
+    (tmp_path / "package.json").write_text("{}")
+    (tmp_path / "dist").mkdir()
+    return ViteConfig(
+        paths=PathConfig(root=tmp_path, resource_dir="src", bundle_dir="dist"),
+        types=TypeGenConfig(output=Path("src/generated")),
+    )
+
+
+def test_build_cache_key_tracks_inputs_only(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    config = _make_config(tmp_path)
+    cache = BuildCache(config, BuildCacheConfig(), tmp_path)
+    key = cache.key(["npm", "run", "build"])
+
+    (tmp_path / "dist" / "app.js").write_text("built")
+    (tmp_path / "src" / "generated" / ".litestar-types.fingerprint").write_text("volatile")
+    (tmp_path / "src" / "node_modules").mkdir()
+    (tmp_path / "src" / "node_modules" / "dep.js").write_text("ignored")
+    assert cache.key(["npm", "run", "build"]) == key
+
+    assert cache.key(["npm", "run", "build:prod"]) != key
+    monkeypatch.setenv("VITE_API_URL", "https://api.example.com")
+    assert cache.key(["npm", "run", "build"]) != key
+    monkeypatch.delenv("VITE_API_URL")
+    (tmp_path / "src" / "generated" / "routes.ts").write_text("export {}")
+    assert cache.key(["npm", "run", "build"]) != key
+
+
+def test_build_cache_round_trips_and_prunes_local_archives(tmp_path: Path) -> None:
+    config = _make_config(tmp_path)
+    (tmp_path / "dist" / ".vite").mkdir()
+    (tmp_path / "dist" / ".vite" / "manifest.json").write_text("{}")
+    (tmp_path / "dist" / "app.js").write_text("built")
+    (tmp_path / "dist" / "hot").write_text("http://localhost:5173")
+    cache = BuildCache(config, BuildCacheConfig(max_entries=2), tmp_path)
+
+    assert not cache.restore("first")
+    for key in ("first", "second", "third"):
+        assert cache.store(key)
+    (tmp_path / "dist" / "app.js").unlink()
+    (tmp_path / "dist" / "orphan-Dx9.js").write_text("stale")
+
+    assert not cache.restore("first")
+    assert cache.restore("third")
+    assert (tmp_path / "dist" / "app.js").read_text() == "built"
+    assert (tmp_path / "dist" / ".vite" / "manifest.json").exists()
+    assert not (tmp_path / "dist" / "hot").exists()
+    assert not (tmp_path / "dist" / "orphan-Dx9.js").exists()
+    assert not any(path.name.startswith(".dist") for path in tmp_path.iterdir())
+    assert len(list((tmp_path / "node_modules" / ".cache" / "litestar-vite").iterdir())) == 2
+
+
+def test_build_cache_uses_fsspec_storage_backend(tmp_path: Path) -> None:
+    pytest.importorskip("fsspec")
+    config = _make_config(tmp_path)
+    (tmp_path / "dist" / "app.js").write_text("built")
+    cache = BuildCache(config, BuildCacheConfig(storage_backend="memory://build-cache"), tmp_path)
+
+    assert cache.store("abc")
+    (tmp_path / "dist" / "app.js").unlink()
+
+    assert cache.restore("abc")
+    assert (tmp_path / "dist" / "app.js").read_text() == "built"
+    assert not (tmp_path / "node_modules").exists()
+
+
+def test_build_cache_config_validates_max_entries() -> None:
+    with pytest.raises(ValueError, match="max_entries"):
+        BuildCacheConfig(max_entries=0)
@@ -25,6 +25,7 @@ from litestar_vite.cli import (
     _print_recommended_config,
     _prompt_for_options,
     _resolve_js_cli,
+    _run_codegen_commands,
     _run_extra_commands,
     _run_vite_build,
     _select_framework_template,
@@ -39,7 +40,15 @@ from litestar_vite.cli import (
     vite_status,
     vite_update,
 )
-from litestar_vite.config import DeployConfig, ExternalDevServer, PathConfig, RuntimeConfig, TypeGenConfig, ViteConfig
+from litestar_vite.config import (
+    BuildCacheConfig,
+    DeployConfig,
+    ExternalDevServer,
+    PathConfig,
+    RuntimeConfig,
+    TypeGenConfig,
+    ViteConfig,
+)
 from litestar_vite.exceptions import ViteExecutionError
 from litestar_vite.executor import JSExecutor
 from litestar_vite.plugin import VitePlugin
@@ -311,6 +320,47 @@ def test_cli_run_vite_build_executes(tmp_path: Path) -> None:
     assert fake_executor.executes
 
 
+def test_cli_run_vite_build_precompresses_bundle(tmp_path: Path) -> None:
+    app = _make_app(tmp_path, types=False)
+    config = app.plugins.get(VitePlugin).config
+    config._executor_instance = FakeExecutor()
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "public" / "app.js").write_text("console.log('hello');\n" * 200)
+
+    with patch("litestar_vite.cli.set_environment"):
+        _run_vite_build(config, tmp_path, Mock(), no_build=False, app=app)
+
+    assert (tmp_path / "public" / "app.js.gz").exists()
+
+
+def test_cli_vite_build_restores_cached_build(tmp_path: Path) -> None:
+    class BundleExecutor(FakeExecutor):
+        def execute(self, args: list[str], cwd: Path) -> None:
+            super().execute(args, cwd)
+            (cwd / "public" / "app.js").write_text("built")
+
+    app = _make_app(tmp_path, types=False)
+    config = app.plugins.get(VitePlugin).config
+    config.build_cache = BuildCacheConfig(directory=tmp_path / ".build-cache")
+    fake_executor = BundleExecutor()
+    config._executor_instance = fake_executor
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "src" / "main.ts").write_text("console.log('hi')")
+
+    with patch("litestar_vite.cli.set_environment"):
+        _unwrap_command(vite_build)(app, verbose=False, quiet=False)
+        (tmp_path / "public" / "app.js").unlink()
+        _unwrap_command(vite_build)(app, verbose=False, quiet=False)
+        assert len(fake_executor.executes) == 1
+        assert (tmp_path / "public" / "app.js").read_text() == "built"
+
+        _unwrap_command(vite_build)(app, verbose=False, quiet=False, no_cache=True)
+        (tmp_path / "src" / "main.ts").write_text("console.log('changed')")
+        _unwrap_command(vite_build)(app, verbose=False, quiet=False)
+
+    assert len(fake_executor.executes) == 3
+
+
 def test_cli_prepare_and_build_writes_bridge_before_extra_commands(tmp_path: Path) -> None:
     app = _make_app(tmp_path, types=True)
     config = app.plugins.get(VitePlugin).config
@@ -350,6 +400,60 @@ def test_cli_run_vite_build_skips_js_build_typegen_after_cli_typegen(tmp_path: P
     assert "LITESTAR_VITE_SKIP_BUILD_TYPEGEN" not in os.environ
 
 
+def test_cli_run_vite_build_reports_stage_timings(tmp_path: Path) -> None:
+    app = _make_app(tmp_path, types=True)
+    config = app.plugins.get(VitePlugin).config
+    config._executor_instance = FakeExecutor()
+    (tmp_path / "node_modules").mkdir()
+    console = Mock()
+
+    with (
+        patch("litestar_vite.cli._generate_schema_and_routes", return_value=True),
+        patch("litestar_vite.cli._invoke_typegen_cli"),
+        patch("litestar_vite.cli.set_environment"),
+    ):
+        _run_vite_build(config, tmp_path, console, no_build=False, app=app)
+
+    report = next(call.args[0] for call in console.print.call_args_list if "Stage timings" in call.args[0])
+    assert [stage.split()[0] for stage in report.split(": ", 1)[1].split(", ")] == [
+        "export",
+        "typegen",
+        "build",
+        "precompress",
+    ]
+
+
+def test_cli_run_codegen_commands_overlaps_extra_commands_with_typegen(tmp_path: Path) -> None:
+    import threading
+
+    config = ViteConfig(
+        paths=PathConfig(root=tmp_path),
+        types=TypeGenConfig(extra_commands=[["tsr", "generate"]], parallel_commands=True),
+    )
+    typegen_started = threading.Event()
+    timings: dict[str, float] = {}
+
+    def extra_commands(config_arg: ViteConfig, verbose: bool) -> bool:
+        del config_arg, verbose
+        return typegen_started.wait(5)
+
+    with (
+        patch("litestar_vite.cli._run_extra_commands", side_effect=extra_commands),
+        patch("litestar_vite.cli._invoke_typegen_cli", side_effect=lambda *_: typegen_started.set()),
+    ):
+        assert _run_codegen_commands(config, False, timings) is True
+
+    assert set(timings) == {"extra commands", "typegen"}
+
+    config.types.parallel_commands = False  # type: ignore[union-attr]
+    typegen_started.clear()
+    with (
+        patch("litestar_vite.cli._run_extra_commands", side_effect=lambda *_: typegen_started.is_set()),
+        patch("litestar_vite.cli._invoke_typegen_cli", side_effect=lambda *_: typegen_started.set()),
+    ):
+        assert _run_codegen_commands(config, False, timings) is False
+
+
 def test_cli_run_vite_build_failure(tmp_path: Path) -> None:
     app = _make_app(tmp_path)
     config = app.plugins.get(VitePlugin).config
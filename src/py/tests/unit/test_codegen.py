@@ -80,6 +80,91 @@ def test_export_integration_assets_extracts_route_metadata_once(tmp_path: Path)
     extract.assert_called_once()
 
 
+def test_extract_route_metadata_reuses_openapi_parameters() -> None:
+    from litestar_vite.codegen import _routes as routes_module
+
+    @get("/users/{user_id:int}")
+    async def user(user_id: FromPath[int], q: FromQuery[str | None] = None) -> dict[str, int]:
+        return {"user_id": user_id}
+
+    @get("/hidden/{item_id:int}", include_in_schema=False)
+    async def hidden(item_id: FromPath[int], limit: FromQuery[int] = 10) -> dict[str, int]:
+        return {"item_id": item_id}
+
+    app = Litestar(route_handlers=[user, hidden])
+    real_extract = routes_module.extract_params_from_litestar
+
+    with patch("litestar_vite.codegen._routes.extract_params_from_litestar", wraps=real_extract) as extract:
+        metadata = {route.name: route for route in extract_route_metadata(app)}
+
+    extracted = {call.args[0].handler_name for call in extract.call_args_list}
+    assert "hidden" in extracted
+    assert "user" not in extracted
+    assert metadata["user"].params == {"user_id": "number"}
+    assert metadata["user"].query_params == {"q": "string | undefined"}
+    assert metadata["hidden"].params == {"item_id": "number"}
+    assert metadata["hidden"].query_params == {"limit": "number | undefined"}
+
+
+def test_export_integration_assets_skips_unchanged_app_on_request(tmp_path: Path) -> None:
+    from litestar_vite.codegen import export_integration_assets
+
+    @get("/users/{user_id:int}")
+    async def handler(user_id: FromPath[int]) -> dict[str, int]:
+        return {"user_id": user_id}
+
+    @get("/teams")
+    async def teams() -> list[str]:
+        return []
+
+    output = tmp_path / "generated"
+    config = ViteConfig(paths=PathConfig(root=tmp_path), types=TypeGenConfig(output=output, generate_routes=True))
+
+    first = export_integration_assets(Litestar(route_handlers=[handler]), config, skip_if_unchanged=True)
+    again = export_integration_assets(Litestar(route_handlers=[handler]), config, skip_if_unchanged=True)
+    forced = export_integration_assets(Litestar(route_handlers=[handler]), config)
+    changed = export_integration_assets(Litestar(route_handlers=[handler, teams]), config, skip_if_unchanged=True)
+    changed_routes = (output / "routes.ts").read_text()
+    (output / "routes.ts").unlink()
+    missing = export_integration_assets(Litestar(route_handlers=[handler, teams]), config, skip_if_unchanged=True)
+
+    assert not first.skipped
+    assert (output / ".litestar-types.fingerprint").is_file()
+    assert again.skipped
+    assert again.exported_files == again.unchanged_files == []
+    assert not forced.skipped
+    assert not changed.skipped
+    assert "/teams" in changed_routes
+    assert not missing.skipped
+    assert (output / "routes.ts").is_file()
+
+
+def test_background_export_debounces_and_reports_errors(tmp_path: Path) -> None:
+    from litestar_vite.codegen import BackgroundExport
+
+    app = Litestar(route_handlers=[])
+    config = ViteConfig(paths=PathConfig(root=tmp_path), types=TypeGenConfig(output=tmp_path / "generated"))
+    errors: list[Exception] = []
+
+    with patch("litestar_vite.codegen._export.export_integration_assets") as export:
+        background = BackgroundExport(app, config, delay=0.05, on_error=errors.append)
+        for _ in range(3):
+            background.schedule()
+        assert background.wait(5)
+        export.assert_called_once_with(app, config, skip_if_unchanged=True)
+
+        export.side_effect = ValueError("boom")
+        background.schedule()
+        assert background.wait(5)
+        assert [str(exc) for exc in errors] == ["boom"]
+
+        pending = BackgroundExport(app, config, delay=10)
+        pending.schedule()
+        pending.close()
+        assert pending.wait(0)
+        assert export.call_count == 2
+
+
 def testts_type_for_param_optional_handling() -> None:
     """Test TypeScript type mapping handles optional markers."""
     assert ts_type_for_param("string | undefined") == "string | undefined"
@@ -13,7 +13,7 @@ from litestar_vite.config import (
     TypeGenConfig,
     ViteConfig,
 )
-from litestar_vite.config._inertia import InertiaConfig, InertiaSSRConfig
+from litestar_vite.config._inertia import InertiaConfig, InertiaSSRCircuitBreakerConfig, InertiaSSRConfig
 from litestar_vite.config._runtime import _cached_resolve_proxy_mode
 from litestar_vite.executor import BunExecutor, NodeenvExecutor, NodeExecutor
 
@@ -857,6 +857,17 @@ def test_validate_mode_rejects_zero_ssr_timeout() -> None:
         config.validate_mode()
 
 
+def test_validate_mode_rejects_breaker_minimum_calls_above_window() -> None:
+    breaker = InertiaSSRCircuitBreakerConfig(window_size=5, minimum_calls=6)
+    config = ViteConfig(
+        mode="hybrid",
+        inertia=InertiaConfig(ssr=InertiaSSRConfig(circuit_breaker=breaker)),
+        runtime=RuntimeConfig(dev_mode=True),
+    )
+    with pytest.raises(ValueError, match="minimum_calls must not exceed window_size"):
+        config.validate_mode()
+
+
 def test_validate_mode_rejects_page_props_without_inertia() -> None:
     config = ViteConfig(types=TypeGenConfig(generate_page_props=True))
     with pytest.raises(ValueError, match="generate_page_props=True requires Inertia"):
@@ -1,7 +1,7 @@
 """Tests for SPA mode handler."""
 
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
@@ -192,6 +192,37 @@ async def test_spa_handler_initialization(spa_config: ViteConfig) -> None:
     assert "Test SPA" in handler._cached_html
 
 
+def test_spa_handler_compiles_index_template_once(spa_config: ViteConfig) -> None:
+    """The cached index.html is split into a template once and reused for every render."""
+    handler = AppHandler(spa_config)
+    handler.initialize_sync()
+    template = handler._html_template
+
+    assert template is not None
+    assert template.html is handler._cached_html
+
+    first = handler.get_html_sync(page_data={"component": "Home"}, csrf_token="token-1")
+    second = handler.get_html_sync(page_data={"component": "About"}, csrf_token="token-2")
+
+    assert handler._html_template is template
+    assert 'window.__LITESTAR_CSRF__ = "token-1";' in first
+    assert "&quot;About&quot;" in second
+    assert "token-1" not in second
+
+
+def test_spa_handler_html_bytes_match_html(spa_config: ViteConfig) -> None:
+    """Pre-encoded page JSON renders the same document as the str path."""
+    from litestar.serialization import encode_json
+
+    handler = AppHandler(spa_config)
+    handler.initialize_sync()
+    page_data = {"component": "Home", "props": {"title": "Café </script>"}}
+
+    html_bytes = handler.get_html_bytes_sync(page_json=encode_json(page_data), csrf_token="token")
+
+    assert html_bytes == handler.get_html_sync(page_data=page_data, csrf_token="token").encode()
+
+
 async def test_spa_handler_production_mode(spa_config: ViteConfig) -> None:
     """Test SPA handler serves cached HTML in production."""
     handler = AppHandler(spa_config)
@@ -1534,3 +1565,91 @@ async def test_spa_handler_no_cache_when_spa_config_disabled(
 
     # With spa=False, cache_duration defaults to 0 (no caching)
     assert not hasattr(route, "cache") or route.cache is None or route.cache == 0
+
+
+def _write_preload_project(tmp_path: Path) -> "tuple[Path, Path]":
+    resource_dir = tmp_path / "resources"
+    resource_dir.mkdir()
+    (resource_dir / "index.html").write_text(
+        '<!DOCTYPE html><html><head></head><body><div id="app"></div></body></html>'
+    )
+    bundle_dir = tmp_path / "public"
+    bundle_dir.mkdir()
+    (bundle_dir / "manifest.json").write_text(
+        '{"resources/main.ts": {"file": "assets/main.js", "isEntry": true, "css": ["assets/main.css"]}}'
+    )
+    return resource_dir, bundle_dir
+
+
+async def _call_asgi(app: Litestar, path: str, *, extensions: "dict[str, Any]") -> "list[dict[str, Any]]":
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+        "extensions": extensions,
+    }
+    messages: list[dict[str, Any]] = []
+
+    async def receive() -> "dict[str, Any]":
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: "dict[str, Any]") -> None:
+        messages.append(message)
+
+    await app(scope, receive, send)  # type: ignore[arg-type]
+    return messages
+
+
+async def test_spa_handler_prod_sends_preload_link_header(tmp_path: Path) -> None:
+    from litestar_vite.config import PathConfig, RuntimeConfig
+    from litestar_vite.plugin import VitePlugin
+
+    resource_dir, bundle_dir = _write_preload_project(tmp_path)
+    config = ViteConfig(
+        mode="spa",
+        paths=PathConfig(root=tmp_path, resource_dir=resource_dir, bundle_dir=bundle_dir),
+        runtime=RuntimeConfig(dev_mode=False, preload_headers=True),
+    )
+    app = Litestar(plugins=[VitePlugin(config=config)])
+
+    async with AsyncTestClient(app=app) as client:
+        response = await client.get("/")
+
+    assert response.status_code == 200
+    assert response.headers["link"] == (
+        "</static/assets/main.css>; rel=preload; as=style, </static/assets/main.js>; rel=modulepreload"
+    )
+
+
+async def test_spa_handler_prod_sends_early_hints_when_supported(tmp_path: Path) -> None:
+    from litestar_vite.config import PathConfig, RuntimeConfig
+    from litestar_vite.plugin import VitePlugin
+
+    resource_dir, bundle_dir = _write_preload_project(tmp_path)
+    config = ViteConfig(
+        mode="spa",
+        paths=PathConfig(root=tmp_path, resource_dir=resource_dir, bundle_dir=bundle_dir),
+        runtime=RuntimeConfig(dev_mode=False, early_hints=True),
+    )
+    app = Litestar(plugins=[VitePlugin(config=config)])
+
+    async with AsyncTestClient(app=app):
+        unsupported = await _call_asgi(app, "/", extensions={})
+        supported = await _call_asgi(app, "/", extensions={"http.response.early_hint": {}})
+
+    assert unsupported[0]["type"] == "http.response.start"
+    assert supported[0] == {
+        "type": "http.response.early_hint",
+        "links": [b"</static/assets/main.css>; rel=preload; as=style", b"</static/assets/main.js>; rel=modulepreload"],
+    }
+    assert supported[1]["type"] == "http.response.start"
+    assert all(name != b"link" for name, _ in supported[1]["headers"])
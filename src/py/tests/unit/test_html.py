@@ -3,8 +3,10 @@
 import pytest
 
 from litestar_vite.html_transform import (
+    HtmlTemplate,
     _escape_attr,
     _escape_script,
+    inject_head_html,
     inject_head_script,
     inject_page_script,
     inject_vite_dev_scripts,
@@ -540,3 +542,91 @@ def test_set_data_attribute_allows_valid_selectors() -> None:
 
     result2 = set_data_attribute(html, "div", "data-page", "hello")
     assert 'data-page="hello"' in result2
+
+
+# ===== Compiled HTML Template =====
+
+_TEMPLATE_DOCUMENTS = [
+    '<!DOCTYPE html><html><head><title>T</title></head><body><div id="app"></div></body></html>',
+    '<html><head></head><body><div class="x" id="app" data-page="stale">old</div></body></html>',
+    '<html><body><div id="app" ></div></body></html>',
+    '<div id="app"></div>',
+    "<html><head></head><body><main></main></body></html>",
+    '<html><head><title>Café ☕</title></head><body><p>naïve</p><div id="app">ü</div></body></html>',
+]
+
+
+@pytest.mark.parametrize("html", _TEMPLATE_DOCUMENTS)
+@pytest.mark.parametrize("use_script_element", [False, True])
+def test_html_template_matches_chained_transforms(html: str, use_script_element: bool) -> None:
+    page_data = '{"component":"Home","props":{"html":"</script><b>&"}}'
+    expected = inject_head_script(html, 'window.__CSRF__ = "tok";', escape=False, nonce="n1")
+    if use_script_element:
+        expected = inject_page_script(expected, page_data, app_id="app", nonce="n1")
+    else:
+        expected = set_data_attribute(expected, "#app", "data-page", page_data)
+
+    template = HtmlTemplate(html, "#app")
+    rendered = template.render(
+        head_script='window.__CSRF__ = "tok";',
+        escape=False,
+        nonce="n1",
+        page_data=page_data,
+        use_script_element=use_script_element,
+    )
+
+    assert rendered == expected
+    assert template.render() == html
+    assert (
+        template.render_bytes(
+            head_script='window.__CSRF__ = "tok";',
+            escape=False,
+            nonce="n1",
+            page_data=page_data.encode(),
+            use_script_element=use_script_element,
+        )
+        == expected.encode()
+    )
+
+
+@pytest.mark.parametrize("html", _TEMPLATE_DOCUMENTS)
+def test_html_template_matches_chained_ssr_transforms(html: str) -> None:
+    expected = inject_head_script(html, "window.x = 1;")
+    expected = replace_element_outer_html(expected, "#app", '<div id="app">SSR</div>')
+    expected = inject_head_html(expected, "<title>SSR</title>")
+
+    rendered = HtmlTemplate(html).render(
+        head_script="window.x = 1;", ssr_body='<div id="app">SSR</div>', ssr_head="<title>SSR</title>"
+    )
+
+    assert rendered == expected
+    assert (
+        HtmlTemplate(html).render_bytes(
+            head_script="window.x = 1;", ssr_body='<div id="app">SSR</div>', ssr_head="<title>SSR</title>"
+        )
+        == expected.encode()
+    )
+
+
+def test_html_template_sets_page_data_on_ssr_body() -> None:
+    html = '<html><head></head><body><div id="app" data-page="stale"></div></body></html>'
+    ssr_body = '<div id="app"><h1>SSR</h1></div>'
+    expected = replace_element_outer_html(html, "#app", set_data_attribute(ssr_body, "#app", "data-page", '{"a":1}'))
+
+    template = HtmlTemplate(html)
+
+    assert template.render(page_data='{"a":1}', ssr_body=ssr_body) == expected
+    assert template.render_bytes(page_data=b'{"a":1}', ssr_body=ssr_body) == expected.encode()
+    assert expected.count("data-page") == 1
+    assert "<h1>SSR</h1>" in expected
+
+
+def test_html_template_element_selector() -> None:
+    html = "<html><body><main class='a'></main></body></html>"
+
+    assert HtmlTemplate(html, "main").render(page_data="{}") == set_data_attribute(html, "main", "data-page", "{}")
+
+
+def test_html_template_rejects_invalid_selector() -> None:
+    with pytest.raises(ValueError, match="Invalid selector"):
+        HtmlTemplate("<div></div>", "div[x]")
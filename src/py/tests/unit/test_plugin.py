@@ -311,7 +311,7 @@ def test_vite_plugin_get_static_server_config_keeps_litestar_static_router(tmp_p
     app_config = AppConfig()
 
     assert plugin.get_static_server_config().placement is StaticPlacement.NATIVE
-    with patch("litestar_vite.plugin._core.create_static_files_router") as create_router:
+    with patch("litestar_vite.plugin._core.create_vite_static_files_router") as create_router:
         plugin.on_app_init(app_config)
 
     create_router.assert_called_once()
@@ -323,7 +323,7 @@ def test_vite_plugin_static_files_config_ignores_none_overrides() -> None:
     plugin = VitePlugin(static_files_config=static_config)
     app_config = AppConfig()
 
-    with patch("litestar_vite.plugin._core.create_static_files_router") as create_router:
+    with patch("litestar_vite.plugin._core.create_vite_static_files_router") as create_router:
         plugin._configure_static_files(app_config)
 
     kwargs = create_router.call_args.kwargs
@@ -668,6 +668,28 @@ def test_vite_plugin_export_types_sync_skips_when_no_typegen_outputs_requested(t
     export.assert_not_called()
 
 
+def test_vite_plugin_server_lifespan_exports_types_in_background(tmp_path: Path) -> None:
+    config = ViteConfig(
+        paths=PathConfig(root=tmp_path),
+        runtime=RuntimeConfig(dev_mode=False, set_environment=False),
+        types=TypeGenConfig(output=tmp_path / "generated", background_export=True, background_export_delay=0.1),
+    )
+    plugin = VitePlugin(config=config)
+    app = Litestar(route_handlers=[])
+
+    with (
+        patch("litestar_vite.codegen.BackgroundExport") as background,
+        patch("litestar_vite.codegen.export_integration_assets") as export_sync,
+    ):
+        with plugin.server_lifespan(app):
+            background.return_value.schedule.assert_called_once_with()
+            background.return_value.close.assert_not_called()
+
+    background.assert_called_once_with(app, plugin._config, delay=0.1, on_error=plugin._warn_type_export_failed)
+    background.return_value.close.assert_called_once_with()
+    export_sync.assert_not_called()
+
+
 @patch("litestar_vite.plugin._core.set_environment")
 def test_vite_plugin_lifespan_with_environment_setup(mock_set_env: Mock) -> None:
     """Test server lifespan with environment variable setup."""
@@ -2224,6 +2246,23 @@ async def test_vite_plugin_proxy_client_created_in_dev_mode_with_ssr_proxy() ->
     assert plugin.proxy_client is None
 
 
+async def test_vite_plugin_production_framework_proxy_replaces_spa_handler(tmp_path: Path) -> None:
+    """Production framework mode with ``framework_proxy`` forwards to the SSR servers."""
+    config = ViteConfig(
+        mode="framework",
+        paths=PathConfig(root=tmp_path, bundle_dir=tmp_path),
+        runtime=RuntimeConfig(dev_mode=False, framework_proxy=["http://127.0.0.1:3000", "http://127.0.0.1:3001"]),
+    )
+    plugin = VitePlugin(config=config)
+    app = Litestar(route_handlers=[], plugins=[plugin])
+
+    assert app.get_handler_index_by_name("ssr_proxy_http") is not None
+    assert plugin.spa_handler is None
+
+    async with plugin.lifespan(app):
+        assert plugin.proxy_client is not None
+
+
 async def test_vite_plugin_proxy_client_none_in_production_mode() -> None:
     """Test that proxy_client remains None in production mode."""
     config = ViteConfig(runtime=RuntimeConfig(dev_mode=False), mode="spa")
@@ -13,14 +13,17 @@ from typing_extensions import Self
 from litestar_vite.plugin import VitePlugin
 from litestar_vite.plugin._proxy import (
     SSRProxyMiddleware,
+    UpstreamProxy,
     ViteProxyMiddleware,
     _extract_proxy_response_headers,
+    _filter_raw_request_headers,
     _proxy_stream_response,
     _stream_request_body,
     build_hmr_target_url,
     build_proxy_url,
     check_http2_support,
     create_hmr_target_getter,
+    create_ssr_http_proxy_handler,
     create_ssr_ws_proxy_handler,
     create_target_url_getter,
     create_vite_hmr_handler,
@@ -1051,3 +1054,106 @@ def test_create_hmr_target_getter_uses_hotfile_when_sibling_missing(
 
     assert getter() == "https://framework-dev-server:4321"
     read_bridge_config.cache_clear()
+
+
+def test_filter_raw_request_headers_drops_hop_by_hop_headers() -> None:
+    headers = [(b"host", b"example.com"), (b"content-length", b"3"), (b"x-token", b"1"), (b"te", b"trailers")]
+
+    assert _filter_raw_request_headers(headers) == [(b"host", b"example.com"), (b"x-token", b"1")]
+    assert _filter_raw_request_headers([*headers, (b"connection", b"x-token")]) == [(b"host", b"example.com")]
+
+
+async def test_upstream_proxy_reuses_one_fallback_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    from litestar import Litestar
+
+    from litestar_vite.config import RuntimeConfig, ViteConfig
+    from litestar_vite.plugin import _proxy as proxy_module
+
+    seen: list[str] = []
+
+    def responder(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(200, text="ok")
+
+    class MockAsyncClient(httpx.AsyncClient):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            kwargs["transport"] = httpx.MockTransport(responder)
+            kwargs.pop("http2", None)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(proxy_module.httpx, "AsyncClient", MockAsyncClient)
+    plugin = VitePlugin(config=ViteConfig(runtime=RuntimeConfig(dev_mode=False)))
+    plugin._asset_loader = Mock(initialize=AsyncMock())  # pyright: ignore[reportPrivateUsage]
+    upstream = UpstreamProxy(plugin=plugin)
+    client = upstream.client
+
+    for path in ("/a", "/b"):
+        async with upstream.stream("GET", f"http://upstream{path}", [], None) as response:
+            assert await response.aread() == b"ok"
+
+    assert upstream.client is client
+    assert seen == ["/a", "/b"]
+    # The plugin lifespan closes fallback clients created while it was not running.
+    async with plugin.lifespan(Litestar()):
+        pass
+    assert client.is_closed
+
+
+def test_upstream_proxy_prefers_plugin_client() -> None:
+    shared = httpx.AsyncClient()
+    upstream = UpstreamProxy(plugin=cast("VitePlugin", SimpleNamespace(proxy_client=shared)))
+
+    assert upstream.client is shared
+
+
+def test_ssr_http_proxy_handler_retries_idempotent_requests_on_next_upstream() -> None:
+    from litestar.testing import create_test_client  # pyright: ignore[reportUnknownVariableType]
+
+    from litestar_vite.plugin._pool import SSRWorkerPool
+
+    def responder(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "down":
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, text=f"{request.method} {request.url.path}")
+
+    pool = SSRWorkerPool(["http://down:3000", "http://up:3000"], balance="round_robin")
+    client = httpx.AsyncClient(transport=httpx.MockTransport(responder))
+    handler = create_ssr_http_proxy_handler(
+        plugin=cast("VitePlugin", SimpleNamespace(proxy_client=client)), upstreams=pool, retries=1
+    )
+
+    with create_test_client(route_handlers=[handler]) as test_client:
+        retried = test_client.get("/about")
+        not_retried = test_client.post("/form", content=b"x")
+
+    down, up = pool.workers
+    assert retried.status_code == 200
+    assert retried.text == "GET /about"
+    assert not_retried.status_code == 503
+    assert down.failures == 2
+    assert down.outstanding == up.outstanding == 0
+
+
+async def test_ssr_http_proxy_handler_releases_worker_on_unexpected_errors() -> None:
+    from litestar.testing import RequestFactory
+
+    from litestar_vite.plugin._pool import SSRWorkerPool
+
+    def responder(request: httpx.Request) -> httpx.Response:
+        raise RuntimeError("transport bug")
+
+    pool = SSRWorkerPool(["http://a:3000"])
+    client = httpx.AsyncClient(transport=httpx.MockTransport(responder))
+    handler = create_ssr_http_proxy_handler(
+        plugin=cast("VitePlugin", SimpleNamespace(proxy_client=client)), upstreams=pool
+    )
+    request = RequestFactory().get("/about")
+
+    app = await handler.fn(request)
+    # A response that is never sent holds no worker.
+    assert pool.workers[0].outstanding == 0
+    with pytest.raises(RuntimeError, match="transport bug"):
+        await app(request.scope, request.receive, AsyncMock())
+
+    assert pool.workers[0].outstanding == 0
+    assert pool.workers[0].failures == 0
@@ -491,3 +491,18 @@ def test_resolve_proxy_mode_unset_returns_none(monkeypatch: pytest.MonkeyPatch)
     _cached_resolve_proxy_mode.cache_clear()
 
     assert resolve_proxy_mode() is None
+
+
+def test_runtime_config_framework_proxy_normalizes_targets() -> None:
+    from litestar_vite.config import FrameworkProxyConfig
+
+    config = RuntimeConfig(framework_proxy=["http://127.0.0.1:3000/", "http://127.0.0.1:3001"])
+
+    assert config.framework_proxy == FrameworkProxyConfig(targets=("http://127.0.0.1:3000", "http://127.0.0.1:3001"))
+    assert RuntimeConfig(framework_proxy="http://ssr:3000").framework_proxy == FrameworkProxyConfig(
+        targets=("http://ssr:3000",)
+    )
+    with pytest.raises(ValueError, match="at least one target"):
+        FrameworkProxyConfig(targets=[])
+    with pytest.raises(ValueError, match="balance"):
+        FrameworkProxyConfig(targets="http://ssr:3000", balance="random")  # type: ignore[arg-type]
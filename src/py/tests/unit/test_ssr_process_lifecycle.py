@@ -361,3 +361,89 @@ def test_resolved_ssr_config_returns_command_intact(tmp_path: Path, command: lis
     ssr = plugin._resolved_ssr_config()
     assert ssr is not None
     assert ssr.command == command
+
+
+def test_server_lifespan_starts_one_process_per_ssr_worker(tmp_path: Path) -> None:
+    """workers=N spawns N supervised processes, each told its port via INERTIA_SSR_PORT."""
+    plugin = _build_hybrid_plugin_with_ssr(tmp_path, command=["npm", "run", "start:ssr"], health_check=False)
+    ssr = plugin._resolved_ssr_config()
+    assert ssr is not None
+    ssr.workers = 3
+    app = Litestar(plugins=[plugin], middleware=[_SESSION])
+
+    processes = [MagicMock(name=f"ssr_process_{index}") for index in range(3)]
+    with patch.object(VitePlugin, "_get_ssr_process", side_effect=processes):
+        with plugin.server_lifespan(app):
+            for index, process in enumerate(processes):
+                process.start.assert_called_once_with(
+                    ["npm", "run", "start:ssr"], plugin.config.root_dir, env={"INERTIA_SSR_PORT": str(13714 + index)}
+                )
+                process.stop.assert_not_called()
+
+    for process in processes:
+        process.stop.assert_called_once()
+
+
+def test_server_lifespan_stops_started_ssr_workers_when_one_fails(tmp_path: Path) -> None:
+    """A worker that fails to start stops the workers already running."""
+    plugin = _build_hybrid_plugin_with_ssr(tmp_path, command=["npm", "run", "start:ssr"], health_check=False)
+    ssr = plugin._resolved_ssr_config()
+    assert ssr is not None
+    ssr.workers = 2
+    app = Litestar(plugins=[plugin], middleware=[_SESSION])
+
+    first, second = MagicMock(name="first"), MagicMock(name="second")
+    second.start.side_effect = ViteProcessError("boom")
+    with patch.object(VitePlugin, "_get_ssr_process", side_effect=[first, second]):
+        with pytest.raises(ViteProcessError):
+            with plugin.server_lifespan(app):
+                pass
+
+    first.stop.assert_called_once()
+    second.stop.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("http://127.0.0.1:13714/render", ["http://127.0.0.1:13714/render", "http://127.0.0.1:13715/render"]),
+        ("http://[::1]:9000/render", ["http://[::1]:9000/render", "http://[::1]:9001/render"]),
+    ],
+)
+def test_ssr_worker_urls_use_consecutive_ports(url: str, expected: list[str]) -> None:
+    assert InertiaSSRConfig(url=url, workers=2).worker_urls == expected
+    assert InertiaSSRConfig(url=url).worker_urls == [url]
+
+
+def test_server_lifespan_passes_unix_socket_to_ssr_process(tmp_path: Path) -> None:
+    """unix_socket is handed to the managed process and a stale socket file is removed."""
+    import socket
+
+    socket_path = tmp_path / "ssr.sock"
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(socket_path))
+    stale.close()
+
+    plugin = _build_hybrid_plugin_with_ssr(tmp_path, command=["npm", "run", "start:ssr"], health_check=False)
+    ssr = plugin._resolved_ssr_config()
+    assert ssr is not None
+    ssr.unix_socket = socket_path
+    app = Litestar(plugins=[plugin], middleware=[_SESSION])
+
+    fake_process = MagicMock(name="ssr_process")
+    with patch.object(VitePlugin, "_get_ssr_process", return_value=fake_process):
+        with plugin.server_lifespan(app):
+            fake_process.start.assert_called_once_with(
+                ["npm", "run", "start:ssr"], plugin.config.root_dir, env={"INERTIA_SSR_SOCKET": str(socket_path)}
+            )
+
+    assert not socket_path.exists()
+
+
+def test_ssr_worker_sockets_follow_workers() -> None:
+    assert InertiaSSRConfig().worker_sockets == []
+    assert InertiaSSRConfig(unix_socket="/run/ssr.sock").worker_sockets == ["/run/ssr.sock"]
+    assert InertiaSSRConfig(unix_socket="/run/ssr.sock", workers=2).worker_sockets == [
+        "/run/ssr.sock.0",
+        "/run/ssr.sock.1",
+    ]
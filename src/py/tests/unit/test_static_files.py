@@ -0,0 +1,220 @@
+import gzip
+from pathlib import Path
+
+import pytest
+from litestar.testing import create_test_client  # pyright: ignore[reportUnknownVariableType]
+
+from litestar_vite.plugin._static_files import (
+    StaticAssetCache,
+    accepted_encodings,
+    create_vite_static_files_router,
+    precompress_assets,
+)
+
+
+def test_accepted_encodings_orders_by_quality_then_preference() -> None:
+    encodings = ("br", "zstd", "gzip")
+
+    assert accepted_encodings("gzip, deflate, br", encodings) == ("br", "gzip")
+    assert accepted_encodings("br;q=0.5, gzip", encodings) == ("gzip", "br")
+    assert accepted_encodings("*;q=0.2, br;q=0", encodings) == ("zstd", "gzip")
+    assert accepted_encodings("identity", encodings) == ()
+
+
+def test_precompress_assets_writes_smaller_text_variants(tmp_path: Path) -> None:
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    script = assets / "app.js"
+    script.write_text("console.log('hello');\n" * 200)
+    (assets / "tiny.css").write_text("body{}")
+    (assets / "logo.png").write_bytes(b"\x89PNG" * 500)
+    stale = assets / "tiny.css.gz"
+    stale.write_bytes(b"stale")
+
+    written = precompress_assets(tmp_path, ["gzip"])
+
+    assert written == [assets / "app.js.gz"]
+    assert gzip.decompress((assets / "app.js.gz").read_bytes()) == script.read_bytes()
+    assert not stale.exists()
+    assert not (assets / "logo.png.gz").exists()
+
+
+def test_static_router_serves_negotiated_precompressed_sibling(tmp_path: Path) -> None:
+    (tmp_path / "app.js").write_text("console.log('hello');\n" * 200)
+    precompress_assets(tmp_path, ["gzip"])
+    router = create_vite_static_files_router("/static", [tmp_path], encodings=("br", "gzip"))
+
+    with create_test_client(route_handlers=[router]) as client:
+        compressed = client.get("/static/app.js", headers={"accept-encoding": "br, gzip"})
+        plain = client.get("/static/app.js", headers={"accept-encoding": "identity"})
+
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["content-type"].startswith("text/javascript")
+    assert compressed.headers["vary"] == "Accept-Encoding"
+    assert compressed.text == (tmp_path / "app.js").read_text()
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["vary"] == "Accept-Encoding"
+    assert plain.text == (tmp_path / "app.js").read_text()
+
+
+def test_static_router_keeps_html_mode_404_status_for_precompressed_page(tmp_path: Path) -> None:
+    (tmp_path / "404.html").write_text("<h1>Not found</h1>\n" * 200)
+    precompress_assets(tmp_path, ["gzip"])
+    router = create_vite_static_files_router(
+        "/static", [tmp_path], encodings=("gzip",), html_mode=True, hashed_files=frozenset
+    )
+
+    with create_test_client(route_handlers=[router]) as client:
+        response = client.get("/static/missing", headers={"accept-encoding": "gzip"})
+
+    assert response.status_code == 404
+    assert response.headers["content-encoding"] == "gzip"
+    assert "cache-control" not in response.headers
+    assert response.text == (tmp_path / "404.html").read_text()
+
+
+def test_plugin_serves_manifest_assets_precompressed_and_immutable(tmp_path: Path) -> None:
+    from litestar import Litestar, get
+    from litestar.config.compression import CompressionConfig
+    from litestar.testing import TestClient
+
+    from litestar_vite import PathConfig, RuntimeConfig, ViteConfig, VitePlugin
+
+    (tmp_path / "manifest.json").write_text('{"app.ts": {"file": "app-Bx1aZ9qK.js"}, "other.ts": {"file": "other.js"}}')
+    # Large enough that the compressed sibling is above the middleware's minimum size.
+    (tmp_path / "app-Bx1aZ9qK.js").write_text("".join(f"const v{i} = {i * 7919 % 10007};\n" for i in range(2000)))
+    precompress_assets(tmp_path, ["gzip"])
+    # Unhashed and written after precompression, like ``entryFileNames: "[name].js"`` with plain ``vite build``.
+    (tmp_path / "other.js").write_text("export const x = 1;\n" * 200)
+
+    @get("/api")
+    async def api() -> str:
+        return "x" * 2000
+
+    plugin = VitePlugin(
+        config=ViteConfig(
+            mode="template",
+            paths=PathConfig(root=tmp_path, bundle_dir=tmp_path, asset_url="/static/"),
+            runtime=RuntimeConfig(dev_mode=False),
+        )
+    )
+    app = Litestar(route_handlers=[api], plugins=[plugin], compression_config=CompressionConfig(backend="gzip"))
+
+    with TestClient(app) as client:
+        asset = client.get("/static/app-Bx1aZ9qK.js", headers={"accept-encoding": "gzip"})
+        other = client.get("/static/other.js", headers={"accept-encoding": "gzip"})
+        response = client.get("/api", headers={"accept-encoding": "gzip"})
+
+    assert asset.headers["content-encoding"] == "gzip"
+    assert asset.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert asset.text == (tmp_path / "app-Bx1aZ9qK.js").read_text()
+    assert other.headers["content-encoding"] == "gzip"
+    assert other.headers["cache-control"] != "public, max-age=31536000, immutable"
+    assert other.text == (tmp_path / "other.js").read_text()
+    assert response.headers["content-encoding"] == "gzip"
+
+
+def test_static_router_marks_hashed_files_immutable_and_revalidates_others(tmp_path: Path) -> None:
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    (assets / "main-Bx1aZ9qK.js").write_text("export {}")
+    (tmp_path / "robots.txt").write_text("User-agent: *")
+    router = create_vite_static_files_router(
+        "/static", [tmp_path], hashed_files=lambda: frozenset({"assets/main-Bx1aZ9qK.js"})
+    )
+
+    with create_test_client(route_handlers=[router]) as client:
+        hashed = client.get("/static/assets/main-Bx1aZ9qK.js")
+        hashed_again = client.get("/static/assets/main-Bx1aZ9qK.js", headers={"if-none-match": hashed.headers["etag"]})
+        plain = client.get("/static/robots.txt")
+        plain_again = client.get("/static/robots.txt", headers={"if-none-match": f"W/{plain.headers['etag']}"})
+        plain_since = client.get("/static/robots.txt", headers={"if-modified-since": plain.headers["last-modified"]})
+
+    assert hashed.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert not hashed.headers["etag"].startswith("W/")
+    assert hashed_again.status_code == 304
+    assert hashed_again.content == b""
+    assert hashed_again.headers["etag"] == hashed.headers["etag"]
+    assert plain.headers["cache-control"] == "no-cache"
+    assert plain.text == "User-agent: *"
+    assert plain_again.status_code == 304
+    assert plain_since.status_code == 304
+
+
+def test_static_router_serves_hashed_files_from_asset_cache(tmp_path: Path) -> None:
+    script = tmp_path / "app-Bx1aZ9qK.js"
+    script.write_text("console.log('hello');\n" * 200)
+    precompress_assets(tmp_path, ["gzip"])
+    cache = StaticAssetCache(tmp_path, 1024 * 1024, encodings=("gzip",))
+    router = create_vite_static_files_router(
+        "/static",
+        [tmp_path],
+        encodings=("gzip",),
+        hashed_files=lambda: frozenset({"app-Bx1aZ9qK.js"}),
+        asset_cache=cache,
+    )
+
+    with create_test_client(route_handlers=[router]) as client:
+        first = client.get("/static/app-Bx1aZ9qK.js", headers={"accept-encoding": "gzip"})
+        script.unlink()
+        (tmp_path / "app-Bx1aZ9qK.js.gz").unlink()
+        compressed = client.get("/static/app-Bx1aZ9qK.js", headers={"accept-encoding": "gzip"})
+        plain = client.get("/static/app-Bx1aZ9qK.js", headers={"accept-encoding": "identity"})
+        head = client.head("/static/app-Bx1aZ9qK.js", headers={"accept-encoding": "identity"})
+        revalidated = client.get("/static/app-Bx1aZ9qK.js", headers={"if-none-match": compressed.headers["etag"]})
+
+    assert "app-Bx1aZ9qK.js" in cache
+    assert compressed.headers == first.headers
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert compressed.text == "console.log('hello');\n" * 200
+    assert plain.headers["content-type"].startswith("text/javascript")
+    assert "content-encoding" not in plain.headers
+    assert plain.text == compressed.text
+    assert head.content == b""
+    assert head.headers["content-length"] == plain.headers["content-length"]
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+
+@pytest.mark.anyio
+async def test_asset_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    for name in ("a.js", "b.js", "c.js", "large.js"):
+        (tmp_path / name).write_bytes(b"x" * (400 if name != "large.js" else 2000))
+    cache = StaticAssetCache(tmp_path, 1000)
+
+    assert await cache.warm(["a.js", "b.js"]) == 2
+    assert cache.respond("a.js", {}, is_head_response=False) is not None
+    assert await cache.load("c.js")
+    assert not await cache.load("large.js")
+    assert not await cache.load("../outside.js")
+
+    assert "a.js" in cache
+    assert "b.js" not in cache
+    assert "c.js" in cache
+    assert cache.size == 800
+
+
+def test_plugin_warms_asset_cache_from_manifest(tmp_path: Path) -> None:
+    from litestar import Litestar
+    from litestar.testing import TestClient
+
+    from litestar_vite import PathConfig, RuntimeConfig, ViteConfig, VitePlugin
+
+    (tmp_path / "manifest.json").write_text('{"app.ts": {"file": "app-Bx1aZ9qK.js", "css": ["app-C3d4e5F6.css"]}}')
+    (tmp_path / "app-Bx1aZ9qK.js").write_text("export {}")
+    (tmp_path / "app-C3d4e5F6.css").write_text("body{}")
+    plugin = VitePlugin(
+        config=ViteConfig(
+            mode="template",
+            paths=PathConfig(root=tmp_path, bundle_dir=tmp_path, asset_url="/static/"),
+            runtime=RuntimeConfig(dev_mode=False, asset_cache_size=1024),
+        )
+    )
+
+    with TestClient(Litestar(plugins=[plugin])) as client:
+        (tmp_path / "app-Bx1aZ9qK.js").unlink()
+        response = client.get("/static/app-Bx1aZ9qK.js")
+
+    assert response.status_code == 200
+    assert response.text == "export {}"
@@ -239,6 +239,31 @@ def test_log_helpers_non_tty_uses_logging(monkeypatch: pytest.MonkeyPatch, caplo
     assert "fail_msg" in caplog.text
 
 
+@pytest.mark.parametrize(
+    "path", ["/", "//", "/api", "/api/", "/api/users", "/apix", "/ap", "/schema/swagger", "/users/{id}", "/users/1", ""]
+)
+def test_route_prefix_matcher_agrees_with_prefix_scan(path: str) -> None:
+    for prefixes in (("/users/{id}", "/schema", "/api"), ("/users/{id}", "/schema", "/api", "/")):
+        expected = any(path == prefix or path.startswith(f"{prefix}/") for prefix in prefixes)
+        assert utils.RoutePrefixMatcher(prefixes).matches(path) is expected
+
+
+def test_route_matcher_is_cached_on_plugin() -> None:
+    from litestar_vite.plugin import VitePlugin
+
+    @get("/api/items")
+    async def handler() -> dict[str, str]:
+        return {"ok": "yes"}
+
+    plugin = VitePlugin()
+    app = Litestar(route_handlers=[handler], plugins=[plugin])
+
+    assert utils.is_litestar_route("/api/items/1", app) is True
+    assert utils.is_litestar_route("/dashboard", app) is False
+    assert plugin.get_route_matcher(app) is plugin.get_route_matcher(app)
+    assert plugin.get_route_matcher(app).prefixes == plugin.get_route_prefixes(app)
+
+
 def test_route_prefix_cache_and_inertia_not_found(monkeypatch: pytest.MonkeyPatch) -> None:
     @get("/api/items")
     async def handler() -> dict[str, str]: